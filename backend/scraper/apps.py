@@ -1,66 +1,97 @@
 from __future__ import annotations
 
-import json
 import logging
-from pathlib import Path
+from threading import RLock
 
 from django.apps import AppConfig
 from django.conf import settings
 
+logger = logging.getLogger(__name__)
+
 
 class ScraperConfig(AppConfig):
+    """
+    App config exposing the scraper singletons.
+
+    ``MODEL_REGISTRY``, ``DATA_MANAGER`` and ``SCRAPER_MANAGER`` are built on
+    first access rather than in ``ready()``.  Their import chains pull in
+    torch/transformers and selenium/bs4, so processes that never run inference
+    or scraping (``migrate``, ``shell``, API workers delegating eval to the
+    LLM worker) start without loading them.
+    """
+
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'scraper'
 
+    def __init__(self, app_name, app_module):
+        super().__init__(app_name, app_module)
+        self._singletons: dict[str, object] = {}
+        self._singletons_lock = RLock()
+
     def ready(self):
-        logger = logging.getLogger(__name__)
-        logger.debug('Starting ScraperConfig.ready()...')
-
-        config_path = Path(settings.BASE_DIR) / 'scraper' / 'configs' / 'model_configs.json'
-        with open(config_path) as file:
-            model_configs = json.load(file)
-
-        # --- Model Registry (lazy-loads models on first use) ---
-        from .managers.model_registry import ModelRegistry
-
-        try:
-            logger.debug('Initializing MODEL_REGISTRY...')
-            self.MODEL_REGISTRY = ModelRegistry(model_configs)
-            logger.info(
-                'MODEL_REGISTRY initialized. Available: %s | Unavailable: %s',
-                self.MODEL_REGISTRY.available_models,
-                self.MODEL_REGISTRY.unavailable_models,
-            )
-        except Exception:
-            logger.exception('Failed to initialize MODEL_REGISTRY')
-            raise
-
-        # --- DataManager (uses the registry for model resolution) ---
+        # Register signal handlers (e.g. Config cache invalidation)
+        import scraper.signals  # noqa: F401
+
+    # ------------------------------------------------------------------
+    # Lazy singletons
+    # ------------------------------------------------------------------
+
+    def _get_or_create(self, name: str, factory):
+        instance = self._singletons.get(name)
+        if instance is not None:
+            return instance
+        with self._singletons_lock:
+            if name not in self._singletons:
+                logger.debug('Initializing %s...', name)
+                try:
+                    self._singletons[name] = factory()
+                except Exception:
+                    logger.exception('Failed to initialize %s', name)
+                    raise
+                logger.debug('%s initialized.', name)
+            return self._singletons[name]
+
+    @staticmethod
+    def _build_model_registry():
+        from .managers.model_registry import ModelRegistry, load_model_configs
+
+        registry = ModelRegistry(
+            load_model_configs(),
+            memory_budget_bytes=settings.MODEL_MEMORY_BUDGET_MB * 1024 * 1024,
+        )
+        logger.info(
+            'MODEL_REGISTRY initialized. Available: %s | Unavailable: %s',
+            registry.available_models,
+            registry.unavailable_models,
+        )
+        return registry
+
+    def _build_data_manager(self):
         from .managers.data_manager.data_manager import DataManager
 
-        try:
-            logger.debug('Initializing DATA_MANAGER...')
-            self.DATA_MANAGER = DataManager(
-                model_registry=self.MODEL_REGISTRY,
-                default_model_id=settings.DEFAULT_MODEL_ID,
-            )
-            logger.debug('DATA_MANAGER initialized.')
-        except Exception:
-            logger.exception('Failed to initialize DATA_MANAGER')
-            raise
-
-        # --- Scraper Manager ---
+        return DataManager(
+            model_registry=self.MODEL_REGISTRY,
+            default_model_id=settings.DEFAULT_MODEL_ID,
+        )
+
+    @staticmethod
+    def _build_scraper_manager():
         from .managers.ScraperManager import ScraperManager
 
-        try:
-            logger.debug('Initializing SCRAPER_MANAGER...')
-            self.SCRAPER_MANAGER = ScraperManager()
-            logger.debug('SCRAPER_MANAGER initialized.')
-        except Exception:
-            logger.exception('Failed to initialize SCRAPER_MANAGER')
-            raise
+        return ScraperManager()
 
-        logger.debug('ScraperConfig.ready() completed.')
+    def get_if_initialized(self, name: str):
+        """Return the singleton *name* if it has been built, else None (never builds it)."""
+        return self._singletons.get(name)
 
-        # Register signal handlers (e.g. Config cache invalidation)
-        import scraper.signals  # noqa: F401
+    @property
+    def MODEL_REGISTRY(self):
+        return self._get_or_create('MODEL_REGISTRY', self._build_model_registry)
+
+    @property
+    def DATA_MANAGER(self):
+        return self._get_or_create('DATA_MANAGER', self._build_data_manager)
+
+    @property
+    def SCRAPER_MANAGER(self):
+        return self._get_or_create('SCRAPER_MANAGER', self._build_scraper_manager)
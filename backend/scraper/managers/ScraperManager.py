@@ -91,7 +91,7 @@ class ScraperManager:
 
     def destroy_scraper(self, source):
         """
-        Fully shuts down the scraper including its browser session and removes it from the manager.
+        Fully shuts down the scraper including its browser sessions and removes it from the manager.
         Use this when a clean slate is needed (e.g. credential change).
         """
         with self.lock:
@@ -104,11 +104,8 @@ class ScraperManager:
             thread = scraper_data.get('thread')
             if thread:
                 thread.join(timeout=10)
-            if hasattr(scraper_instance, 'instance') and scraper_instance.instance:
-                try:
-                    scraper_instance.instance.quit()
-                except Exception:
-                    pass
+            if hasattr(scraper_instance, 'close_sessions'):
+                scraper_instance.close_sessions()
             del self.scrapers[source]
             self.logger.info('Scraper for source %s destroyed.', source)
 
@@ -3,6 +3,8 @@ from __future__ import annotations
 import re
 from abc import ABC, abstractmethod
 
+from stocknlp.stage_timer import timed
+
 
 class BasePreprocessor(ABC):
     """Template Method preprocessor.
@@ -19,11 +21,24 @@ class BasePreprocessor(ABC):
     # in order, before tokenization.
     pipeline: list[str] = []
 
+    @property
+    def input_key(self):
+        """Hashable identity of the tokenizer: preprocessors with equal keys
+        turn the same cleaned text into the same model input."""
+        return id(self)
+
     def preprocess(self, text: str, **kwargs):
         """Run the full pipeline: clean → tokenize."""
         cleaned = self.clean(text)
         return self.tokenize(cleaned, **kwargs)
 
+    def preprocess_batch(self, texts: list[str]):
+        """Clean every text, then tokenize them together into one model batch."""
+        with timed('clean', len(texts)):
+            cleaned = [self.clean(text) for text in texts]
+        with timed('tokenize', len(cleaned)):
+            return self.tokenize_batch(cleaned)
+
     def clean(self, text: str) -> str:
         """Execute every step listed in ``self.pipeline`` sequentially."""
         for step_name in self.pipeline:
@@ -40,6 +55,10 @@ class BasePreprocessor(ABC):
     def tokenize(self, text: str, **kwargs):
         """Convert cleaned text into model-specific input."""
 
+    @abstractmethod
+    def tokenize_batch(self, texts: list[str]):
+        """Convert cleaned texts into one collated, model-specific batch."""
+
     # ------------------------------------------------------------------
     # Shared cleaning steps — available to any subclass that lists them
     # ------------------------------------------------------------------
@@ -1,14 +1,24 @@
 from __future__ import annotations
 
-import json
+import contextvars
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 
 from django.apps import apps
 from django.conf import settings
 from django.db import DatabaseError, transaction
 
+from stocknlp.metrics import PREDICTION_FAILURES
+from stocknlp.stage_timer import timed
+
+from .vocab import CompactVocab, load_vocab
+
 logger = logging.getLogger(__name__)
 
+# ``PostPrediction.model_name`` of the combined row saved for an ensemble.
+ENSEMBLE_MODEL_NAME = 'ensemble'
+
 
 class DataManager:
     """
@@ -23,68 +33,294 @@ class DataManager:
     def __init__(self, model_registry, default_model_id: str):
         self.registry = model_registry
         self.default_model_id = default_model_id
-        self._ticker_to_index: dict | None = None
-
-    @staticmethod
-    def _load_json(path: str) -> dict:
-        with open(path, encoding='utf-8') as file:
-            return json.load(file)
+        self._ticker_to_index: CompactVocab | None = None
 
-    def _get_ticker_to_index(self) -> dict:
+    def _get_ticker_to_index(self) -> CompactVocab:
         if self._ticker_to_index is None:
-            self._ticker_to_index = self._load_json(settings.TICKER_TO_INDEX_PATH)
+            self._ticker_to_index = load_vocab(settings.TICKER_TO_INDEX_PATH)
         return self._ticker_to_index
 
+    @staticmethod
+    def _check_tweet(tweet_object: dict) -> None:
+        if 'text' not in tweet_object or 'ticker' not in tweet_object:
+            raise ValueError(
+                "tweet_object must contain 'text' and 'ticker' keys.",
+            )
+
     def eval_sentiment(
         self,
         tweet_object: dict,
         with_save: bool = False,
         model_id: str | None = None,
     ) -> dict:
-        if 'text' not in tweet_object or 'ticker' not in tweet_object:
-            raise ValueError(
-                "tweet_object must contain 'text' and 'ticker' keys.",
-            )
+        self._check_tweet(tweet_object)
 
         model_id = model_id or self.default_model_id
+        if self.registry.cascade_spec(model_id) is not None:
+            return self.eval_sentiment_batch([tweet_object], with_save, model_id)[0]
+
         model_manager, preprocessor, model_type = self.registry.get(model_id)
 
         tweet = tweet_object['text']
         ticker = tweet_object['ticker']
-        cleaned_text = preprocessor.clean(tweet)
-        processed_input = preprocessor.preprocess(tweet)
+        with timed('preprocess'):
+            cleaned_text = preprocessor.clean(tweet)
+            processed_input = preprocessor.preprocess(tweet)
+
+        prediction = self._predict_one(
+            model_id, model_manager, model_type, processed_input, ticker,
+        )
+
+        tweet_data = {
+            **tweet_object,
+            'cleaned_text': cleaned_text,
+            'prediction': prediction.get('predicted_sentiment'),
+            'predicted_probabilities': prediction.get('predicted_probabilities'),
+        }
 
+        if with_save:
+            with timed('save'):
+                self.process_and_save_post(tweet_data, model_manager, model_id=model_id)
+
+        return tweet_data
+
+    def _predict_one(
+        self,
+        model_id: str,
+        model_manager,
+        model_type: str,
+        processed_input,
+        ticker: str,
+    ) -> dict:
         try:
             if model_type == 'lstmcnn_model':
                 ticker_index = self._get_ticker_to_index().get(ticker, 0)
-                prediction = model_manager.predict(
-                    processed_input,
-                    [ticker_index],
-                )
-            elif model_type == 'transformer_model':
-                prediction = model_manager.predict(processed_input, None)
-            else:
-                raise ValueError(f'Unsupported model type: {model_type}')
+                with timed('forward'):
+                    return model_manager.predict(
+                        processed_input,
+                        [ticker_index],
+                    )
+            if model_type == 'transformer_model':
+                with timed('forward'):
+                    return model_manager.predict(processed_input, None)
+            raise ValueError(f'Unsupported model type: {model_type}')
         except Exception:
             logger.exception('Prediction failed for model %s', model_id)
-            prediction = {
+            PREDICTION_FAILURES.inc(model=model_id)
+            return {
                 'predicted_sentiment': 'unknown',
                 'predicted_probabilities': [],
             }
 
+    def eval_sentiment_ensemble(
+        self,
+        tweet_object: dict,
+        model_ids: list[str],
+        with_save: bool = False,
+    ) -> dict:
+        """Evaluate one tweet under several models, sharing preprocessing.
+
+        The text is cleaned once per distinct cleaning pipeline and tokenized
+        once per distinct tokenizer (``BasePreprocessor.input_key``), then the
+        models run concurrently.  Per-model results are returned under
+        ``models``; ``prediction``/``predicted_probabilities`` hold the mean
+        of the members' probabilities.  With ``with_save`` one ``Post`` is
+        stored with a prediction row per member model.
+        """
+        self._check_tweet(tweet_object)
+        model_ids = list(dict.fromkeys(model_ids))
+        if not model_ids:
+            raise ValueError('An ensemble needs at least one model ID.')
+        for model_id in model_ids:
+            if self.registry.cascade_spec(model_id) is not None:
+                raise ValueError(f"Cascade '{model_id}' cannot be part of an ensemble.")
+        members = {model_id: self.registry.get(model_id) for model_id in model_ids}
+
+        text = tweet_object['text']
+        ticker = tweet_object['ticker']
+        cleaned: dict[tuple, str] = {}
+        inputs: dict[tuple, object] = {}
+        member_inputs = {}
+        with timed('preprocess'):
+            for model_id, (_, preprocessor, _) in members.items():
+                pipeline = tuple(preprocessor.pipeline)
+                if pipeline not in cleaned:
+                    cleaned[pipeline] = preprocessor.clean(text)
+                input_key = (pipeline, preprocessor.input_key)
+                if input_key not in inputs:
+                    inputs[input_key] = preprocessor.tokenize(cleaned[pipeline])
+                member_inputs[model_id] = inputs[input_key]
+
+        def run(model_id: str) -> dict:
+            model_manager, _, model_type = members[model_id]
+            return self._predict_one(
+                model_id, model_manager, model_type, member_inputs[model_id], ticker,
+            )
+
+        # torch releases the GIL during forward passes, so threads overlap.
+        # Each call runs in a copy of this context so its spans reach the
+        # caller's trace.
+        workers = min(len(model_ids), os.cpu_count() or 1)
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='ensemble') as pool:
+                futures = [pool.submit(contextvars.copy_context().run, run, m) for m in model_ids]
+                predictions = {m: future.result() for m, future in zip(model_ids, futures)}
+        else:
+            predictions = {model_id: run(model_id) for model_id in model_ids}
+
+        answered = [
+            p['predicted_probabilities'] for p in predictions.values()
+            if p.get('predicted_probabilities')
+        ]
+        if answered:
+            combined = [sum(column) / len(answered) for column in zip(*answered)]
+            combined_label = max(range(len(combined)), key=combined.__getitem__)
+        else:
+            combined, combined_label = [], 'unknown'
+
         tweet_data = {
             **tweet_object,
-            'cleaned_text': cleaned_text,
-            'prediction': prediction.get('predicted_sentiment'),
-            'predicted_probabilities': prediction.get('predicted_probabilities'),
+            'cleaned_text': next(iter(cleaned.values())),
+            'prediction': combined_label,
+            'predicted_probabilities': combined,
+            'models': {
+                model_id: {
+                    'prediction': p.get('predicted_sentiment'),
+                    'predicted_probabilities': p.get('predicted_probabilities'),
+                }
+                for model_id, p in predictions.items()
+            },
         }
 
         if with_save:
-            self.process_and_save_post(tweet_data, model_manager)
+            with timed('save'):
+                self.process_and_save_post(tweet_data, member_predictions={
+                    model_id: {**member, 'model_name': members[model_id][0].get_model_name()}
+                    for model_id, member in tweet_data['models'].items()
+                })
 
         return tweet_data
 
-    def process_and_save_post(self, data: dict, model_manager=None):
+    def eval_sentiment_batch(
+        self,
+        tweet_objects: list[dict],
+        with_save: bool = False,
+        model_id: str | None = None,
+    ) -> list[dict]:
+        """Evaluate many tweets with one forward pass per model.
+
+        For a cascade model ID each stage only sees the tweets the previous
+        stages were not confident about (top probability below the cascade's
+        threshold, or a failed prediction), and every result records the
+        stage that answered in ``answered_by``.
+        """
+        for tweet_object in tweet_objects:
+            self._check_tweet(tweet_object)
+        if not tweet_objects:
+            return []
+
+        model_id = model_id or self.default_model_id
+        spec = self.registry.cascade_spec(model_id)
+        stages = spec.stages if spec is not None else (model_id,)
+
+        results: list[dict | None] = [None] * len(tweet_objects)
+        managers: list = [None] * len(tweet_objects)
+        answered_by: list[str | None] = [None] * len(tweet_objects)
+        pending = list(range(len(tweet_objects)))
+
+        for depth, stage_id in enumerate(stages):
+            is_last = depth == len(stages) - 1
+            model_manager, preprocessor, model_type = self.registry.get(stage_id)
+            stage_tweets = [tweet_objects[i] for i in pending]
+            # Cleaned once: the same text is tokenized and returned as cleaned_text.
+            with timed('clean', len(stage_tweets)):
+                cleaned = [preprocessor.clean(t['text']) for t in stage_tweets]
+            predictions = self._predict_batch(
+                stage_id, model_manager, preprocessor, model_type, stage_tweets, cleaned,
+            )
+
+            escalated = []
+            for i, cleaned_text, prediction in zip(pending, cleaned, predictions):
+                probabilities = prediction.get('predicted_probabilities') or []
+                # Only cascades have more than one stage, so spec is set here.
+                if not is_last and not (
+                    probabilities and max(probabilities) >= spec.confidence_threshold
+                ):
+                    escalated.append(i)
+                    continue
+                tweet_object = tweet_objects[i]
+                results[i] = {
+                    **tweet_object,
+                    'cleaned_text': cleaned_text,
+                    'prediction': prediction.get('predicted_sentiment'),
+                    'predicted_probabilities': probabilities,
+                }
+                if spec is not None:
+                    results[i]['answered_by'] = stage_id
+                managers[i] = model_manager
+                answered_by[i] = stage_id
+
+            if spec is not None:
+                logger.debug(
+                    'Cascade %s: %s answered %d/%d',
+                    model_id, stage_id, len(pending) - len(escalated), len(pending),
+                )
+            pending = escalated
+            if not pending:
+                break
+
+        if with_save:
+            with timed('save', len(results)):
+                for tweet_data, model_manager, stage_id in zip(results, managers, answered_by):
+                    self.process_and_save_post(tweet_data, model_manager, model_id=stage_id)
+
+        return results
+
+    def _predict_batch(
+        self,
+        model_id: str,
+        model_manager,
+        preprocessor,
+        model_type: str,
+        tweet_objects: list[dict],
+        cleaned: list[str],
+    ) -> list[dict]:
+        try:
+            with timed('tokenize', len(cleaned)):
+                processed_input = preprocessor.tokenize_batch(cleaned)
+            if model_type == 'lstmcnn_model':
+                ticker_to_index = self._get_ticker_to_index()
+                x_ticker = [ticker_to_index.get(t['ticker'], 0) for t in tweet_objects]
+            elif model_type == 'transformer_model':
+                x_ticker = None
+            else:
+                raise ValueError(f'Unsupported model type: {model_type}')
+            with timed('forward', len(tweet_objects)):
+                return model_manager.predict_batch(processed_input, x_ticker)
+        except Exception:
+            logger.exception('Batch prediction failed for model %s', model_id)
+            PREDICTION_FAILURES.inc(len(tweet_objects), model=model_id)
+            return [
+                {'predicted_sentiment': 'unknown', 'predicted_probabilities': []}
+                for _ in tweet_objects
+            ]
+
+    def process_and_save_post(
+        self,
+        data: dict,
+        model_manager=None,
+        member_predictions: dict[str, dict] | None = None,
+        model_id: str | None = None,
+    ):
+        """Persist an evaluated tweet.
+
+        Prediction rows record the answering model's architecture
+        (``get_model_name()``) as ``model_name`` and its registry ID as
+        ``model_id``.  ``member_predictions`` ({model_id: {'prediction',
+        'predicted_probabilities', 'model_name'}}) marks an ensemble result:
+        the post's own prediction is stored under ``ENSEMBLE_MODEL_NAME`` and
+        each member gets a ``PostPrediction`` row linked to the post.
+        """
         Post = apps.get_model('scraper', 'Post')
         PostMeta = apps.get_model('scraper', 'PostMeta')
         Ticker = apps.get_model('tickers', 'Ticker')
@@ -92,8 +328,17 @@ class DataManager:
         Source = apps.get_model('scraper', 'Source')
         PostPrediction = apps.get_model('scraper', 'PostPrediction')
 
-        if model_manager is None:
-            model_manager, _, _ = self.registry.get(self.default_model_id)
+        if member_predictions is not None:
+            model_name, model_id = ENSEMBLE_MODEL_NAME, None
+        elif model_manager is None:
+            model_id = model_id or self.default_model_id
+            spec = self.registry.cascade_spec(model_id)
+            if spec is not None:
+                model_id = spec.stages[-1]
+            model_manager, _, _ = self.registry.get(model_id)
+            model_name = model_manager.get_model_name()
+        else:
+            model_name = model_manager.get_model_name()
 
         try:
             with transaction.atomic():
@@ -114,7 +359,8 @@ class DataManager:
                 post_prediction, _ = PostPrediction.objects.get_or_create(
                     prediction=data['prediction'],
                     probabilities=data['predicted_probabilities'],
-                    model_name=model_manager.get_model_name(),
+                    model_name=model_name,
+                    model_id=model_id,
                 )
                 post, created = Post.objects.get_or_create(
                     time_stamp=data['date'],
@@ -125,6 +371,18 @@ class DataManager:
                         'post_prediction': post_prediction,
                     },
                 )
+                if created and member_predictions:
+                    PostPrediction.objects.bulk_create([
+                        PostPrediction(
+                            ensemble_post=post,
+                            prediction=member['prediction'],
+                            probabilities=member['predicted_probabilities'],
+                            model_name=member['model_name'],
+                            model_id=member_id,
+                        )
+                        for member_id, member in member_predictions.items()
+                        if isinstance(member['prediction'], int)
+                    ])
             if created:
                 logger.info('New post saved: %s', post)
             else:
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+
+def parity_corpus_path() -> Path:
+    return Path(settings.BASE_DIR) / 'scraper' / 'configs' / 'tokenizer_parity_corpus.txt'
+
+
+def load_parity_corpus(path: str | Path | None = None) -> list[str]:
+    """Non-empty lines of the parity corpus (the project copy unless *path* is given)."""
+    with open(path or parity_corpus_path(), encoding='utf-8') as file:
+        return [line.rstrip('\n') for line in file if line.strip()]
+
+
+def load_slow_tokenizer(fast):
+    """Load the pure-Python counterpart of *fast* from the same files.
+
+    transformers 5 names it ``<Name>Legacy``; 4.x used the bare name with
+    the fast class suffixed ``Fast``.  Returns None if there is none.
+    """
+    import transformers
+
+    base = type(fast).__name__.removesuffix('Fast')
+    for class_name in (f'{base}Legacy', base):
+        cls = getattr(transformers, class_name, None)
+        if cls is None or cls is type(fast):
+            continue
+        tokenizer = cls.from_pretrained(fast.name_or_path)
+        if not tokenizer.is_fast:
+            return tokenizer
+    return None
+
+
+def find_mismatches(fast, slow, texts: list[str]) -> list[tuple[str, list[int], list[int]]]:
+    """Texts for which the two tokenizers disagree, with both ID sequences."""
+    fast_ids = fast(texts, truncation=True, max_length=512)['input_ids']
+    slow_ids = slow(texts, truncation=True, max_length=512)['input_ids']
+    return [
+        (text, list(f), list(s))
+        for text, f, s in zip(texts, fast_ids, slow_ids)
+        if list(f) != list(s)
+    ]
+
+
+def load_tokenizer(name_or_path: str, bert: bool = False, verify: bool = False):
+    """Load the Rust-backed tokenizer for *name_or_path*.
+
+    With *verify*, its output is compared with the slow tokenizer's on the
+    parity corpus, and the slow one is returned instead if they disagree
+    on any line: a silently different encoding would shift every
+    prediction.
+    """
+    from transformers import AutoTokenizer, BertTokenizerFast
+
+    if bert:
+        tokenizer = BertTokenizerFast.from_pretrained(name_or_path)
+    else:
+        tokenizer = AutoTokenizer.from_pretrained(name_or_path, use_fast=True)
+
+    if not tokenizer.is_fast:
+        logger.warning('No fast tokenizer available for %s; using the slow one.', name_or_path)
+        return tokenizer
+    if not verify:
+        return tokenizer
+
+    slow = load_slow_tokenizer(tokenizer)
+    if slow is None:
+        logger.info('No slow tokenizer to verify %s against; using the fast one.', name_or_path)
+        return tokenizer
+    mismatches = find_mismatches(tokenizer, slow, load_parity_corpus())
+    if mismatches:
+        logger.error(
+            'Fast tokenizer for %s differs from the slow one on %d corpus line(s) '
+            '(first: %r); falling back to the slow tokenizer.',
+            name_or_path, len(mismatches), mismatches[0][0],
+        )
+        return slow
+    return tokenizer
@@ -1,6 +1,14 @@
 from __future__ import annotations
 
+import hashlib
+import json
+from collections.abc import Mapping
+from functools import cached_property
+
+import numpy as np
+
 from .base_processor import BasePreprocessor
+from .vocab import CompactVocab
 
 
 class LSTMCNNPreprocessor(BasePreprocessor):
@@ -8,6 +16,10 @@ class LSTMCNNPreprocessor(BasePreprocessor):
 
     Pipeline: lowercase → URLs → hashtags → special chars → whitespace
     Then tokenize to padded integer indices.
+
+    ``word_to_index`` may be a plain dict or a (memory-mapped)
+    :class:`CompactVocab`; dicts are converted so both paths share the
+    vectorized encoder.
     """
 
     pipeline = [
@@ -18,20 +30,30 @@ class LSTMCNNPreprocessor(BasePreprocessor):
         'normalize_whitespace',
     ]
 
-    def __init__(self, word_to_index: dict, max_len: int, pad_token: int = 0):
+    def __init__(
+        self,
+        word_to_index: Mapping[str, int] | CompactVocab,
+        max_len: int,
+        pad_token: int = 0,
+    ):
+        if not isinstance(word_to_index, CompactVocab):
+            word_to_index = CompactVocab.from_mapping(word_to_index)
         self.word_to_index = word_to_index
         self.max_len = max_len
         self.pad_token = pad_token
 
+    @property
+    def input_key(self):
+        return ('vocab', id(self.word_to_index), self.max_len, self.pad_token)
+
     def tokenize(self, text: str, **kwargs):
-        tokens = text.split()
-        indices = [self.word_to_index.get(w, self.pad_token) for w in tokens]
+        return self.tokenize_batch([text])[0].tolist()
 
-        if len(indices) < self.max_len:
-            indices += [self.pad_token] * (self.max_len - len(indices))
-        else:
-            indices = indices[: self.max_len]
-        return indices
+    def tokenize_batch(self, texts: list[str]) -> np.ndarray:
+        """Encode already-cleaned texts into a padded ``(n, max_len)`` int64 array."""
+        return self.word_to_index.encode_batch(
+            (text.split() for text in texts), self.max_len, self.pad_token,
+        )
 
 
 class TransformerPreprocessor(BasePreprocessor):
@@ -48,16 +70,44 @@ class TransformerPreprocessor(BasePreprocessor):
         'normalize_whitespace',
     ]
 
+    max_length = 512
+
     def __init__(self, tokenizer):
         self.tokenizer = tokenizer
 
+    @cached_property
+    def input_key(self):
+        # Keyed on the vocabulary contents, not the hub ID: fine-tuned models
+        # usually ship their base model's tokenizer and can share its output.
+        vocab = json.dumps(sorted(self.tokenizer.get_vocab().items()))
+        return (
+            'tokenizer',
+            type(self.tokenizer).__name__,
+            getattr(self.tokenizer, 'do_lower_case', None),
+            hashlib.sha1(vocab.encode('utf-8')).hexdigest(),
+        )
+
     def tokenize(self, text: str, **kwargs):
         return self.tokenizer(
             text,
             return_tensors='pt',
             padding=True,
             truncation=True,
-            max_length=512,
+            max_length=self.max_length,
+        )
+
+    def tokenize_batch(self, texts: list[str]):
+        """Tokenize cleaned texts in one call, padded to the longest one.
+
+        A fast tokenizer encodes the whole list in Rust (in parallel), which
+        is far cheaper per tweet than one call per text.
+        """
+        return self.tokenizer(
+            list(texts),
+            return_tensors='pt',
+            padding='longest',
+            truncation=True,
+            max_length=self.max_length,
         )
 
 
@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import json
+import logging
+import mmap
+import os
+import struct
+import zlib
+from collections.abc import Iterable, Mapping
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+COMPILED_SUFFIX = '.vocab'
+
+# File layout (little endian):
+#   magic (8) | count u32 | blob_len u32
+#   hashes u64[count]   — sorted, one per key
+#   ids    i64[count]   — index for the key with the same position
+#   offsets u32[count+1] — key i is blob[offsets[i]:offsets[i+1]]
+#   blob               — UTF-8 keys, concatenated
+_MAGIC = b'SNVOCAB2'
+_HEADER = struct.Struct('<8sII')
+
+# Entries kept by the per-instance LRU in front of ``get``.  Small on purpose:
+# enough for the ticker/word lookups a single text repeats, never a copy of
+# the (memory-mapped) vocabulary.
+_CACHE_SIZE = 4096
+
+
+def _hash(key: bytes) -> int:
+    # Two cheap C checksums side by side: fast enough to run per token, and
+    # wide enough that keys never collide in practice (compile-time checked).
+    return (zlib.crc32(key) << 32) | zlib.adler32(key)
+
+
+class CompactVocab:
+    """Read-only ``str -> int`` vocabulary backed by flat NumPy arrays.
+
+    Keys are located by binary search over their sorted 64-bit hashes and
+    confirmed against a string table, so lookups are exact.  A compiled
+    ``.vocab`` file is memory-mapped: opening it costs no parsing, and every
+    process on a host shares the same page-cache copy.
+
+    Supports the subset of the dict API the preprocessors use (``get``,
+    ``[]``, ``in``, ``len``) plus :meth:`encode_batch` for vectorized,
+    padded encoding.  ``get`` answers from a small bounded LRU before
+    falling back to the binary search.
+    """
+
+    def __init__(self, hashes: np.ndarray, ids: np.ndarray, offsets: np.ndarray, blob):
+        self._hashes = hashes
+        self._ids = ids
+        self._offsets = offsets
+        self._blob = blob
+        self._lookup = lru_cache(maxsize=_CACHE_SIZE)(self._find)
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_mapping(cls, mapping: Mapping[str, int]) -> CompactVocab:
+        entries = sorted(
+            (_hash(key.encode('utf-8')), key.encode('utf-8'), int(index))
+            for key, index in mapping.items()
+        )
+        hashes = np.fromiter((e[0] for e in entries), dtype='<u8', count=len(entries))
+        if len(hashes) > 1 and (hashes[1:] == hashes[:-1]).any():
+            raise ValueError('Vocabulary hash collision; keys cannot be stored compactly.')
+        ids = np.fromiter((e[2] for e in entries), dtype='<i8', count=len(entries))
+        lengths = np.fromiter((len(e[1]) for e in entries), dtype='<u4', count=len(entries))
+        offsets = np.zeros(len(entries) + 1, dtype='<u4')
+        np.cumsum(lengths, out=offsets[1:])
+        blob = b''.join(e[1] for e in entries)
+        return cls(hashes, ids, offsets, blob)
+
+    @classmethod
+    def from_json(cls, path: str | Path) -> CompactVocab:
+        with open(path, encoding='utf-8') as file:
+            return cls.from_mapping(json.load(file))
+
+    @classmethod
+    def load(cls, path: str | Path) -> CompactVocab:
+        """Memory-map a file written by :meth:`save`."""
+        with open(path, 'rb') as file:
+            mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if mm.size() < _HEADER.size or mm[:len(_MAGIC)] != _MAGIC:
+            raise ValueError(f"{path} is not a compiled vocabulary file.")
+        _, count, blob_len = _HEADER.unpack_from(mm, 0)
+        pos = _HEADER.size
+        hashes = np.frombuffer(mm, dtype='<u8', count=count, offset=pos)
+        pos += 8 * count
+        ids = np.frombuffer(mm, dtype='<i8', count=count, offset=pos)
+        pos += 8 * count
+        offsets = np.frombuffer(mm, dtype='<u4', count=count + 1, offset=pos)
+        pos += 4 * (count + 1)
+        # Kept as a memoryview so key slices compare as bytes without copying the table.
+        return cls(hashes, ids, offsets, memoryview(mm)[pos:pos + blob_len])
+
+    def save(self, path: str | Path) -> None:
+        # Written aside and renamed, so a process loading the file meanwhile
+        # never maps a half-written table.
+        path = Path(path)
+        tmp = path.with_name(f'.{path.name}.{os.getpid()}.tmp')
+        try:
+            with open(tmp, 'wb') as file:
+                file.write(_HEADER.pack(_MAGIC, len(self), len(self._blob)))
+                file.write(np.ascontiguousarray(self._hashes, dtype='<u8').tobytes())
+                file.write(np.ascontiguousarray(self._ids, dtype='<i8').tobytes())
+                file.write(np.ascontiguousarray(self._offsets, dtype='<u4').tobytes())
+                file.write(bytes(self._blob))
+            os.replace(tmp, path)
+        finally:
+            tmp.unlink(missing_ok=True)
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._hashes)
+
+    def _position(self, key: str) -> int:
+        raw = key.encode('utf-8')
+        h = _hash(raw)
+        pos = int(np.searchsorted(self._hashes, h))
+        if pos < len(self._hashes) and self._hashes[pos] == h and self._key_at(pos) == raw:
+            return pos
+        return -1
+
+    def _key_at(self, pos: int) -> bytes:
+        return bytes(self._blob[int(self._offsets[pos]):int(self._offsets[pos + 1])])
+
+    def _find(self, key: str) -> int | None:
+        pos = self._position(key)
+        return int(self._ids[pos]) if pos >= 0 else None
+
+    def get(self, key: str, default: int | None = None) -> int | None:
+        index = self._lookup(key)
+        return default if index is None else index
+
+    def __getitem__(self, key: str) -> int:
+        pos = self._position(key)
+        if pos < 0:
+            raise KeyError(key)
+        return int(self._ids[pos])
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self._position(key) >= 0
+
+    def encode_batch(
+        self,
+        token_lists: Iterable[list[str]],
+        max_len: int,
+        pad_token: int = 0,
+    ) -> np.ndarray:
+        """Encode token lists into a ``(n, max_len)`` int64 array.
+
+        Sequences are truncated to ``max_len`` and right-padded with
+        ``pad_token``; unknown tokens also map to ``pad_token``.  All lookups
+        for the batch happen in one ``searchsorted`` call.
+        """
+        rows = [tokens[:max_len] for tokens in token_lists]
+        out = np.full((len(rows), max_len), pad_token, dtype=np.int64)
+        lengths = np.fromiter((len(r) for r in rows), dtype=np.intp, count=len(rows))
+        total = int(lengths.sum())
+        if total == 0 or len(self) == 0:
+            return out
+
+        raw = [t.encode('utf-8') for r in rows for t in r]
+        crc32, adler32 = zlib.crc32, zlib.adler32  # _hash, inlined for the hot loop
+        hashes = np.fromiter(
+            ((crc32(b) << 32) | adler32(b) for b in raw), dtype='<u8', count=total,
+        )
+        pos = np.searchsorted(self._hashes, hashes)
+        np.minimum(pos, len(self) - 1, out=pos)
+        hit = self._hashes[pos] == hashes
+        # Confirm hash hits against the string table (guards against collisions
+        # with out-of-vocabulary words).
+        hit_idx = np.flatnonzero(hit)
+        starts = self._offsets[pos[hit_idx]].tolist()
+        ends = self._offsets[pos[hit_idx] + 1].tolist()
+        blob = self._blob
+        for i, start, end in zip(hit_idx.tolist(), starts, ends):
+            if blob[start:end] != raw[i]:
+                hit[i] = False
+        values = np.where(hit, self._ids[pos], pad_token)
+
+        row_idx = np.repeat(np.arange(len(rows)), lengths)
+        col_idx = np.arange(total) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        out[row_idx, col_idx] = values
+        return out
+
+
+def compiled_path(json_path: str | Path) -> Path:
+    return Path(json_path).with_suffix(COMPILED_SUFFIX)
+
+
+def compile_vocab(json_path: str | Path, output: str | Path | None = None) -> Path:
+    """Write the compiled ``.vocab`` file for a ``{word: index}`` JSON map."""
+    output = Path(output) if output else compiled_path(json_path)
+    CompactVocab.from_json(json_path).save(output)
+    return output
+
+
+def load_vocab(json_path: str | Path) -> CompactVocab:
+    """Return the vocabulary for *json_path*, memory-mapped when possible.
+
+    Uses the sibling ``.vocab`` file if it is at least as new as the JSON;
+    otherwise builds the arrays in memory from the JSON (run
+    ``manage.py compile_vocab`` to avoid that cost).
+    """
+    json_path = Path(json_path)
+    compiled = compiled_path(json_path)
+    if compiled.exists() and (
+        not json_path.exists() or compiled.stat().st_mtime >= json_path.stat().st_mtime
+    ):
+        return CompactVocab.load(compiled)
+    logger.info('No up-to-date %s; building vocabulary from %s', compiled.name, json_path)
+    return CompactVocab.from_json(json_path)
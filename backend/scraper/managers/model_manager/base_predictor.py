@@ -17,3 +17,23 @@ class BaseModelPredictor(ABC):
         device: torch.device,
     ) -> dict[str, int | list[float]]:
         pass
+
+    @abstractmethod
+    def predict_batch(
+        self,
+        model: nn.Module,
+        x_text,
+        x_ticker,
+        device: torch.device,
+    ) -> list[dict[str, int | list[float]]]:
+        """Predict a collated batch; returns one result dict per row."""
+
+    @staticmethod
+    def _split_results(
+        probabilities: torch.Tensor,
+        predicted: torch.Tensor,
+    ) -> list[dict[str, int | list[float]]]:
+        return [
+            {'predicted_sentiment': label, 'predicted_probabilities': probs}
+            for label, probs in zip(predicted.tolist(), probabilities.tolist())
+        ]
@@ -1,17 +1,16 @@
 from __future__ import annotations
 
+import logging
 from pathlib import Path
 from typing import Any
 
 import torch
 import torch.nn as nn
-from transformers import (
-    AutoModelForSequenceClassification,
-    BertForSequenceClassification,
-)
 
 from .base_loader import BaseModelLoader
 
+logger = logging.getLogger(__name__)
+
 # HuggingFace model IDs that require the explicit Bert* classes.
 _BERT_MODEL_HF_IDS = {
     'yiyanghkust/finbert-tone',
@@ -19,9 +18,52 @@ _BERT_MODEL_HF_IDS = {
 }
 
 
+def load_state_dict_mmap(
+    weights_path: Path,
+    device: torch.device,
+) -> dict[str, torch.Tensor]:
+    """Load a state dict whose CPU tensors are backed by the mapped file.
+
+    ``.safetensors`` files go through ``safetensors.torch.load_file``; other
+    checkpoints through ``torch.load(mmap=True, weights_only=True)``.  Either
+    way the tensor storage lives in the page cache, so worker processes on one
+    host share a single physical copy of the weights instead of each holding
+    a private unpickled one.  Legacy (non-zipfile) ``.pt`` files cannot be
+    mapped and are read eagerly — convert them with
+    ``manage.py convert_weights``.
+    """
+    if not weights_path.exists():
+        raise FileNotFoundError(f"Weight file not found: {weights_path}")
+
+    if weights_path.suffix == '.safetensors':
+        from safetensors.torch import load_file
+
+        return load_file(weights_path, device=str(device))
+
+    try:
+        checkpoint = torch.load(
+            weights_path, map_location=device, mmap=True, weights_only=True,
+        )
+    except RuntimeError:
+        logger.warning(
+            'Checkpoint %s cannot be memory-mapped (legacy format); loading it '
+            'into private memory. Run `manage.py convert_weights` to fix this.',
+            weights_path,
+        )
+        checkpoint = torch.load(weights_path, map_location=device, weights_only=True)
+    return checkpoint.get('model_state_dict', checkpoint)
+
+
 class LSTMCNNLoader(BaseModelLoader):
     def load_model(self, model_params: dict[str, Any]) -> nn.Module:
-        """Initialise CNN-LSTM architecture and load weights."""
+        """Initialise CNN-LSTM architecture and load weights.
+
+        The mapped checkpoint tensors are assigned to the module
+        (``assign=True``) instead of copied into its freshly initialised
+        parameters, so the weights alias the shared file pages and the
+        init-time allocations are released.  Building on the ``meta`` device
+        would skip the init entirely but costs ~0.5s of one-off torch imports.
+        """
         from ml_logic.lstm_cnn import CNNLSTMModel
 
         try:
@@ -40,11 +82,10 @@ class LSTMCNNLoader(BaseModelLoader):
 
         weights_path = Path(model_params['resolved_weights'])
         try:
-            checkpoint = torch.load(weights_path, map_location=self.device)
-            state_dict = checkpoint.get('model_state_dict', checkpoint)
-            model.load_state_dict(state_dict)
+            state_dict = load_state_dict_mmap(weights_path, self.device)
+            model.load_state_dict(state_dict, assign=True)
         except FileNotFoundError:
-            raise FileNotFoundError(f"Weight file not found: {weights_path}")
+            raise
         except Exception as e:
             raise RuntimeError(f"Error loading LSTM/CNN weights: {e}") from e
 
@@ -58,8 +99,17 @@ class TransformerModelLoader(BaseModelLoader):
         Uses ``BertForSequenceClassification`` for known FinBERT variants and
         ``AutoModelForSequenceClassification`` for everything else.
         The model identifier comes from ``resolved_weights`` (set during config
-        validation — either a local path or a HuggingFace hub ID).
+        validation — either a local path or a HuggingFace hub ID).  A local
+        directory written by ``manage.py convert_weights --hf`` is read from
+        its memory-mapped ``model.safetensors``.
         """
+        # Deferred: transformers adds seconds to import and is only needed
+        # once a transformer model is actually loaded.
+        from transformers import (
+            AutoModelForSequenceClassification,
+            BertForSequenceClassification,
+        )
+
         resolved = model_params['resolved_weights']
         num_labels = model_params.get('num_labels', 3)
 
@@ -80,6 +80,14 @@ class ModelManager:
 
         return self.predictor.predict(self.model, x_text, x_ticker, self.device)
 
+    def predict_batch(self, x_text, x_ticker) -> list[dict[str, int | list[float]]]:
+        """Run one forward pass over a collated batch (see ``preprocess_batch``)."""
+        if self.model is None:
+            raise ValueError(
+                'Model is not initialized. Please call `load_model` first.',
+            )
+        return self.predictor.predict_batch(self.model, x_text, x_ticker, self.device)
+
     def get_model(self) -> nn.Module:
         if self.model is None:
             raise ValueError(
@@ -46,6 +46,26 @@ class LSTMCNNPredictor(BaseModelPredictor):
             logger.exception('Prediction failed for LSTMCNN model')
             raise RuntimeError(f"Prediction failed for LSTMCNN: {e}") from e
 
+    def predict_batch(
+        self,
+        model: nn.Module,
+        x_text,
+        x_ticker,
+        device: torch.device,
+    ) -> list[dict[str, int | list[float]]]:
+        """``x_text`` is an ``(n, max_len)`` index array, ``x_ticker`` n ticker indices."""
+        model.eval()
+        try:
+            with torch.no_grad():
+                x_text_tensor = torch.as_tensor(x_text, dtype=torch.long).to(device)
+                x_ticker_tensor = torch.as_tensor(x_ticker, dtype=torch.long).to(device)
+                output = model(x_text_tensor, x_ticker_tensor)
+                probabilities = torch.nn.functional.softmax(output, dim=1).cpu()
+            return self._split_results(probabilities, torch.argmax(probabilities, dim=1))
+        except Exception as e:
+            logger.exception('Batch prediction failed for LSTMCNN model')
+            raise RuntimeError(f"Prediction failed for LSTMCNN: {e}") from e
+
 
 class TransformerModelPredictor(BaseModelPredictor):
     """Predictor for HuggingFace transformer models.
@@ -126,6 +146,32 @@ class TransformerModelPredictor(BaseModelPredictor):
                 f"Prediction failed for transformer model: {e}",
             ) from e
 
+    def predict_batch(
+        self,
+        model: nn.Module,
+        x_text,
+        x_ticker,
+        device: torch.device,
+    ) -> list[dict[str, int | list[float]]]:
+        """``x_text`` is a padded tokenizer encoding for the whole batch."""
+        model.eval()
+        try:
+            with torch.no_grad():
+                inputs = {
+                    k: v.to(device) if isinstance(v, torch.Tensor) else v
+                    for k, v in x_text.items()
+                }
+                output = model(**inputs)
+                logits = output.logits if hasattr(output, 'logits') else output[0]
+                probabilities = torch.nn.functional.softmax(logits, dim=1).cpu()
+                probabilities, predicted = self._remap(probabilities)
+            return self._split_results(probabilities, predicted)
+        except Exception as e:
+            logger.exception('Error during transformer batch prediction')
+            raise RuntimeError(
+                f"Prediction failed for transformer model: {e}",
+            ) from e
+
 
 def get_model_predictor(
     model_name: str,
@@ -1,15 +1,18 @@
 from __future__ import annotations
 
+import copy
 import json
 import logging
+import time
 from pathlib import Path
 from threading import Lock
-from typing import Any
+from typing import Any, NamedTuple
 
 from django.conf import settings
-from transformers import BertTokenizer, AutoTokenizer
 
+from .data_manager.fast_tokenizers import load_tokenizer
 from .data_manager.model_processors import get_preprocessor
+from .data_manager.vocab import compiled_path, load_vocab
 from .model_manager.model_manager import ModelManager
 
 logger = logging.getLogger(__name__)
@@ -19,19 +22,55 @@ MODEL_ID_TO_CONFIG_KEY = {
     'LSTMCNNv1': 'cnn_lstm',
     'FinBERT': 'transformer_finbert',
     'TweetBERT': 'transformer_tweetbert',
+    'Cascade:LSTMCNNv1>FinBERT': 'cascade_lstm_finbert',
 }
 
-# HuggingFace model IDs that use BertTokenizer instead of AutoTokenizer.
+# Config ``model_name`` of entries that chain other models instead of loading weights.
+CASCADE_MODEL_NAME = 'cascade'
+DEFAULT_CASCADE_THRESHOLD = 0.75
+
+# HuggingFace model IDs that use BertTokenizerFast instead of AutoTokenizer.
 _BERT_TOKENIZER_HF_IDS = {
     'yiyanghkust/finbert-tone',
     'nickmuchi/finbert-tone-finetuned-fintwitter-classification',
 }
 
 
+def load_model_configs(path: str | Path | None = None) -> dict[str, Any]:
+    """Read ``model_configs.json`` (the project copy unless *path* is given)."""
+    if path is None:
+        path = Path(settings.BASE_DIR) / 'scraper' / 'configs' / 'model_configs.json'
+    with open(path, encoding='utf-8') as file:
+        return json.load(file)
+
+
 class ModelConfigError(Exception):
     """Raised when model configuration is invalid and unrecoverable."""
 
 
+class LoadedModel(NamedTuple):
+    manager: ModelManager
+    preprocessor: Any
+    memory_bytes: int
+    model_type: str
+
+
+class CascadeSpec(NamedTuple):
+    """Model IDs tried in order; a stage's answer is kept when its top
+    probability reaches ``confidence_threshold`` (the last stage always answers)."""
+    stages: tuple[str, ...]
+    confidence_threshold: float
+
+
+def _model_memory_bytes(manager: ModelManager) -> int:
+    """Bytes held by the model's parameters and buffers."""
+    model = manager.get_model()
+    return sum(
+        t.numel() * t.element_size()
+        for t in (*model.parameters(), *model.buffers())
+    )
+
+
 class ModelRegistry:
     """
     Lazily loads and caches ModelManager + preprocessor pairs.
@@ -43,16 +82,34 @@ class ModelRegistry:
         logged (but doesn't crash the process so other models can still work).
 
     Each model is loaded on first request and kept in memory for reuse.
+    When ``memory_budget_bytes`` is set, loading a model that would push the
+    total parameter memory over the budget first evicts the least recently
+    used models.
+
     The registry is safe for concurrent access from multiple threads.
+    Lookups of already-loaded models take no lock; loads are serialised per
+    config key, so a cold load of one model never blocks requests for
+    another.  ``self._lock`` only guards short bookkeeping sections.
     """
 
-    def __init__(self, model_configs: dict[str, Any]):
+    def __init__(
+        self,
+        model_configs: dict[str, Any],
+        memory_budget_bytes: int | None = None,
+    ):
         self._configs = model_configs
-        self._managers: dict[str, ModelManager] = {}
-        self._preprocessors: dict[str, Any] = {}
+        self._models: dict[str, LoadedModel] = {}
         self._lock = Lock()
+        self._load_locks: dict[str, Lock] = {}
         self._unavailable: set[str] = set()
 
+        self.memory_budget_bytes = memory_budget_bytes or None
+        self._last_used: dict[str, float] = {}
+        # Sizes survive eviction so a reload can make room before loading.
+        self._known_sizes: dict[str, int] = {}
+        self._load_count = 0
+        self._evictions: dict[str, int] = {}
+
         self._validate_and_resolve_configs()
 
     # ------------------------------------------------------------------
@@ -71,44 +128,23 @@ class ModelRegistry:
         3. If neither is usable → mark config as *unavailable*.
         """
         for config_key, cfg in self._configs.items():
-            params = cfg.get('params', {})
-            model_name = cfg.get('model_name', '')
-            local_path = params.get('weights_path')
-            hf_fallback = params.get('hf_fallback')
-
-            # --- Resolve effective weights source ---
-            if local_path and Path(local_path).exists():
-                params['resolved_weights'] = local_path
-                logger.info(
-                    '[%s] Using local weights: %s', config_key, local_path,
-                )
-            elif hf_fallback:
-                if local_path:
-                    logger.warning(
-                        '[%s] Local weights_path "%s" not found — '
-                        'falling back to HuggingFace: %s',
-                        config_key, local_path, hf_fallback,
-                    )
-                else:
-                    logger.info(
-                        '[%s] No local weights_path specified — '
-                        'using HuggingFace: %s',
-                        config_key, hf_fallback,
-                    )
-                params['resolved_weights'] = hf_fallback
-            else:
-                # Nothing usable at all.
+            if not self._resolve_config(config_key, cfg):
+                self._unavailable.add(config_key)
+
+        # A cascade is only usable if every one of its stages is.
+        for config_key, cfg in self._configs.items():
+            if cfg.get('model_name') != CASCADE_MODEL_NAME or config_key in self._unavailable:
+                continue
+            broken = [
+                model_id for model_id in cfg['params']['stages']
+                if MODEL_ID_TO_CONFIG_KEY[model_id] in self._unavailable
+            ]
+            if broken:
                 logger.error(
-                    '[%s] No valid weights_path and no hf_fallback configured. '
-                    'Model will be UNAVAILABLE.',
-                    config_key,
+                    '[%s] Cascade stages %s are unavailable. Model will be UNAVAILABLE.',
+                    config_key, broken,
                 )
                 self._unavailable.add(config_key)
-                continue
-
-            # --- Extra checks per model type ---
-            if model_name == 'lstmcnn_model':
-                self._validate_lstm_extras(config_key, params)
 
         if self._unavailable:
             logger.warning(
@@ -116,79 +152,217 @@ class ModelRegistry:
                 'on access: %s', sorted(self._unavailable),
             )
 
-    def _validate_lstm_extras(self, config_key: str, params: dict) -> None:
+    def _resolve_config(self, config_key: str, cfg: dict) -> bool:
+        """Set ``resolved_weights`` on one config entry; False if unusable."""
+        params = cfg.get('params', {})
+        model_name = cfg.get('model_name', '')
+        if model_name == CASCADE_MODEL_NAME:
+            return self._validate_cascade(config_key, params)
+        local_path = params.get('weights_path')
+        hf_fallback = params.get('hf_fallback')
+
+        # --- Resolve effective weights source ---
+        if local_path and Path(local_path).exists():
+            params['resolved_weights'] = local_path
+            logger.info(
+                '[%s] Using local weights: %s', config_key, local_path,
+            )
+        elif hf_fallback:
+            if local_path:
+                logger.warning(
+                    '[%s] Local weights_path "%s" not found — '
+                    'falling back to HuggingFace: %s',
+                    config_key, local_path, hf_fallback,
+                )
+            else:
+                logger.info(
+                    '[%s] No local weights_path specified — '
+                    'using HuggingFace: %s',
+                    config_key, hf_fallback,
+                )
+            params['resolved_weights'] = hf_fallback
+        else:
+            # Nothing usable at all.
+            logger.error(
+                '[%s] No valid weights_path and no hf_fallback configured. '
+                'Model will be UNAVAILABLE.',
+                config_key,
+            )
+            return False
+
+        # --- Extra checks per model type ---
+        if model_name == 'lstmcnn_model':
+            return self._validate_lstm_extras(config_key, params)
+        return True
+
+    def _validate_cascade(self, config_key: str, params: dict) -> bool:
+        """Cascades need two or more known, non-cascade stages and a threshold in (0, 1]."""
+        stages = params.get('stages') or []
+        threshold = params.get('confidence_threshold', DEFAULT_CASCADE_THRESHOLD)
+        problems = []
+        if len(stages) < 2:
+            problems.append('needs at least two stages')
+        for model_id in stages:
+            stage_key = MODEL_ID_TO_CONFIG_KEY.get(model_id)
+            if stage_key is None or stage_key not in self._configs:
+                problems.append(f"unknown stage '{model_id}'")
+            elif self._configs[stage_key].get('model_name') == CASCADE_MODEL_NAME:
+                problems.append(f"stage '{model_id}' is itself a cascade")
+        if not 0 < threshold <= 1:
+            problems.append(f'confidence_threshold {threshold} is not in (0, 1]')
+        if problems:
+            logger.error(
+                '[%s] Invalid cascade (%s). Model will be UNAVAILABLE.',
+                config_key, '; '.join(problems),
+            )
+            return False
+        return True
+
+    def _validate_lstm_extras(self, config_key: str, params: dict) -> bool:
         """LSTM models need supporting files (word_to_index, ticker_to_index)."""
+        valid = True
         for label, path in [
             ('WORD_TO_INDEX_PATH', settings.WORD_TO_INDEX_PATH),
             ('TICKER_TO_INDEX_PATH', settings.TICKER_TO_INDEX_PATH),
         ]:
-            if not Path(path).exists():
+            if not Path(path).exists() and not compiled_path(path).exists():
                 logger.error(
                     '[%s] Required file %s (%s) does not exist. '
                     'Model will be UNAVAILABLE.',
                     config_key, label, path,
                 )
-                self._unavailable.add(config_key)
+                valid = False
+        return valid
 
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
 
-    def _load_json(self, path: str) -> dict:
-        with open(path, encoding='utf-8') as f:
-            return json.load(f)
-
     def _build_preprocessor(self, model_name: str, model_params: dict) -> Any:
         if model_name == 'lstmcnn_model':
-            word_to_index = self._load_json(settings.WORD_TO_INDEX_PATH)
             return get_preprocessor(
                 model_name,
-                word_to_index=word_to_index,
+                word_to_index=load_vocab(settings.WORD_TO_INDEX_PATH),
                 max_len=30,
                 pad_token=0,
             )
 
-        # Transformer variants — pick the right tokenizer class.
+        # Transformer variants — the Rust-backed tokenizer, optionally checked
+        # against the slow one.  transformers is imported inside load_tokenizer
+        # so building the registry doesn't pull it in.
         resolved = model_params['resolved_weights']
-        if resolved in _BERT_TOKENIZER_HF_IDS:
-            tokenizer = BertTokenizer.from_pretrained(resolved)
-        else:
-            tokenizer = AutoTokenizer.from_pretrained(resolved)
+        tokenizer = load_tokenizer(
+            resolved,
+            bert=resolved in _BERT_TOKENIZER_HF_IDS,
+            verify=settings.VERIFY_FAST_TOKENIZERS,
+        )
         return get_preprocessor('transformer_model', tokenizer=tokenizer)
 
     # ------------------------------------------------------------------
     # Lazy loading
     # ------------------------------------------------------------------
 
-    def _ensure_loaded(self, config_key: str) -> None:
-        """Load a model into the registry if not already present."""
+    def _load_lock_for(self, config_key: str) -> Lock:
         with self._lock:
-            if config_key in self._managers:
-                return
+            return self._load_locks.setdefault(config_key, Lock())
 
-            if config_key in self._unavailable:
-                raise ModelConfigError(
-                    f"Model '{config_key}' is unavailable — configuration "
-                    f"validation failed at startup. Check logs for details."
-                )
+    def _ensure_loaded(self, config_key: str) -> LoadedModel:
+        """Load a model into the registry if not already present.
 
-            if config_key not in self._configs:
-                raise ValueError(
-                    f"Unknown model config key '{config_key}'. "
-                    f"Available: {list(self._configs.keys())}"
-                )
+        Double-checked locking: the first lookup is lock-free (a single dict
+        read), and only a miss takes the per-key load lock.
+        """
+        entry = self._models.get(config_key)
+        if entry is not None:
+            return entry
+
+        if config_key in self._unavailable:
+            raise ModelConfigError(
+                f"Model '{config_key}' is unavailable — configuration "
+                f"validation failed at startup. Check logs for details."
+            )
+
+        if config_key not in self._configs:
+            raise ValueError(
+                f"Unknown model config key '{config_key}'. "
+                f"Available: {list(self._configs.keys())}"
+            )
+
+        with self._load_lock_for(config_key):
+            # Another thread may have finished the load while we waited.
+            entry = self._models.get(config_key)
+            if entry is not None:
+                return entry
 
             cfg = self._configs[config_key]
             model_name = cfg['model_name']
             model_params = cfg['params']
 
+            # Make room up front when we already know how big this model is.
+            with self._lock:
+                self._evict_for(self._known_sizes.get(config_key, 0), keep=config_key)
+
             logger.info('Loading model %s (%s) ...', config_key, model_name)
             manager = ModelManager(model_name, model_params)
             preprocessor = self._build_preprocessor(model_name, model_params)
+            memory_bytes = _model_memory_bytes(manager)
+
+            entry = LoadedModel(manager, preprocessor, memory_bytes, model_name)
+            with self._lock:
+                self._models[config_key] = entry
+                self._known_sizes[config_key] = memory_bytes
+                self._last_used[config_key] = time.monotonic()
+                self._load_count += 1
+                # First load of this model: its size is only known now.
+                self._evict_for(0, keep=config_key)
+
+            logger.info(
+                'Model %s loaded successfully (%.1f MB).',
+                config_key, memory_bytes / 2**20,
+            )
+            return entry
+
+    def _memory_used(self) -> int:
+        return sum(entry.memory_bytes for entry in self._models.values())
+
+    def _evict_for(self, incoming_bytes: int, keep: str) -> None:
+        """Evict LRU models until *incoming_bytes* more fits in the budget.
 
-            self._managers[config_key] = manager
-            self._preprocessors[config_key] = preprocessor
-            logger.info('Model %s loaded successfully.', config_key)
+        Must be called with ``self._lock`` held.  The model named by *keep*
+        is never evicted, so a single model larger than the budget still
+        loads (and is logged).
+        """
+        if self.memory_budget_bytes is None:
+            return
+
+        while self._memory_used() + incoming_bytes > self.memory_budget_bytes:
+            candidates = [key for key in self._models if key != keep]
+            if not candidates:
+                logger.warning(
+                    'Model %s alone exceeds the memory budget (%.1f MB).',
+                    keep, self.memory_budget_bytes / 2**20,
+                )
+                return
+            victim = min(candidates, key=lambda key: self._last_used.get(key, 0.0))
+            self._evict(victim)
+
+    def _evict(self, config_key: str) -> None:
+        # Callers that already hold the manager keep it alive until they are
+        # done; the registry only drops its own reference here.
+        entry = self._models.pop(config_key)
+        self._last_used.pop(config_key, None)
+        self._evictions[config_key] = self._evictions.get(config_key, 0) + 1
+        logger.info(
+            'Evicted model %s (%.1f MB) to stay within the memory budget.',
+            config_key, entry.memory_bytes / 2**20,
+        )
+
+    @staticmethod
+    def _run_warmup(manager, preprocessor, model_type: str, seq_lens) -> None:
+        for seq_len in seq_lens:
+            processed = preprocessor.preprocess(' '.join(['market'] * max(1, seq_len)))
+            x_ticker = [0] if model_type == 'lstmcnn_model' else None
+            manager.predict(processed, x_ticker)
 
     # ------------------------------------------------------------------
     # Public API
@@ -208,12 +382,123 @@ class ModelRegistry:
                 f"Unknown model ID '{model_id}'. "
                 f"Available: {list(MODEL_ID_TO_CONFIG_KEY.keys())}"
             )
+        if self._configs.get(config_key, {}).get('model_name') == CASCADE_MODEL_NAME:
+            raise ValueError(
+                f"'{model_id}' is a cascade, not a single model; "
+                f"use cascade_spec() to get its stages."
+            )
+
+        entry = self._ensure_loaded(config_key)
+        self._last_used[config_key] = time.monotonic()
+        return entry.manager, entry.preprocessor, entry.model_type
+
+    def cascade_spec(self, model_id: str) -> CascadeSpec | None:
+        """Return the stages of a cascade model ID, or None for a single model.
+
+        Raises ModelConfigError if the cascade (or one of its stages) failed
+        validation.
+        """
+        config_key = MODEL_ID_TO_CONFIG_KEY.get(model_id)
+        cfg = self._configs.get(config_key) if config_key else None
+        if cfg is None or cfg.get('model_name') != CASCADE_MODEL_NAME:
+            return None
+        if config_key in self._unavailable:
+            raise ModelConfigError(
+                f"Cascade '{model_id}' is unavailable — configuration "
+                f"validation failed at startup. Check logs for details."
+            )
+        params = cfg['params']
+        return CascadeSpec(
+            tuple(params['stages']),
+            float(params.get('confidence_threshold', DEFAULT_CASCADE_THRESHOLD)),
+        )
+
+    def warm_up(self, model_id: str, seq_lens: list[int] | tuple[int, ...] = (8, 32, 128)) -> float:
+        """Load *model_id* and run a dummy forward pass per sequence length.
+
+        The first call into a freshly loaded model pays for allocator and
+        kernel initialisation; doing it here keeps that cost off the first
+        real request.  A cascade warms up each of its stages.  Returns the
+        elapsed time in seconds.
+        """
+        spec = self.cascade_spec(model_id)
+        if spec is not None:
+            return sum(self.warm_up(stage, seq_lens) for stage in spec.stages)
+
+        start = time.perf_counter()
+        self._run_warmup(*self.get(model_id), seq_lens)
+        elapsed = time.perf_counter() - start
+        logger.info('Model %s warmed up in %.2fs (seq_lens=%s).', model_id, elapsed, list(seq_lens))
+        return elapsed
 
-        self._ensure_loaded(config_key)
-        manager = self._managers[config_key]
-        preprocessor = self._preprocessors[config_key]
-        model_type = self._configs[config_key]['model_name']
-        return manager, preprocessor, model_type
+    def preload(self, model_ids: list[str], seq_lens: list[int] | tuple[int, ...] = (8, 32, 128)) -> list[str]:
+        """Load and warm up every model in *model_ids*.
+
+        Failures are logged and skipped so one broken config cannot keep the
+        process from starting.  Returns the model IDs that are ready.
+        """
+        ready = []
+        for model_id in model_ids:
+            try:
+                self.warm_up(model_id, seq_lens)
+                ready.append(model_id)
+            except Exception:
+                logger.exception('Preloading model %s failed.', model_id)
+        return ready
+
+    def reload(
+        self,
+        model_id: str,
+        new_config: dict[str, Any] | None = None,
+        seq_lens: list[int] | tuple[int, ...] = (8, 32, 128),
+    ) -> bool:
+        """Hot-swap *model_id* to *new_config* without a serving gap.
+
+        The new manager/preprocessor pair is built and warmed up while the
+        current one keeps serving, then replaces it in a single dict
+        assignment.  Requests already holding the old manager finish on it;
+        it is freed once the last of them drops its reference.
+
+        If the model is not loaded in this process only the config is
+        replaced, and the next ``get()`` loads the new version.  Returns True
+        if a loaded model was swapped.  Raises ModelConfigError (leaving the
+        current version in place) when the new config is unusable.
+        """
+        config_key = MODEL_ID_TO_CONFIG_KEY.get(model_id)
+        if config_key is None or config_key not in self._configs:
+            raise ValueError(f"Unknown model ID '{model_id}'.")
+
+        cfg = copy.deepcopy(new_config if new_config is not None else self._configs[config_key])
+        if not self._resolve_config(config_key, cfg):
+            raise ModelConfigError(f"New config for '{model_id}' is unusable; keeping current version.")
+
+        with self._load_lock_for(config_key):
+            if config_key not in self._models:
+                with self._lock:
+                    self._configs[config_key] = cfg
+                    self._unavailable.discard(config_key)
+                logger.info('Config for %s replaced; it will load on next use.', model_id)
+                return False
+
+            start = time.perf_counter()
+            logger.info('Reloading model %s in the background ...', model_id)
+            manager = ModelManager(cfg['model_name'], cfg['params'])
+            preprocessor = self._build_preprocessor(cfg['model_name'], cfg['params'])
+            self._run_warmup(manager, preprocessor, cfg['model_name'], seq_lens)
+            memory_bytes = _model_memory_bytes(manager)
+
+            with self._lock:
+                self._configs[config_key] = cfg
+                self._unavailable.discard(config_key)
+                self._models[config_key] = LoadedModel(
+                    manager, preprocessor, memory_bytes, cfg['model_name'],
+                )
+                self._known_sizes[config_key] = memory_bytes
+                self._load_count += 1
+                self._evict_for(0, keep=config_key)
+
+        logger.info('Model %s swapped to new version in %.2fs.', model_id, time.perf_counter() - start)
+        return True
 
     @property
     def available_models(self) -> list[str]:
@@ -235,5 +520,23 @@ class ModelRegistry:
     def loaded_models(self) -> list[str]:
         return [
             model_id for model_id, key in MODEL_ID_TO_CONFIG_KEY.items()
-            if key in self._managers
+            if key in self._models
         ]
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Memory and load/eviction counters, for sizing worker pods."""
+        key_to_id = {key: model_id for model_id, key in MODEL_ID_TO_CONFIG_KEY.items()}
+        models = dict(self._models)
+        return {
+            'memory_budget_bytes': self.memory_budget_bytes,
+            'memory_used_bytes': sum(entry.memory_bytes for entry in models.values()),
+            'loaded': {
+                key_to_id.get(key, key): entry.memory_bytes for key, entry in models.items()
+            },
+            'loads': self._load_count,
+            'evictions': sum(self._evictions.values()),
+            'evicted': {
+                key_to_id.get(key, key): count for key, count in self._evictions.items()
+            },
+        }
@@ -0,0 +1,19 @@
+# Generated by Django 5.1.3 on 2026-10-19 12:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scraper', '0002_remove_config_uptaded_at_config_updated_at_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='postprediction',
+            name='ensemble_post',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='predictions', to='scraper.post'),
+        ),
+    ]
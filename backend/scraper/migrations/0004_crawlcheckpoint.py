@@ -0,0 +1,28 @@
+# Generated by Django 5.1.3 on 2026-10-19 11:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scraper', '0003_postprediction_ensemble_post'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CrawlCheckpoint',
+            fields=[
+                ('checkpoint_id', models.AutoField(primary_key=True, serialize=False)),
+                ('source', models.CharField(max_length=64)),
+                ('ticker', models.CharField(max_length=16)),
+                ('day', models.DateField()),
+                ('newest_tweet_at', models.DateTimeField(blank=True, null=True)),
+                ('closed', models.BooleanField(default=False)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'unique_together': {('source', 'ticker', 'day')},
+            },
+        ),
+    ]
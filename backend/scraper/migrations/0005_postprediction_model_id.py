@@ -0,0 +1,25 @@
+# Generated by Django 5.1.3 on 2026-10-19 12:26
+
+from django.db import migrations, models
+
+
+def copy_member_ids(apps, schema_editor):
+    # Ensemble member rows used to store the model ID in model_name.
+    PostPrediction = apps.get_model('scraper', 'PostPrediction')
+    PostPrediction.objects.filter(ensemble_post__isnull=False).update(model_id=models.F('model_name'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scraper', '0004_crawlcheckpoint'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='postprediction',
+            name='model_id',
+            field=models.CharField(blank=True, max_length=64, null=True),
+        ),
+        migrations.RunPython(copy_member_ids, migrations.RunPython.noop),
+    ]
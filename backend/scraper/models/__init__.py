@@ -2,3 +2,4 @@ from .content import Content
 from .config import Config
 from .source import Source
 from .post import PostMeta, PostPrediction, Post
+from .crawl_checkpoint import CrawlCheckpoint
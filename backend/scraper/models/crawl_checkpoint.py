@@ -0,0 +1,16 @@
+from django.db import models
+
+class CrawlCheckpoint(models.Model):
+    """How far the scraper got on one ticker-day of one source."""
+    checkpoint_id = models.AutoField(primary_key=True)
+    source = models.CharField(max_length=64)
+    ticker = models.CharField(max_length=16)
+    day = models.DateField()
+    # Newest tweet seen on that day by a crawl that ran to the end of results.
+    newest_tweet_at = models.DateTimeField(null=True, blank=True)
+    # Crawled to the end after the day was over: nothing new can appear.
+    closed = models.BooleanField(default=False)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ('source', 'ticker', 'day')
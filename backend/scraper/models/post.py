@@ -34,7 +34,20 @@ class PostPrediction(models.Model):
     prediction = models.PositiveSmallIntegerField()
     probabilities = models.JSONField()
     model_name = models.CharField(max_length=64)
+    # Registry ID of the model that answered (e.g. 'FinBERT').  model_name is
+    # its architecture, which several IDs share; null for the combined row
+    # of an ensemble and for rows saved before IDs were recorded.
+    model_id = models.CharField(max_length=64, null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    # Set for the per-model rows of an ensemble evaluation; the post's own
+    # (combined) prediction is still reached through Post.post_prediction.
+    ensemble_post = models.ForeignKey(
+        'Post',
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='predictions',
+    )
 
 class Post(models.Model):
     post_id = models.AutoField(primary_key=True)
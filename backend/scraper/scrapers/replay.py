@@ -0,0 +1,168 @@
+"""Offline stand-in for a browser session on X's search page.
+
+``ReplayDriver`` implements the part of the WebDriver API the Twitter
+scraper uses while searching (``get``, ``execute_script``, ``page_source``,
+``get_log``, CDP via ``execute``, ``find_element``) and serves it from
+recorded material instead of x.com:
+
+* search page HTML snapshots (``from_pages``): each scroll reveals the next
+  ``per_scroll`` tweet articles.  The injected extractor's output is built
+  up front, so a replayed scroll costs the scraper what a real one would;
+* captured SearchTimeline responses (``from_responses``): one per scroll,
+  delivered through the performance log the way ``TimelineCapture`` reads it.
+
+With ``offline_redis`` this runs ``TwitterScraper._scrape_ticker`` end to
+end with no network, for tests and the ``bench_scraper_replay`` command.
+"""
+from __future__ import annotations
+
+import json
+from contextlib import contextmanager
+from typing import NamedTuple
+
+from selenium.common.exceptions import NoSuchElementException
+from selenium.common.exceptions import WebDriverException
+
+from .twitter_scraper import _EXTRACT_NEW_TWEETS_JS
+from .twitter_scraper import _PAGE_STATE_JS
+from .twitter_scraper import extract_tweets
+
+PAGE_HEIGHT = 1080  # px the replayed page grows by per step
+
+
+class ReplayStep(NamedTuple):
+    """What one scroll loads: the page after it and the data it brought in."""
+    records: list[dict]  # articles added to the page (as the injected extractor returns them)
+    page_source: str  # the page's HTML ('' when replaying responses)
+    response: str | None = None  # SearchTimeline response body fetched by the scroll
+
+
+def _perf_entry(method: str, **params) -> dict:
+    return {'level': 'INFO', 'timestamp': 0, 'message': json.dumps({'message': {'method': method, 'params': params}})}
+
+
+class ReplayDriver:
+    """Fake WebDriver that plays *steps* back, one per scroll.
+
+    Step 0 is the page as loaded; every scroll loads the next step until
+    they run out, after which the page stops changing (end of results).
+    *on_scroll*, if given, is called with the driver before each scroll
+    takes effect, which is where benchmarks take their per-scroll readings.
+    """
+
+    def __init__(self, steps, on_scroll=None):
+        self.steps = list(steps) or [ReplayStep([], '')]
+        self.on_scroll = on_scroll
+        self.current_url = None
+        self.window_handles = ['replay']
+        self.scrolls = 0
+        # Extractor output and log entries are built here so replaying them is
+        # (like a browser) no work for the Python side.
+        self._records = [json.dumps(step.records) for step in self.steps]
+        self._log_entries = [
+            [
+                _perf_entry('Network.responseReceived', requestId=str(i), response={
+                    'url': 'https://x.com/i/api/graphql/replay/SearchTimeline', 'status': 200,
+                }),
+                _perf_entry('Network.loadingFinished', requestId=str(i)),
+            ] if step.response is not None else []
+            for i, step in enumerate(self.steps)
+        ]
+        self._reset()
+
+    @classmethod
+    def from_pages(cls, pages: list[str], per_scroll: int = 10, **kwargs) -> ReplayDriver:
+        """Replay saved search pages, revealing *per_scroll* new tweets per scroll.
+
+        Tweets repeated across snapshots are shown once, as the injected
+        extractor (which marks what it returned) would.  ``page_source`` is
+        the whole snapshot the current step comes from.
+        """
+        steps, seen = [], set()
+        for page in pages:
+            fresh = []
+            for record in extract_tweets(page):
+                key = record['status_id'] or (record['text'], record['datetime'])
+                if key not in seen:
+                    seen.add(key)
+                    fresh.append(record)
+            steps += [ReplayStep(fresh[i:i + per_scroll], page) for i in range(0, len(fresh), max(1, per_scroll))]
+        return cls(steps, **kwargs)
+
+    @classmethod
+    def from_responses(cls, bodies: list[str], **kwargs) -> ReplayDriver:
+        """Replay captured SearchTimeline response bodies, one per scroll."""
+        return cls([ReplayStep([], '', body) for body in bodies], **kwargs)
+
+    def _reset(self) -> None:
+        self.loaded = 0  # index of the last step on the page
+        self._extracted = 0  # steps already returned by the extractor
+        self._logged = 0  # steps whose responses are already in the performance log
+
+    # --- WebDriver API used by TwitterScraper ---
+
+    def get(self, url: str) -> None:
+        self.current_url = url
+        self._reset()
+
+    @property
+    def page_source(self) -> str:
+        return self.steps[self.loaded].page_source
+
+    def execute_script(self, script: str, *args):
+        if script == _PAGE_STATE_JS:
+            return [PAGE_HEIGHT * (self.loaded + 1), sum(len(s.records) for s in self.steps[:self.loaded + 1])]
+        if script == _EXTRACT_NEW_TWEETS_JS:
+            new = [r for r in self._records[self._extracted:self.loaded + 1] if r != '[]']
+            self._extracted = self.loaded + 1
+            return new[0] if len(new) == 1 else '[' + ','.join(r[1:-1] for r in new) + ']'
+        if 'scrollTo' in script:
+            self.scrolls += 1
+            if self.on_scroll:
+                self.on_scroll(self)
+            self.loaded = min(self.loaded + 1, len(self.steps) - 1)
+            return None
+        if 'readyState' in script:
+            return 'complete'
+        return None
+
+    def get_log(self, log_type: str) -> list[dict]:
+        if log_type != 'performance':
+            return []
+        entries = [entry for step in self._log_entries[self._logged:self.loaded + 1] for entry in step]
+        self._logged = self.loaded + 1
+        return entries
+
+    def execute(self, command: str, params: dict | None = None) -> dict:
+        if command != 'executeCdpCommand':
+            raise WebDriverException(f'{command} is not replayed')
+        if params['cmd'] == 'Network.getResponseBody':
+            return {'value': {'body': self.steps[int(params['params']['requestId'])].response, 'base64Encoded': False}}
+        return {'value': {}}
+
+    def find_element(self, by=None, value=None):
+        # No Latest tab, Retry button or error banner on a replayed page.
+        raise NoSuchElementException(f'{value!r} is not replayed')
+
+    def quit(self) -> None:
+        pass
+
+
+@contextmanager
+def offline_redis(client=None):
+    """Point the scraper's Redis traffic (seen sets, scraper_queue, metrics) at *client*.
+
+    Defaults to a fresh in-memory fakeredis (a dev dependency, imported only
+    here).  Yields the client, so callers can inspect what was enqueued.
+    """
+    from stocknlp import tasks
+
+    if client is None:
+        import fakeredis
+        client = fakeredis.FakeStrictRedis()
+    original = tasks.get_redis
+    tasks.get_redis = lambda: client
+    try:
+        yield client
+    finally:
+        tasks.get_redis = original
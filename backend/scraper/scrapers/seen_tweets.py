@@ -0,0 +1,84 @@
+"""Cross-run record of tweets already sent to the scraper queue.
+
+Every crawl cycle re-walks the configured dates, so without this each cycle
+would enqueue — and the worker re-evaluate — every tweet it finds again.
+Tweets are remembered in one Redis set per (source, ticker, date), holding
+status ids (or a text hash when the id is unknown), so a set expires as a
+whole ``SCRAPER_SEEN_TTL_DAYS`` after its date was last crawled.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+
+import redis
+from django.conf import settings
+
+from stocknlp.metrics import CACHE_REQUESTS
+
+logger = logging.getLogger(__name__)
+
+SEEN_KEY = 'scraper:seen:{source}:{ticker}:{date}'
+
+
+def tweet_key(tweet: dict) -> str:
+    """Status id if known, else a hash of the text (both stable across runs)."""
+    if tweet.get('status_id'):
+        return str(tweet['status_id'])
+    return 'h:' + hashlib.sha1(tweet['text'].encode('utf-8')).hexdigest()[:20]
+
+
+def filter_unseen(tweets: list[dict], client=None) -> list[dict]:
+    """Mark *tweets* as seen and return those no earlier run had marked.
+
+    One pipelined round trip per call: SADD reports which members are new,
+    so checking and marking is a single atomic step per tweet.  If Redis
+    is unreachable every tweet is returned (duplicates are dropped again
+    when the worker saves them).
+    """
+    if not tweets:
+        return []
+    try:
+        if client is None:
+            from stocknlp.tasks import get_redis
+            client = get_redis()
+        ttl = settings.SCRAPER_SEEN_TTL_DAYS * 86400
+        pipe = client.pipeline(transaction=False)
+        keys = set()
+        for tweet in tweets:
+            key = SEEN_KEY.format(source=tweet['source'], ticker=tweet['ticker'], date=tweet['date'])
+            pipe.sadd(key, tweet_key(tweet))
+            keys.add(key)
+        for key in keys:
+            pipe.expire(key, ttl)
+        added = pipe.execute()[:len(tweets)]
+    except redis.RedisError as e:
+        logger.warning('Seen-tweet check failed (%s); enqueueing %d tweets unchecked.', e, len(tweets))
+        return list(tweets)
+
+    unseen = [tweet for tweet, new in zip(tweets, added) if new]
+    if len(unseen) < len(tweets):
+        CACHE_REQUESTS.inc(len(tweets) - len(unseen), cache='scraper_seen', result='hit')
+    if unseen:
+        CACHE_REQUESTS.inc(len(unseen), cache='scraper_seen', result='miss')
+    return unseen
+
+
+def forget_seen(tweets: list[dict], client=None) -> None:
+    """Unmark *tweets* that ``filter_unseen`` passed but that never got enqueued.
+
+    Without this a failed enqueue would leave the tweet marked, and every
+    later crawl would skip it.  Best effort: a Redis error is only logged.
+    """
+    if not tweets:
+        return
+    try:
+        if client is None:
+            from stocknlp.tasks import get_redis
+            client = get_redis()
+        pipe = client.pipeline(transaction=False)
+        for tweet in tweets:
+            pipe.srem(SEEN_KEY.format(source=tweet['source'], ticker=tweet['ticker'], date=tweet['date']), tweet_key(tweet))
+        pipe.execute()
+    except redis.RedisError as e:
+        logger.warning('Could not unmark %d tweets that failed to enqueue: %s', len(tweets), e)
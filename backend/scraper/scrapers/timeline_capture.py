@@ -0,0 +1,131 @@
+"""Read tweets from X's search timeline API responses instead of the DOM.
+
+The browser still loads and scrolls the search page; Chrome's performance
+log (``goog:loggingPrefs``) reports each ``SearchTimeline`` GraphQL response,
+and its body is fetched over CDP (``Network.getResponseBody``).  The JSON
+carries exact status ids, timestamps and engagement counts, so no HTML is
+parsed and no "3.4K"-style labels are guessed at.
+
+``parse_timeline`` turns a response into the same records the DOM
+extractors produce (``twitter_scraper.extract_tweets``), with the counts
+already as integers.
+"""
+from __future__ import annotations
+
+import base64
+import json
+import logging
+import re
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+SEARCH_TIMELINE_URL = re.compile(r'/graphql/[^/]+/SearchTimeline\b')
+LOGGING_PREFS = {'performance': 'ALL'}  # the goog:loggingPrefs capability capture needs
+
+
+def _iter_tweet_results(node):
+    """Yield every ``tweet_results.result`` object in a timeline response, in order."""
+    if isinstance(node, dict):
+        tweet_results = node.get('tweet_results')
+        if isinstance(tweet_results, dict):
+            if tweet_results.get('result'):
+                yield tweet_results['result']
+            return
+        for value in node.values():
+            yield from _iter_tweet_results(value)
+    elif isinstance(node, list):
+        for value in node:
+            yield from _iter_tweet_results(value)
+
+
+def _to_int(value) -> int | None:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_timeline(payload: dict) -> list[dict]:
+    """Tweet records from one SearchTimeline response body.
+
+    Records have the DOM extractors' keys (``text``, ``datetime``, ``likes``,
+    ``retweets``, ``replies``, ``views``, ``status_id``).  As with the DOM
+    path, only English tweets get a ``text``.
+    """
+    records = []
+    for result in _iter_tweet_results(payload):
+        if result.get('__typename') == 'TweetWithVisibilityResults':
+            result = result.get('tweet', {})
+        legacy = result.get('legacy')
+        if not legacy:
+            continue  # TweetTombstone, TweetUnavailable, ...
+        # Tweets over 280 characters keep their full text in note_tweet.
+        note = result.get('note_tweet', {}).get('note_tweet_results', {}).get('result', {})
+        text = note.get('text') or legacy.get('full_text')
+        try:
+            created = datetime.strptime(legacy['created_at'], '%a %b %d %H:%M:%S %z %Y')
+        except (KeyError, ValueError):
+            created = None
+        records.append({
+            'text': text.strip() if text and legacy.get('lang') == 'en' else None,
+            'datetime': created.strftime('%Y-%m-%dT%H:%M:%S.000Z') if created else None,
+            'likes': _to_int(legacy.get('favorite_count')),
+            'retweets': _to_int(legacy.get('retweet_count')),
+            'replies': _to_int(legacy.get('reply_count')),
+            'views': _to_int(result.get('views', {}).get('count')),
+            'status_id': legacy.get('id_str') or result.get('rest_id'),
+        })
+    return records
+
+
+class TimelineCapture:
+    """Collects SearchTimeline responses from one browser's performance log.
+
+    A response body can only be fetched once loading has finished, so
+    requests seen before then are remembered until a later ``drain()``.
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.responses = 0  # timeline responses read so far; 0 means capture isn't working (yet)
+        self.complete = True  # False if the last drain() could not read some response
+        self._pending: set[str] = set()
+
+    def reset(self) -> None:
+        """Drop everything logged so far (call before loading a new search)."""
+        self.driver.get_log('performance')
+        self._pending.clear()
+
+    def drain(self) -> list[dict]:
+        """Tweet records from the timeline responses that finished since the last call."""
+        finished = []
+        for entry in self.driver.get_log('performance'):
+            try:
+                message = json.loads(entry['message'])['message']
+            except (KeyError, TypeError, ValueError):
+                continue
+            method, params = message.get('method'), message.get('params', {})
+            if method == 'Network.responseReceived':
+                if SEARCH_TIMELINE_URL.search(params.get('response', {}).get('url', '')):
+                    self._pending.add(params['requestId'])
+            elif method == 'Network.loadingFinished' and params.get('requestId') in self._pending:
+                self._pending.discard(params['requestId'])
+                finished.append(params['requestId'])
+
+        records = []
+        self.complete = True
+        for request_id in finished:
+            try:
+                reply = self.driver.execute(
+                    'executeCdpCommand', {'cmd': 'Network.getResponseBody', 'params': {'requestId': request_id}},
+                )['value']
+                body = base64.b64decode(reply['body']) if reply.get('base64Encoded') else reply['body']
+                records.extend(parse_timeline(json.loads(body)))
+            except Exception as e:
+                # Bodies can be evicted from Chrome's buffer; the DOM still has those tweets.
+                logger.debug('Could not read timeline response %s: %s', request_id, e)
+                self.complete = False
+                continue
+            self.responses += 1
+        return records
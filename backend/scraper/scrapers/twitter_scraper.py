@@ -1,27 +1,44 @@
 from __future__ import annotations
 
+import json
 import logging
 import os
 import queue
+import re
+import threading
 import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import as_completed
 from datetime import datetime
 from datetime import timedelta
+from datetime import timezone
+from typing import NamedTuple
 from urllib.parse import quote_plus
 
-from bs4 import BeautifulSoup
 from django.apps import apps
 from django.core.exceptions import ObjectDoesNotExist
+from django.db import DatabaseError
+from django.db import connections
 from dotenv import load_dotenv
+from lxml import html as lxml_html
 from selenium import webdriver
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
+from stocknlp.metrics import SCRAPER_PAGE_LOAD
 from stocknlp.tasks import enqueue_scraper_data
 
 from ..scraper import LogTypes
 from ..scraper import Scraper
 from ..scraper import ScraperStates
+from .seen_tweets import filter_unseen
+from .seen_tweets import forget_seen
+from .timeline_capture import LOGGING_PREFS
+from .timeline_capture import TimelineCapture
 # import chromedriver_autoinstaller
 ### DB RELATED IMPORTS ###
 ### INTERNAL IMPORTS ###
@@ -31,6 +48,183 @@ load_dotenv()
 logging.getLogger('selenium.webdriver.remote.remote_connection').setLevel(logging.WARNING)
 logging.getLogger('urllib3.connectionpool').setLevel(logging.WARNING)
 
+# Runs in the page after each scroll. Returns only the tweet articles that have
+# not been returned before, as compact JSON (the same records extract_tweets
+# builds from HTML), and marks them so the next call skips them. This keeps
+# per-scroll work proportional to the new tweets rather than to the whole page
+# (no page_source transfer, no re-parsing old articles).
+_EXTRACT_NEW_TWEETS_JS = r"""
+const out = [];
+for (const article of document.querySelectorAll('article[data-testid="tweet"]:not([data-scraped])')) {
+    article.setAttribute('data-scraped', '1');
+    const text = article.querySelector('div[lang="en"]');
+    const time = article.querySelector('time');
+    const count = (id) => {
+        const button = article.querySelector(`button[data-testid="${id}"]`);
+        return button ? button.textContent.trim() : null;
+    };
+    const views = Array.from(article.querySelectorAll('a[aria-label]'))
+        .find((a) => a.getAttribute('aria-label').toLowerCase().includes('views'));
+    const link = time ? time.closest('a[href*="/status/"]') : null;
+    const status = link ? link.getAttribute('href').match(/\/status\/(\d+)/) : null;
+    out.push({
+        text: text ? text.textContent.trim() : null,
+        datetime: time ? time.getAttribute('datetime') : null,
+        likes: count('like'),
+        retweets: count('retweet'),
+        replies: count('reply'),
+        views: views ? views.getAttribute('aria-label') : null,
+        status_id: status ? status[1] : null,
+    });
+}
+return JSON.stringify(out);
+"""
+_STATUS_ID = re.compile(r'/status/(\d+)')
+# Counts the page's height and tweet articles; a scroll step is done when either changes.
+_PAGE_STATE_JS = (
+    "return [document.body.scrollHeight, "
+    "document.querySelectorAll('article[data-testid=\"tweet\"]').length];"
+)
+POLL_INTERVAL = 0.25  # seconds between checks while waiting on the page
+# Backoff while the page reports rate limiting: 30 s, 60 s, ... capped at 10 min.
+RATE_LIMIT_BACKOFF = 30
+RATE_LIMIT_BACKOFF_MAX = 600
+RATE_LIMIT_RETRIES = 5
+# A day is closed once a crawl that started this long after midnight UTC ran to
+# the end of its results; X can take a while to index the last tweets of a day.
+CLOSE_GRACE = timedelta(hours=1)
+# Keys WebDriver accepts back in add_cookie() (get_cookies() can return more).
+_COOKIE_FIELDS = ('name', 'value', 'domain', 'path', 'secure', 'httpOnly', 'expiry', 'sameSite')
+# The 'lean' browser profile only loads what's needed to read tweet text: the
+# app's own scripts and API calls. Images are never fetched or decoded, and
+# media, fonts and third-party trackers are refused at the network layer
+# (CDP Network.setBlockedURLs). Patterns use CDP's '*' wildcard. Opt-in: the
+# default 'full' profile loads pages as a normal browser would.
+_LEAN_PREFS = {
+    'profile.managed_default_content_settings.images': 2,
+    'profile.default_content_setting_values.notifications': 2,
+    'profile.managed_default_content_settings.media_stream': 2,
+}
+_LEAN_ARGS = (
+    '--blink-settings=imagesEnabled=false',
+    '--disable-remote-fonts',
+    '--autoplay-policy=user-gesture-required',
+    '--mute-audio',
+    '--disable-extensions',
+    '--disable-background-networking',
+)
+_LEAN_BLOCKED_URLS = (
+    '*pbs.twimg.com/*', '*video.twimg.com/*', '*ton.twimg.com/*',
+    '*.jpg*', '*.jpeg*', '*.png*', '*.gif*', '*.webp*',
+    '*.mp4*', '*.m3u8*', '*.m4s*', '*.webm*',
+    '*.woff*', '*.ttf*', '*.otf*',
+    '*google-analytics.com/*', '*googletagmanager.com/*', '*doubleclick.net/*', '*ads-twitter.com/*',
+    '*ads-api.x.com/*', '*ads-api.twitter.com/*',
+)
+
+
+def grid_connection(grid_url: str) -> ChromiumRemoteConnection:
+    """Command executor for a Chrome session on Selenium Grid.
+
+    A plain ``webdriver.Remote(command_executor=url)`` only knows the W3C
+    commands, so ``execute('executeCdpCommand', ...)`` fails before reaching
+    the node.  The Chromium connection adds the ``goog/cdp/execute`` route
+    that request blocking and timeline capture go through.
+    """
+    return ChromiumRemoteConnection(remote_server_addr=grid_url, vendor_prefix='goog', browser_name='chrome')
+
+
+class WorkUnit(NamedTuple):
+    """One search of a crawl cycle: a day for one ticker or an OR-group of tickers.
+
+    ``since_time`` (epoch s) resumes from the group's oldest checkpoint.
+    """
+    tickers: tuple[str, ...]
+    date: str
+    next_date: str
+    since_time: int | None = None
+
+    @property
+    def label(self) -> str:
+        return ', '.join(self.tickers)
+
+
+# Cashtags in tweet text, e.g. $TSLA or $BRK.B.
+_CASHTAG = re.compile(r'\$([A-Za-z]{1,6}(?:\.[A-Za-z]{1,2})?)\b')
+
+
+def match_tickers(text: str, tickers: tuple[str, ...]) -> list[str]:
+    """The *tickers* a tweet cashtags, in order of first mention.
+
+    Bare words are not matched: symbols such as ALL, NOW or IT are ordinary
+    words, so a tweet without a matching cashtag is left unattributed.
+    """
+    wanted = {t.upper(): t for t in tickers}
+    matched = [wanted[tag.upper()] for tag in _CASHTAG.findall(text) if tag.upper() in wanted]
+    return list(dict.fromkeys(matched))
+
+
+def extract_tweets(page_source: str) -> list[dict]:
+    """Tweet records from a page's HTML, in one lxml pass.
+
+    Produces the same records as ``_EXTRACT_NEW_TWEETS_JS`` (raw strings;
+    ``TwitterScraper._parse_tweet`` converts them), for every tweet article
+    on the page.
+    """
+    if not page_source:
+        return []
+    records = []
+    for article in lxml_html.document_fromstring(page_source).iterfind('.//article[@data-testid="tweet"]'):
+        text = article.find('.//div[@lang="en"]')
+        time_el = article.find('.//time')
+        buttons: dict[str, str] = {}
+        for button in article.iterfind('.//button[@data-testid]'):
+            buttons.setdefault(button.get('data-testid'), button.text_content().strip())
+        views = next(
+            (label for label in article.xpath('.//a/@aria-label') if 'views' in label.lower()), None,
+        )
+        status_href = next(
+            iter(time_el.xpath('ancestor::a[contains(@href, "/status/")]/@href')), None,
+        ) if time_el is not None else None
+        status = _STATUS_ID.search(status_href) if status_href else None
+        records.append({
+            'text': text.text_content().strip() if text is not None else None,
+            'datetime': time_el.get('datetime') if time_el is not None else None,
+            'likes': buttons.get('like'),
+            'retweets': buttons.get('retweet'),
+            'replies': buttons.get('reply'),
+            'views': views,
+            'status_id': status.group(1) if status else None,
+        })
+    return records
+
+
+def _parse_count(text: str | int | None) -> int | None:
+    """Engagement count as shown on a tweet button ('12', '3K'); None if absent or unparseable.
+
+    Counts captured from the timeline API are already exact ints and pass through.
+    """
+    if isinstance(text, int):
+        return text
+    if not text:
+        return None
+    try:
+        return int(text.replace('K', '000').replace('M', '000000'))
+    except ValueError:
+        return None
+
+
+def _parse_views(aria_label: str | int | None) -> int | None:
+    """View count from an analytics link label such as '1234 views. View post analytics'."""
+    if isinstance(aria_label, int):
+        return aria_label
+    if not aria_label:
+        return None
+    try:
+        return int(''.join(filter(str.isdigit, aria_label.lower().split('views')[0])))
+    except ValueError:
+        return None
+
 
 class TwitterScraper(Scraper):
 
@@ -40,6 +234,13 @@ class TwitterScraper(Scraper):
         'source': [{'name': 'twitter', 'base_url': 'https://x.com/search?q='}],
         'max_time_running': None,
         'threads': 1,
+        'scroll_timeout': 5,  # ceiling (s) on waiting for more tweets after a scroll
+        'ticker_group_size': 1,  # tickers OR-ed into one search ($A OR $B ...); 1 = one search each
+        # 'dom': scrape the rendered page; 'network': read the timeline API responses
+        # (opt-in until proven against the deployed Chrome/Grid).
+        'capture_mode': 'dom',
+        'browser_profile': 'full',  # 'full': load pages as-is; 'lean': no images, media, fonts or trackers
+        'headless': False,  # run Chrome with --headless=new
         'twitter_query': {
             'params': {
                 'filter': ['links', 'replies', 'media&src=typed_query'],
@@ -51,9 +252,18 @@ class TwitterScraper(Scraper):
     }
 
     def __init__(self):
-        self.data_manager = apps.get_app_config('scraper').DATA_MANAGER
         # Bootstrap with defaults — load_config() overwrites this from DB before run.
         super().__init__(self._build_fallback_config())
+        self.instance = None
+        self.sessions: list = []  # every open browser, ``instance`` (the one that logged in) first
+        self._task_lock = threading.Lock()
+        # Per-session TimelineCapture (None once capture has failed for that browser).
+        self._captures = weakref.WeakKeyDictionary()
+
+    @property
+    def data_manager(self):
+        # Built on first use; searching and parsing tweets never need the models.
+        return apps.get_app_config('scraper').DATA_MANAGER
 
     @staticmethod
     def _get_credentials() -> dict:
@@ -75,6 +285,11 @@ class TwitterScraper(Scraper):
             'credentials': cls._get_credentials(),
             'max_time_running': defaults['max_time_running'],
             'threads': defaults['threads'],
+            'scroll_timeout': defaults['scroll_timeout'],
+            'ticker_group_size': defaults['ticker_group_size'],
+            'capture_mode': defaults['capture_mode'],
+            'browser_profile': defaults['browser_profile'],
+            'headless': defaults['headless'],
             'twitter_query': {
                 'start_date': yesterday,
                 'end_date': today,
@@ -108,6 +323,11 @@ class TwitterScraper(Scraper):
                 'credentials': self._get_credentials(),
                 'max_time_running': scrapers_config.get('max_time_running', fallback['max_time_running']),
                 'threads': scrapers_config.get('threads', fallback['threads']),
+                'scroll_timeout': scrapers_config.get('scroll_timeout', fallback['scroll_timeout']),
+                'ticker_group_size': scrapers_config.get('ticker_group_size', fallback['ticker_group_size']),
+                'capture_mode': scrapers_config.get('capture_mode', fallback['capture_mode']),
+                'browser_profile': scrapers_config.get('browser_profile', fallback['browser_profile']),
+                'headless': scrapers_config.get('headless', fallback['headless']),
                 'twitter_query': {
                     'start_date': tq.get('start_date', fb_tq['start_date']),
                     'end_date': tq.get('end_date', fb_tq['end_date']),
@@ -154,58 +374,150 @@ class TwitterScraper(Scraper):
         except Config.DoesNotExist:
             raise ValueError(f"Config with ID {config_id} not found.")
 
+    def _new_driver(self):
+        """Start one browser session (local Chrome or a Selenium Grid node)."""
+        from django.conf import settings as django_settings
+
+        chrome_options = webdriver.ChromeOptions()
+        chrome_options.add_argument('--no-sandbox')
+        chrome_options.add_argument('--disable-dev-shm-usage')
+        chrome_options.add_argument('--window-size=1920,1080')
+        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
+        chrome_options.add_experimental_option('excludeSwitches', ['enable-automation'])
+        chrome_options.add_experimental_option('useAutomationExtension', False)
+        chrome_options.add_argument(
+            'user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
+            'AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36'
+        )
+        if self._capture_mode() == 'network':
+            chrome_options.set_capability('goog:loggingPrefs', LOGGING_PREFS)
+        lean = self._browser_profile() == 'lean'
+        if lean:
+            chrome_options.add_experimental_option('prefs', _LEAN_PREFS)
+            for argument in _LEAN_ARGS:
+                chrome_options.add_argument(argument)
+        if self.config.get('headless'):
+            chrome_options.add_argument('--headless=new')
+
+        scraper_mode = os.getenv('SCRAPER_MODE', 'grid')
+        grid_url = getattr(django_settings, 'SELENIUM_GRID_URL', None)
+
+        if scraper_mode == 'local' or not grid_url:
+            driver = webdriver.Chrome(options=chrome_options)
+            self._log(LogTypes.MESSAGE, 'Using local Chrome browser.')
+        else:
+            driver = webdriver.Remote(
+                command_executor=grid_connection(grid_url),
+                options=chrome_options,
+            )
+            self._log(LogTypes.MESSAGE, f'Connected to Selenium Grid at {grid_url}')
+
+        # Remove navigator.webdriver flag via CDP
+        driver.execute_script(
+            "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
+        )
+        if lean:
+            self._block_heavy_requests(driver)
+        return driver
+
+    def _browser_profile(self) -> str:
+        return self.config.get('browser_profile') or self._DEFAULT_CONFIG['browser_profile']
+
+    def _block_heavy_requests(self, driver) -> None:
+        """Refuse media, font and tracker requests in *driver* (the lean profile's network half).
+
+        Goes through chromedriver's CDP endpoint, which local Chrome and Grid
+        sessions (via ``grid_connection``) both reach. If it fails the session
+        still works, just heavier.
+        """
+        try:
+            for cmd, params in (
+                ('Network.enable', {}),
+                ('Network.setBlockedURLs', {'urls': list(_LEAN_BLOCKED_URLS)}),
+            ):
+                driver.execute('executeCdpCommand', {'cmd': cmd, 'params': params})
+        except Exception as e:
+            self._log(LogTypes.WARNING, f'Could not block media requests ({e}); using the full page load.')
+
+    @staticmethod
+    def _is_alive(driver) -> bool:
+        try:
+            _ = driver.window_handles  # raises if session is dead
+            return True
+        except Exception:
+            return False
+
     def _setup_instances(self) -> None:
         # Reuse existing browser session if still alive
-        try:
-            if getattr(self, 'instance', None):
-                _ = self.instance.window_handles  # raises if session is dead
+        if getattr(self, 'instance', None):
+            if self._is_alive(self.instance):
                 self._log(LogTypes.MESSAGE, 'Reusing existing browser session.')
                 return
-        except Exception:
             self._log(LogTypes.WARNING, 'Previous browser session is dead — creating a new one.')
             self.instance = None
 
         try:
-            from django.conf import settings as django_settings
-
             self._set_status(ScraperStates.SETTING_UP)
-            chrome_options = webdriver.ChromeOptions()
-            chrome_options.add_argument('--no-sandbox')
-            chrome_options.add_argument('--disable-dev-shm-usage')
-            chrome_options.add_argument('--window-size=1920,1080')
-            chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-            chrome_options.add_experimental_option('excludeSwitches', ['enable-automation'])
-            chrome_options.add_experimental_option('useAutomationExtension', False)
-            chrome_options.add_argument(
-                'user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
-                'AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36'
-            )
-
-            scraper_mode = os.getenv('SCRAPER_MODE', 'grid')
-            grid_url = getattr(django_settings, 'SELENIUM_GRID_URL', None)
-
-            if scraper_mode == 'local' or not grid_url:
-                self.instance = webdriver.Chrome(options=chrome_options)
-                self._log(LogTypes.MESSAGE, 'Using local Chrome browser.')
-            else:
-                self.instance = webdriver.Remote(
-                    command_executor=grid_url,
-                    options=chrome_options,
-                )
-                self._log(LogTypes.MESSAGE, f'Connected to Selenium Grid at {grid_url}')
-
-            # Remove navigator.webdriver flag via CDP
-            self.instance.execute_script(
-                "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
-            )
+            self.instance = self._new_driver()
         except Exception as e:
             self._log(LogTypes.ERROR, f"Failed to setup driver instance: {e}")
             raise
 
-    def _page_says_error(self) -> bool:
+    def _open_sessions(self, count: int) -> list:
+        """Return ``count`` logged-in browser sessions, the primary ``instance`` first.
+
+        Extra sessions are started next to the primary one and given its
+        login cookies, so only the primary ever goes through the login flow.
+        Live extras from a previous run are reused; surplus ones are closed.
+        """
+        extras = [d for d in self.sessions[1:] if d is not self.instance and self._is_alive(d)]
+        for driver in extras[max(count - 1, 0):]:
+            self._quit(driver)
+        extras = extras[:max(count - 1, 0)]
+
+        cookies = None
+        while len(extras) < count - 1 and not self.stop_event.is_set():
+            try:
+                driver = self._new_driver()
+                if cookies is None:
+                    cookies = self.instance.get_cookies()
+                driver.get('https://x.com')  # cookies can only be set for the current domain
+                for cookie in cookies:
+                    driver.add_cookie({k: v for k, v in cookie.items() if k in _COOKIE_FIELDS})
+                driver.get('https://x.com/home')
+            except Exception as e:
+                self._log(LogTypes.WARNING, f'Could not open extra browser session: {e}')
+                break
+            extras.append(driver)
+
+        self.sessions = [self.instance] + extras
+        self._log(LogTypes.MESSAGE, f'{len(self.sessions)} browser session(s) ready.')
+        return self.sessions
+
+    @staticmethod
+    def _quit(driver) -> None:
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def close_sessions(self) -> None:
+        """Quit every browser session, the primary one included."""
+        for driver in {id(d): d for d in [*self.sessions, getattr(self, 'instance', None)] if d}.values():
+            self._quit(driver)
+        self.sessions = []
+        self.instance = None
+
+    @staticmethod
+    def _wait_until_loaded(driver, timeout: float = 10) -> None:
+        WebDriverWait(driver, timeout, poll_frequency=POLL_INTERVAL).until(
+            lambda d: d.execute_script('return document.readyState') == 'complete',
+        )
+
+    def _page_says_error(self, driver=None) -> bool:
         """Return True if the current page contains a rate-limit / try-again error."""
         try:
-            body = self.instance.find_element(By.TAG_NAME, 'body').text.lower()
+            body = (driver or self.instance).find_element(By.TAG_NAME, 'body').text.lower()
             return 'try again later' in body or 'something went wrong' in body
         except Exception:
             return False
@@ -224,13 +536,22 @@ class TwitterScraper(Scraper):
                 self._log(LogTypes.ERROR, f'Could not find text field for {label}: {e}')
                 return False
 
-            wait = 5 * attempt  # 5 s, 10 s, 15 s …
-            time.sleep(wait)
+            # Move on as soon as the next step replaces the field; an error
+            # banner or the ceiling (5 s, 10 s, 15 s …) ends the wait too.
+            wait = 5 * attempt
+            try:
+                WebDriverWait(self.instance, wait, poll_frequency=POLL_INTERVAL).until(
+                    lambda d: EC.staleness_of(field)(d) or self._page_says_error(),
+                )
+            except TimeoutException:
+                pass
 
             if not self._page_says_error():
                 return True
 
             self._log(LogTypes.WARNING, f'"Try again later" after {label} — waiting {wait}s before retry.')
+            if self.stop_event.wait(wait):
+                return False
 
         self._log(LogTypes.ERROR, f'All retries exhausted for {label}.')
         return False
@@ -266,13 +587,19 @@ class TwitterScraper(Scraper):
         password_input.send_keys(creds['password'])
         password_input.send_keys(Keys.RETURN)
 
-    def _generate_twitter_query(self, ticker: str, since_date: str, until_date: str) -> list[str]:
+    def _generate_twitter_query(
+        self, ticker: str | tuple[str, ...], since_date: str, until_date: str, since_time: int | None = None,
+    ) -> list[str]:
         try:
             qp = self.config['twitter_query']['params']
             filters = ' '.join(
                 [f"-filter:{f}" for f in qp['filter']],
             )
-            query = f"{ticker} lang:{qp['lang']} since:{since_date} until:{until_date} {filters}"
+            if not isinstance(ticker, str):
+                # A group searches its cashtags together; a lone ticker keeps the plain term.
+                ticker = ticker[0] if len(ticker) == 1 else '(' + ' OR '.join(f'${t}' for t in ticker) + ')'
+            since = f'since_time:{since_time}' if since_time else f'since:{since_date}'
+            query = f"{ticker} lang:{qp['lang']} {since} until:{until_date} {filters}"
             return [query]
         except Exception as e:
             self._log(LogTypes.ERROR, f'Failed to generate query for {ticker}: {e}')
@@ -300,7 +627,10 @@ class TwitterScraper(Scraper):
             )
             accept_btn.click()
             self._log(LogTypes.MESSAGE, 'Cookie consent accepted.')
-            time.sleep(2)
+            try:
+                WebDriverWait(self.instance, 5, poll_frequency=POLL_INTERVAL).until(EC.staleness_of(accept_btn))
+            except TimeoutException:
+                pass
         except Exception:
             self._log(LogTypes.MESSAGE, 'No cookie banner found, continuing.')
 
@@ -309,7 +639,7 @@ class TwitterScraper(Scraper):
 
         # Step 1: go to x.com, accept cookies
         self.instance.get('https://x.com')
-        time.sleep(3)
+        self._wait_until_loaded(self.instance)
         self._accept_cookies()
 
         if login_mode == 'manual':
@@ -332,8 +662,7 @@ class TwitterScraper(Scraper):
         # Auto mode
         try:
             self.instance.get('https://x.com/i/flow/login')
-            time.sleep(3)
-            self._enter_credentials()
+            self._enter_credentials()  # waits for the identifier field itself
             self._wait_for_homepage()
             self._log(LogTypes.MESSAGE, 'Login successful.')
         except Exception as e:
@@ -350,105 +679,128 @@ class TwitterScraper(Scraper):
             self._log(LogTypes.ERROR, f"Homepage did not load. URL: {self.instance.current_url}")
             raise
 
-    def _extract_tweet_metadata(self, tweet_html: str) -> dict:
-        soup = BeautifulSoup(tweet_html, 'html.parser')
+    def _parse_tweet(self, item: dict, ticker: str) -> dict | None:
+        """Build a ready-to-enqueue dict from one tweet record (see ``extract_tweets``).
 
-        def extract_number_from_button(data_testid):
-            button = soup.find('button', {'data-testid': data_testid})
-            if button:
-                try:
-                    return int(button.get_text(strip=True).replace('K', '000').replace('M', '000000'))
-                except ValueError:
-                    pass
+        Returns None if the tweet should be skipped.
+        """
+        text = item.get('text')
+        date_str = item.get('datetime')
+        if not text or not date_str:
+            self._log(LogTypes.WARNING, 'Skipping tweet due to missing text or date.')
             return None
 
-        likes = extract_number_from_button('like')
-        retweets = extract_number_from_button('retweet')
-        replies = extract_number_from_button('reply')
-
-        views_div = soup.find(
-            'a', {'aria-label': lambda x: x and 'views' in x.lower()},
-        )
-        views = None
-        if views_div:
-            aria_label = views_div['aria-label']
-            try:
-                views = int(
-                    ''.join(filter(str.isdigit, aria_label.split('views')[0])),
-                )
-            except ValueError:
-                views = None
-
-        return {'likes': likes, 'retweets': retweets, 'replies': replies, 'views': views}
+        return {
+            'likes': _parse_count(item.get('likes')),
+            'retweets': _parse_count(item.get('retweets')),
+            'replies': _parse_count(item.get('replies')),
+            'views': _parse_views(item.get('views')),
+            'status_id': item.get('status_id'),
+            'ticker': ticker,
+            'date': datetime.fromisoformat(date_str[:-1]).date(),
+            'created_at': date_str,
+            'text': text,
+            'source': self.config['source'][0]['name'],
+        }
 
+    def _capture_mode(self) -> str:
+        return self.config.get('capture_mode') or self._DEFAULT_CONFIG['capture_mode']
 
-    def _parse_tweet(self, tweet_html, ticker: str) -> dict | None:
-        """Extract text, date, and metadata from a single tweet article element.
+    def _capture_for(self, driver) -> TimelineCapture | None:
+        """*driver*'s timeline capture, or None in DOM mode or after capture failed on it."""
+        if self._capture_mode() != 'network':
+            return None
+        if driver not in self._captures:
+            self._captures[driver] = TimelineCapture(driver)
+        return self._captures[driver]
 
-        Returns a ready-to-enqueue dict, or None if the tweet should be skipped.
-        """
-        text_div = tweet_html.find('div', {'lang': 'en'})
-        text = text_div.get_text(strip=True) if text_div else None
-        time_el = tweet_html.find('time')
-        date_str = time_el['datetime'] if time_el else None
+    def _disable_capture(self, driver, error: Exception) -> None:
+        self._log(LogTypes.WARNING, f'Timeline capture unavailable ({error}) — scraping the page instead.')
+        self._captures[driver] = None
 
-        if not text or not date_str:
-            self._log(LogTypes.WARNING, 'Skipping tweet due to missing text or date.')
-            return None
+    def _collect_new_tweets(self, driver) -> list[dict]:
+        """Tweet records added to *driver*'s page since the previous call.
 
-        tweet_data = self._extract_tweet_metadata(str(tweet_html))
-        tweet_data['ticker'] = ticker
-        tweet_data['date'] = datetime.fromisoformat(date_str[:-1]).date()
-        tweet_data['text'] = text
-        tweet_data['source'] = self.config['source'][0]['name']
-        return tweet_data
+        In network capture mode these come from the timeline API responses.
+        The page itself is scraped instead while capture has yet to read a
+        response, and in addition on steps where a response could not be
+        read; the caller's ``seen`` set drops the resulting repeats.
 
-    def _scroll_and_collect(self, ticker: str) -> int:
-        """Scroll the current search results page, parse tweets, and enqueue them.
+        Page scraping uses the injected extractor; if the script fails, it
+        falls back to one lxml pass over the full page source.
+        """
+        records = []
+        capture = self._capture_for(driver)
+        if capture is not None:
+            try:
+                records = capture.drain()
+            except Exception as e:
+                self._disable_capture(driver, e)
+            else:
+                if capture.responses and capture.complete:
+                    return records
+        return records + self._scrape_new_tweets(driver)
 
-        Returns the number of tweets collected.
+    def _scrape_new_tweets(self, driver) -> list[dict]:
+        """Tweet records rendered on *driver*'s page since the previous call."""
+        try:
+            return json.loads(driver.execute_script(_EXTRACT_NEW_TWEETS_JS))
+        except Exception as e:
+            self._log(LogTypes.WARNING, f'Incremental extraction failed ({e}) — parsing full page.')
+            return extract_tweets(driver.page_source)
+
+    def _scroll_and_collect(self, ticker: str | tuple[str, ...], driver=None, progress=None, stats=None) -> int:
+        """Scroll the current search results page, parse new tweets, and enqueue them.
+
+        For a group of tickers each tweet is enqueued once for every ticker
+        it cashtags (see ``match_tickers``); tweets that cashtag none of them
+        are dropped. *driver* defaults to the primary session; *progress* is
+        called with the running count after each enqueued tweet. If given, *stats* receives
+        ``newest`` (ISO time of the newest tweet on the page) and ``exhausted``
+        (True if the results ran out, rather than the scraper stopping or
+        giving up on rate limits). Returns the number of tweets collected.
         """
+        tickers = (ticker,) if isinstance(ticker, str) else tuple(ticker)
+        stats = {} if stats is None else stats
+        stats.update(newest=None, exhausted=False)
+        unmatched = 0
+        driver = driver or self.instance
+        progress = progress or (lambda n: self._update_task({'count': n}))
+        timeout = self.config.get('scroll_timeout') or self._DEFAULT_CONFIG['scroll_timeout']
         count = 0
-        seen: set[tuple[str, str]] = set()
-        last_height = self.instance.execute_script('return document.body.scrollHeight')
+        skipped = 0
+        # Keyed by status id when known: X re-renders tweets scrolled back into
+        # view as new nodes, so the extractor can return the same tweet twice.
+        seen: set = set()
+        state = self._page_state(driver)
+        clicked_latest = False
+        rate_limited = 0
 
-        while True:
-            if self.stop_event.is_set():
-                break
-
-            self.instance.execute_script('window.scrollTo(0, document.body.scrollHeight);')
-            time.sleep(5)
-            new_height = self.instance.execute_script('return document.body.scrollHeight')
-
-            if new_height == last_height:
-                try:
-                    latest_button = self.instance.find_element(
-                        By.XPATH, "//span[text()='Latest']",
-                    )
-                    latest_button.click()
-                    time.sleep(2)
-                except Exception:
-                    break
-
-            last_height = new_height
-            page_source = self.instance.page_source
-            soup = BeautifulSoup(page_source, 'html.parser')
-            articles = soup.find_all('article', {'data-testid': 'tweet'})
+        while not self.stop_event.is_set():
+            driver.execute_script('window.scrollTo(0, document.body.scrollHeight);')
+            new_state = self._wait_for_more(driver, state, timeout)
 
-            for article in articles:
+            # Collect before deciding whether to stop: a stalled page can still
+            # hold tweets no earlier step returned (e.g. a single page of results).
+            fresh = []
+            for item in self._collect_new_tweets(driver):
                 try:
-                    tweet_data = self._parse_tweet(article, ticker)
+                    tweet_data = self._parse_tweet(item, tickers[0])
                     if tweet_data is None:
                         continue
 
-                    fingerprint = (tweet_data['text'], str(tweet_data['date']))
+                    fingerprint = tweet_data.get('status_id') or (tweet_data['text'], str(tweet_data['date']))
                     if fingerprint in seen:
                         continue
                     seen.add(fingerprint)
-
-                    enqueue_scraper_data(tweet_data)
-                    count += 1
-                    self._update_task({'count': count})
+                    if stats['newest'] is None or tweet_data['created_at'] > stats['newest']:
+                        stats['newest'] = tweet_data['created_at']
+                    if len(tickers) == 1:
+                        fresh.append(tweet_data)
+                        continue
+                    matched = match_tickers(tweet_data['text'], tickers)
+                    unmatched += not matched
+                    fresh.extend({**tweet_data, 'ticker': t} for t in matched)
                 except KeyError as e:
                     self._log(LogTypes.ERROR, f'Missing key while processing tweet: {e}')
                 except ValueError as e:
@@ -456,27 +808,112 @@ class TwitterScraper(Scraper):
                 except Exception as e:
                     self._log(LogTypes.ERROR, f'Unexpected error processing tweet: {e}')
 
+            # Tweets an earlier crawl already enqueued are skipped here, before
+            # they cost the worker another inference.
+            unseen = filter_unseen(fresh)
+            skipped += len(fresh) - len(unseen)
+            failed = []
+            for tweet_data in unseen:
+                try:
+                    enqueue_scraper_data(tweet_data)
+                    count += 1
+                    progress(count)
+                except Exception as e:
+                    failed.append(tweet_data)
+                    self._log(LogTypes.ERROR, f'Unexpected error enqueueing tweet: {e}')
+            # Marked as seen but never queued: unmark so the next crawl retries them.
+            forget_seen(failed)
+
+            if new_state is None:
+                if self._page_says_error(driver):
+                    if rate_limited >= RATE_LIMIT_RETRIES or not self._back_off(driver, rate_limited):
+                        break
+                    rate_limited += 1
+                    continue
+                # End of results: switch to the Latest tab once, then stop at the next stall.
+                if clicked_latest:
+                    stats['exhausted'] = True
+                    break
+                try:
+                    latest_button = driver.find_element(
+                        By.XPATH, "//span[text()='Latest']",
+                    )
+                    latest_button.click()
+                except Exception as e:
+                    # Only the Top tab was read: leave the day open so a later crawl revisits it.
+                    self._log(LogTypes.WARNING, f"Could not open the Latest tab for '{', '.join(tickers)}': {e}")
+                    break
+                clicked_latest = True
+                new_state = self._wait_for_more(driver, state, timeout)
+            else:
+                rate_limited = 0
+
+            state = new_state or self._page_state(driver)
+
+        label = ', '.join(tickers)
+        if skipped:
+            self._log(LogTypes.MESSAGE, f"Skipped {skipped} '{label}' tweets already enqueued by earlier crawls.")
+        if unmatched:
+            self._log(LogTypes.MESSAGE, f"Dropped {unmatched} '{label}' tweets that name none of the tickers.")
         return count
 
-    def _scrape_ticker(self, ticker: str, since_date: str, until_date: str) -> int:
-        """Search for a single ticker on a single day and collect all tweets.
+    @staticmethod
+    def _page_state(driver) -> tuple:
+        return tuple(driver.execute_script(_PAGE_STATE_JS))
+
+    def _wait_for_more(self, driver, before: tuple, timeout: float) -> tuple | None:
+        """Poll until the page differs from *before* (taller or more articles); None after *timeout*."""
+        def changed(d):
+            state = self._page_state(d)
+            return state if state != before else False
+
+        try:
+            return WebDriverWait(driver, timeout, poll_frequency=POLL_INTERVAL).until(changed)
+        except TimeoutException:
+            return None
+
+    def _back_off(self, driver, attempt: int) -> bool:
+        """Wait out a rate-limit banner, then hit Retry. False if the scraper was stopped meanwhile."""
+        delay = min(RATE_LIMIT_BACKOFF * 2 ** attempt, RATE_LIMIT_BACKOFF_MAX)
+        self._log(LogTypes.WARNING, f'Page reports rate limiting — backing off {delay}s (attempt {attempt + 1}).')
+        if self.stop_event.wait(delay):
+            return False
+        try:
+            driver.find_element(By.XPATH, "//span[text()='Retry']").click()
+        except Exception:
+            pass
+        return True
+
+    def _scrape_ticker(
+        self, ticker: str | tuple[str, ...], since_date: str, until_date: str,
+        driver=None, progress=None, since_time: int | None = None, stats=None,
+    ) -> int:
+        """Search for a ticker (or OR-group of tickers) on a single day and collect all tweets.
 
+        With *since_time* only tweets from that moment on are searched.
         Returns the number of tweets found.
         """
+        driver = driver or self.instance
         queries = self._generate_twitter_query(
-            ticker=ticker, since_date=since_date, until_date=until_date,
+            ticker=ticker, since_date=since_date, until_date=until_date, since_time=since_time,
         )
         if not queries:
             self._log(LogTypes.ERROR, f'No query generated for {ticker}, skipping.')
             return 0
 
         url = self.config['source'][0]['base_url'] + quote_plus(queries[0])
-        self.instance.get(url)
-        WebDriverWait(self.instance, 10).until(
-            lambda d: d.execute_script('return document.readyState') == 'complete',
-        )
+        capture = self._capture_for(driver)
+        if capture is not None:
+            try:
+                capture.reset()  # responses still logged from the previous search belong to it
+            except Exception as e:
+                self._disable_capture(driver, e)
+        started = time.perf_counter()
+        driver.get(url)
+        self._wait_until_loaded(driver)
+        SCRAPER_PAGE_LOAD.observe(time.perf_counter() - started, profile=self._browser_profile())
 
-        return self._scroll_and_collect(ticker)
+        return self._scroll_and_collect(ticker, driver=driver, progress=progress, stats=stats)
 
     def _wait_if_paused(self) -> bool:
         """Block while paused. Returns False if stop was requested during the wait."""
@@ -484,6 +921,178 @@ class TwitterScraper(Scraper):
             time.sleep(1)
         return not self.stop_event.is_set()
 
+    def _gen_work_units(self) -> queue.Queue:
+        """Work units for one crawl cycle, newest date first.
+
+        Days a checkpoint marks closed are left out; days with a checkpoint
+        only search from the newest tweet seen there.
+        """
+        units: queue.Queue = queue.Queue()
+        tickers = self.config['twitter_query']['params']['ticker']
+        group_size = max(1, int(self.config.get('ticker_group_size') or 1))
+        checkpoints = self._load_checkpoints(tickers)
+        skipped = 0
+        dates_pipeline = self._gen_dates_pipeline()
+        while not dates_pipeline.empty():
+            current_date = dates_pipeline.get()
+            next_date = (
+                datetime.strptime(current_date, '%Y-%m-%d') + timedelta(days=1)
+            ).strftime('%Y-%m-%d')
+            since_times: dict[str, int | None] = {}
+            for ticker in tickers:
+                checkpoint = checkpoints.get((ticker, current_date))
+                if checkpoint is not None and checkpoint.closed:
+                    skipped += 1
+                    continue
+                newest = checkpoint.newest_tweet_at if checkpoint is not None else None
+                since_times[ticker] = int(newest.timestamp()) if newest else None
+            open_tickers = list(since_times)
+            for i in range(0, len(open_tickers), group_size):
+                group = tuple(open_tickers[i:i + group_size])
+                # The group search starts at its least advanced ticker.
+                marks = [since_times[t] for t in group]
+                since_time = None if None in marks else min(marks)
+                units.put(WorkUnit(group, current_date, next_date, since_time))
+        if skipped:
+            self._log(LogTypes.MESSAGE, f'Skipping {skipped} ticker-days already crawled to the end.')
+        return units
+
+    def _load_checkpoints(self, tickers: list[str]) -> dict:
+        """{(ticker, 'YYYY-MM-DD'): CrawlCheckpoint} for the configured date range."""
+        tq = self.config['twitter_query']
+        try:
+            CrawlCheckpoint = apps.get_model('scraper', 'CrawlCheckpoint')
+            rows = CrawlCheckpoint.objects.filter(
+                source=self.config['source'][0]['name'],
+                ticker__in=tickers,
+                day__range=(tq['start_date'], tq['end_date']),
+            )
+            return {(row.ticker, row.day.strftime('%Y-%m-%d')): row for row in rows}
+        except DatabaseError as e:
+            self._log(LogTypes.WARNING, f'Could not read crawl checkpoints ({e}) — crawling every day.')
+            return {}
+
+    def _save_checkpoint(self, unit: WorkUnit, stats: dict, started_at: datetime) -> None:
+        """Record a finished unit: advance the day's high-water mark, close it if it is over."""
+        if not stats.get('exhausted'):
+            return  # stopped or rate-limited part-way: the page order gives no safe mark
+        day_end = datetime.strptime(unit.next_date, '%Y-%m-%d').replace(tzinfo=timezone.utc)
+        newest = datetime.fromisoformat(stats['newest'].replace('Z', '+00:00')) if stats.get('newest') else None
+        try:
+            CrawlCheckpoint = apps.get_model('scraper', 'CrawlCheckpoint')
+            # A group search covered the same time span for each of its tickers.
+            for ticker in unit.tickers:
+                checkpoint, _ = CrawlCheckpoint.objects.get_or_create(
+                    source=self.config['source'][0]['name'], ticker=ticker, day=unit.date,
+                )
+                if newest and (checkpoint.newest_tweet_at is None or newest > checkpoint.newest_tweet_at):
+                    checkpoint.newest_tweet_at = newest
+                checkpoint.closed = started_at >= day_end + CLOSE_GRACE
+                checkpoint.save()
+        except DatabaseError as e:
+            self._log(LogTypes.WARNING, f"Could not save checkpoint for '{unit.label}' on {unit.date}: {e}")
+
+    def _start_cycle(self, units_total: int, sessions: int) -> None:
+        with self._task_lock:
+            self._cycle_done_count = 0
+            self._update_task({
+                'source': self.config['source'][0]['name'],
+                'date': None,
+                'ticker': None,
+                'count': 0,
+                'units_done': 0,
+                'units_total': units_total,
+                'sessions': {},
+            }, overwrite=True)
+            self._log(LogTypes.MESSAGE, f'Crawl cycle: {units_total} searches over {sessions} session(s).')
+
+    def _report_progress(self, session: str, unit: WorkUnit, count: int, finished: bool = False) -> None:
+        """Fold one session's progress into ``current_task``.
+
+        ``sessions`` lists what each browser is working on; the top-level
+        ``ticker``/``date``/``count`` keep the single-session shape the
+        dashboard reads (``count`` is the cycle total across sessions).
+        """
+        with self._task_lock:
+            active = dict(self.current_task.get('sessions') or {})
+            update = {}
+            if finished:
+                active.pop(session, None)
+                self._cycle_done_count += count
+                update['units_done'] = self.current_task.get('units_done', 0) + 1
+            else:
+                active[session] = {'ticker': unit.label, 'date': unit.date, 'count': count}
+            if active:
+                update['ticker'] = ', '.join(dict.fromkeys(s['ticker'] for s in active.values()))
+                update['date'] = max(s['date'] for s in active.values())
+            update['count'] = self._cycle_done_count + sum(s['count'] for s in active.values())
+            update['sessions'] = active
+            self._update_task(update)
+
+    def _session_worker(self, name: str, driver, units: queue.Queue) -> None:
+        """Scrape units from the shared queue in one browser until it is empty or the scraper stops."""
+        while self._wait_if_paused():
+            try:
+                unit = units.get_nowait()
+            except queue.Empty:
+                return
+            tickers, current_date, next_date, since_time = unit
+            count = 0
+            stats: dict = {}
+
+            def progress(n: int) -> None:
+                nonlocal count
+                count = n
+                self._report_progress(name, unit, n)
+
+            self._report_progress(name, unit, 0)
+            started = time.monotonic()
+            started_at = datetime.now(timezone.utc)
+            try:
+                count = self._scrape_ticker(
+                    tickers, current_date, next_date,
+                    driver=driver, progress=progress, since_time=since_time, stats=stats,
+                )
+                self._save_checkpoint(unit, stats, started_at)
+                elapsed = time.monotonic() - started
+                self._log(
+                    LogTypes.MESSAGE,
+                    f"[{name}] Found {count} tweets for '{unit.label}' on {current_date} "
+                    f"in {elapsed:.0f}s ({count * 60 / max(elapsed, 1e-9):.1f}/min)",
+                )
+            except Exception as e:
+                self._log(LogTypes.ERROR, f"[{name}] Scraping '{unit.label}' on {current_date} failed: {e}")
+                if not self._is_alive(driver):
+                    self._log(LogTypes.ERROR, f'[{name}] Browser session is gone — leaving the rest to other sessions.')
+                    return
+            finally:
+                self._report_progress(name, unit, count, finished=True)
+
+    def _crawl(self) -> None:
+        """Run one crawl cycle: every work unit, spread over ``threads`` browser sessions."""
+        units = self._gen_work_units()
+        wanted = max(1, int(self.config.get('threads') or 1))
+        sessions = self._open_sessions(min(wanted, max(units.qsize(), 1)))
+        self._start_cycle(units.qsize(), len(sessions))
+        with ThreadPoolExecutor(max_workers=len(sessions), thread_name_prefix='twitter_session') as pool:
+            futures = {
+                pool.submit(self._run_session, f'session-{i}', driver, units): f'session-{i}'
+                for i, driver in enumerate(sessions, 1)
+            }
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    self._log(LogTypes.ERROR, f'[{futures[future]}] Session crashed: {e}')
+        if not units.empty():
+            self._log(LogTypes.WARNING, f'{units.qsize()} work units left unscraped this cycle.')
+
+    def _run_session(self, name: str, driver, units: queue.Queue) -> None:
+        try:
+            self._session_worker(name, driver, units)
+        finally:
+            connections.close_all()  # this pool thread's DB connections (checkpoints)
+
     def run_procedure(self, crawling_mode=True):
         self.load_config()
         self._setup_instances()
@@ -496,43 +1105,14 @@ class TwitterScraper(Scraper):
                 break
 
             if crawling_mode and self.state == ScraperStates.RUNNING:
-                dates_pipeline = self._gen_dates_pipeline()
-                tickers_list = self.config['twitter_query']['params']['ticker']
-
-                while not dates_pipeline.empty() and not self.stop_event.is_set():
-                    current_date = dates_pipeline.get()
-                    next_date = (
-                        datetime.strptime(current_date, '%Y-%m-%d') + timedelta(days=1)
-                    ).strftime('%Y-%m-%d')
-
-                    self._log(LogTypes.MESSAGE, f'Scraping date: {current_date}')
-
-                    for ticker in tickers_list:
-                        if self.stop_event.is_set():
-                            break
-                        if not self._wait_if_paused():
-                            break
-
-                        self._update_task({
-                            'source': self.config['source'][0]['name'],
-                            'date': current_date,
-                            'ticker': ticker,
-                            'count': 0,
-                        }, overwrite=True)
-
-                        count = self._scrape_ticker(ticker, current_date, next_date)
-                        self._log(
-                            LogTypes.MESSAGE,
-                            f"Found {count} tweets for '{ticker}' on {current_date}",
-                        )
-
+                self._crawl()
                 # All dates exhausted — wait before next crawl cycle
                 time.sleep(self.config['crawl_interval'])
 
             else:
                 time.sleep(1)
 
-        self._log(LogTypes.MESSAGE, 'Scraper stopped. Browser session preserved.')
+        self._log(LogTypes.MESSAGE, 'Scraper stopped. Browser sessions preserved.')
 
     ## GETTERS ###
 
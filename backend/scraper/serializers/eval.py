@@ -7,6 +7,10 @@ class EvalRequestSerializer(serializers.Serializer):
     date = serializers.DateField()
     with_save = serializers.BooleanField(default=False)
     model_id = serializers.CharField(required=False, default=None)
+    # Evaluate under several models at once (ensemble); takes precedence over model_id.
+    model_ids = serializers.ListField(
+        child=serializers.CharField(), required=False, allow_empty=False,
+    )
 
 class EvalResponseSerializer(serializers.Serializer):
     text = serializers.CharField()
@@ -16,3 +20,5 @@ class EvalResponseSerializer(serializers.Serializer):
     predicted_probabilities = serializers.ListField(
         child=serializers.FloatField(),
     )
+    # Per-model results, present for ensemble evaluations only.
+    models = serializers.DictField(required=False)
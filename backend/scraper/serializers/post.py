@@ -12,7 +12,7 @@ class PostPredictionSerializer(serializers.ModelSerializer):
         model = PostPrediction
         fields = [
             'prediction_id', 'prediction',
-            'probabilities', 'model_name', 'created_at',
+            'probabilities', 'model_name', 'model_id', 'created_at',
         ]
 
 class ContentSerializer(serializers.ModelSerializer):
@@ -8,6 +8,9 @@ from django.db.models.functions import TruncDate
 from django.utils.timezone import now
 from rest_framework.exceptions import ValidationError, APIException
 
+from stocknlp.metrics import CACHE_REQUESTS
+from stocknlp.tasks import request_user_eval
+
 PREDICTION_CLASSES = {0: 0, 1: 0, 2: 0}  # negative, neutral, positive
 
 
@@ -18,16 +21,26 @@ class DataService:
         except AttributeError:
             raise APIException("DataManager not initialized")
 
+    @staticmethod
+    def _to_tweet_object(tweet_data: dict) -> dict:
+        return {
+            'text': tweet_data['tweet'],
+            'ticker': tweet_data['ticker'],
+            'source_name': tweet_data.get('source_name', ''),
+            'date': tweet_data.get('date'),
+        }
+
     def evaluate_sentiment(self, tweet_data: dict, with_save: bool = False):
         model_id = tweet_data.get('model_id')
         try:
+            if tweet_data.get('model_ids'):
+                return self.data_manager.eval_sentiment_ensemble(
+                    self._to_tweet_object(tweet_data),
+                    tweet_data['model_ids'],
+                    with_save,
+                )
             result = self.data_manager.eval_sentiment(
-                {
-                    'text': tweet_data['tweet'],
-                    'ticker': tweet_data['ticker'],
-                    'source_name': tweet_data.get('source_name', ''),
-                    'date': tweet_data.get('date'),
-                },
+                self._to_tweet_object(tweet_data),
                 with_save,
                 model_id=model_id,
             )
@@ -37,11 +50,39 @@ class DataService:
         except Exception as e:
             raise APIException(f"Unexpected error during evaluation: {e}")
 
+    @classmethod
+    async def evaluate_sentiment_via_worker(
+        cls, tweet_data: dict, timeout: float, with_save: bool = False,
+    ) -> dict:
+        """Evaluate through the LLM worker (user_queue) instead of in-process.
+
+        Called on the class so the web process never touches the DataManager.
+        Raises TimeoutError when the worker does not answer within *timeout*,
+        and the same DRF errors as ``evaluate_sentiment`` when it reports a
+        failure (ValidationError for bad input, APIException otherwise).
+        """
+        payload = cls._to_tweet_object(tweet_data)
+        payload['with_save'] = with_save
+        if tweet_data.get('model_id'):
+            payload['model_id'] = tweet_data['model_id']
+        if tweet_data.get('model_ids'):
+            payload['model_ids'] = tweet_data['model_ids']
+
+        result = await request_user_eval(payload, timeout)
+        if result is None:
+            raise TimeoutError(f"Result not received from worker in {timeout}s")
+        if 'error' in result:
+            if result.get('status') == 400:
+                raise ValidationError(result['error'])
+            raise APIException(result['error'])
+        return result
+
     def get_predictions_by_day(self, ticker_symbols: str | None = None, days: int = 30):
         from django.core.cache import cache
 
         cache_key = f"predictions:{ticker_symbols or 'all'}:{days}"
         cached = cache.get(cache_key)
+        CACHE_REQUESTS.inc(cache='predictions', result='miss' if cached is None else 'hit')
         if cached is not None:
             return cached
 
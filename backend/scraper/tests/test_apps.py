@@ -0,0 +1,33 @@
+from unittest.mock import patch, MagicMock
+
+from django.apps import apps
+from django.test import TestCase
+
+
+class ScraperConfigLazySingletonTests(TestCase):
+    def setUp(self):
+        self.app_config = apps.get_app_config('scraper')
+        self._saved = dict(self.app_config._singletons)
+        self.app_config._singletons.clear()
+
+    def tearDown(self):
+        self.app_config._singletons.clear()
+        self.app_config._singletons.update(self._saved)
+
+    def test_singletons_not_built_until_accessed(self):
+        self.assertNotIn('SCRAPER_MANAGER', self.app_config._singletons)
+        self.assertNotIn('MODEL_REGISTRY', self.app_config._singletons)
+
+    @patch('scraper.managers.ScraperManager.ScraperManager')
+    def test_scraper_manager_built_once(self, mock_cls):
+        mock_cls.return_value = MagicMock()
+        first = self.app_config.SCRAPER_MANAGER
+        second = self.app_config.SCRAPER_MANAGER
+        self.assertIs(first, second)
+        mock_cls.assert_called_once()
+
+    @patch('scraper.managers.model_registry.ModelRegistry')
+    def test_data_manager_builds_registry_on_demand(self, mock_registry_cls):
+        data_manager = self.app_config.DATA_MANAGER
+        mock_registry_cls.assert_called_once()
+        self.assertIs(data_manager.registry, self.app_config.MODEL_REGISTRY)
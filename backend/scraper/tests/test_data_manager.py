@@ -1,13 +1,18 @@
 from unittest.mock import patch, MagicMock
 
 from django.test import TestCase
+from django.utils import timezone
 
-from scraper.managers.data_manager.data_manager import DataManager
+from scraper.managers.data_manager.data_manager import DataManager, ENSEMBLE_MODEL_NAME
+from scraper.managers.data_manager.vocab import CompactVocab
+from scraper.managers.model_registry import CascadeSpec
+from scraper.models import Post, PostPrediction
 
 
 class DataManagerEvalSentimentTests(TestCase):
     def setUp(self):
         self.mock_registry = MagicMock()
+        self.mock_registry.cascade_spec.return_value = None
         self.mock_manager = MagicMock()
         self.mock_preprocessor = MagicMock()
 
@@ -96,7 +101,8 @@ class DataManagerEvalSentimentTests(TestCase):
             'predicted_probabilities': [0.7, 0.2, 0.1],
         }
 
-        with patch.object(DataManager, '_load_json', return_value={'$AAPL': 2}):
+        ticker_vocab = CompactVocab.from_mapping({'$AAPL': 2})
+        with patch('scraper.managers.data_manager.data_manager.load_vocab', return_value=ticker_vocab):
             self.dm.eval_sentiment(
                 {'text': 'test', 'ticker': '$AAPL'},
                 model_id='LSTMCNNv1',
@@ -130,3 +136,181 @@ class DataManagerEvalSentimentTests(TestCase):
                 with_save=False,
             )
             mock_save.assert_not_called()
+
+
+class DataManagerCascadeTests(TestCase):
+    def setUp(self):
+        self.fast = MagicMock()
+        self.slow = MagicMock()
+        self.fast.get_model_name.return_value = 'lstmcnn_model'
+        self.slow.get_model_name.return_value = 'transformer_model'
+        stages = {
+            'LSTMCNNv1': (self.fast, MagicMock(), 'lstmcnn_model'),
+            'FinBERT': (self.slow, MagicMock(), 'transformer_model'),
+        }
+        self.registry = MagicMock()
+        self.registry.get.side_effect = stages.__getitem__
+        self.registry.cascade_spec.side_effect = lambda model_id: (
+            CascadeSpec(('LSTMCNNv1', 'FinBERT'), 0.75) if model_id.startswith('Cascade') else None
+        )
+        self.dm = DataManager(model_registry=self.registry, default_model_id='FinBERT')
+        self.dm._ticker_to_index = CompactVocab.from_mapping({'AAPL': 1})
+        self.tweets = [
+            {'text': 'to the moon', 'ticker': 'AAPL'},
+            {'text': 'hmm, maybe', 'ticker': 'AAPL'},
+        ]
+
+    def test_only_low_confidence_items_reach_the_second_stage(self):
+        self.fast.predict_batch.return_value = [
+            {'predicted_sentiment': 2, 'predicted_probabilities': [0.05, 0.05, 0.9]},
+            {'predicted_sentiment': 1, 'predicted_probabilities': [0.3, 0.4, 0.3]},
+        ]
+        self.slow.predict_batch.return_value = [
+            {'predicted_sentiment': 1, 'predicted_probabilities': [0.1, 0.8, 0.1]},
+        ]
+
+        results = self.dm.eval_sentiment_batch(self.tweets, model_id='Cascade:LSTMCNNv1>FinBERT')
+
+        self.assertEqual(self.fast.predict_batch.call_args.args[1], [1, 1])
+        stage_two_preprocessor = self.registry.get('FinBERT')[1]
+        stage_two_preprocessor.clean.assert_called_once_with('hmm, maybe')
+        stage_two_preprocessor.tokenize_batch.assert_called_once_with(
+            [stage_two_preprocessor.clean.return_value],
+        )
+        self.assertEqual([r['answered_by'] for r in results], ['LSTMCNNv1', 'FinBERT'])
+        self.assertEqual([r['prediction'] for r in results], [2, 1])
+
+    def test_failed_first_stage_escalates_everything(self):
+        self.fast.predict_batch.side_effect = RuntimeError('boom')
+        self.slow.predict_batch.return_value = [
+            {'predicted_sentiment': 0, 'predicted_probabilities': [0.6, 0.2, 0.2]},
+            {'predicted_sentiment': 0, 'predicted_probabilities': [0.6, 0.2, 0.2]},
+        ]
+
+        results = self.dm.eval_sentiment_batch(self.tweets, model_id='Cascade:LSTMCNNv1>FinBERT')
+
+        self.assertEqual([r['answered_by'] for r in results], ['FinBERT', 'FinBERT'])
+
+    def test_saves_each_result_with_the_answering_stage(self):
+        self.fast.predict_batch.return_value = [
+            {'predicted_sentiment': 2, 'predicted_probabilities': [0.05, 0.05, 0.9]},
+            {'predicted_sentiment': 1, 'predicted_probabilities': [0.3, 0.4, 0.3]},
+        ]
+        self.slow.predict_batch.return_value = [
+            {'predicted_sentiment': 1, 'predicted_probabilities': [0.1, 0.8, 0.1]},
+        ]
+        with patch.object(DataManager, 'process_and_save_post') as mock_save:
+            self.dm.eval_sentiment_batch(
+                self.tweets, with_save=True, model_id='Cascade:LSTMCNNv1>FinBERT',
+            )
+        self.assertEqual([c.args[1] for c in mock_save.call_args_list], [self.fast, self.slow])
+        self.assertEqual(
+            [c.kwargs['model_id'] for c in mock_save.call_args_list], ['LSTMCNNv1', 'FinBERT'],
+        )
+
+    def test_single_eval_routes_cascade_through_batch(self):
+        self.fast.predict_batch.return_value = [
+            {'predicted_sentiment': 2, 'predicted_probabilities': [0.05, 0.05, 0.9]},
+        ]
+        result = self.dm.eval_sentiment(self.tweets[0], model_id='Cascade:LSTMCNNv1>FinBERT')
+        self.assertEqual(result['answered_by'], 'LSTMCNNv1')
+        self.slow.predict_batch.assert_not_called()
+
+    def test_batch_cleans_each_text_once(self):
+        preprocessor = self.registry.get('FinBERT')[1]
+        preprocessor.clean.side_effect = lambda text: f'clean:{text}'
+        self.slow.predict_batch.return_value = [
+            {'predicted_sentiment': 1, 'predicted_probabilities': [0.3, 0.4, 0.3]},
+        ] * 2
+        results = self.dm.eval_sentiment_batch(self.tweets, model_id='FinBERT')
+        self.assertEqual(preprocessor.clean.call_count, 2)
+        preprocessor.tokenize_batch.assert_called_once_with(['clean:to the moon', 'clean:hmm, maybe'])
+        self.assertEqual([r['cleaned_text'] for r in results], ['clean:to the moon', 'clean:hmm, maybe'])
+
+    def test_plain_model_batch_has_no_stage_marker(self):
+        self.slow.predict_batch.return_value = [
+            {'predicted_sentiment': 1, 'predicted_probabilities': [0.3, 0.4, 0.3]},
+        ] * 2
+        results = self.dm.eval_sentiment_batch(self.tweets, model_id='FinBERT')
+        self.assertEqual(len(results), 2)
+        self.assertNotIn('answered_by', results[0])
+        self.fast.predict_batch.assert_not_called()
+
+
+class DataManagerEnsembleTests(TestCase):
+    def _member(self, probabilities, pipeline=('strip_urls',), input_key='bert'):
+        manager = MagicMock()
+        manager.get_model_name.return_value = 'transformer_model'
+        manager.predict.return_value = {
+            'predicted_sentiment': max(range(3), key=probabilities.__getitem__),
+            'predicted_probabilities': probabilities,
+        }
+        preprocessor = MagicMock()
+        preprocessor.pipeline = list(pipeline)
+        preprocessor.input_key = input_key
+        preprocessor.clean.side_effect = lambda text: f'clean:{text}'
+        preprocessor.tokenize.side_effect = lambda text: f'tok:{text}'
+        return manager, preprocessor, 'transformer_model'
+
+    def setUp(self):
+        self.members = {
+            'FinBERT': self._member([0.2, 0.2, 0.6]),
+            'TweetBERT': self._member([0.4, 0.2, 0.4]),
+        }
+        self.registry = MagicMock()
+        self.registry.cascade_spec.return_value = None
+        self.registry.get.side_effect = self.members.__getitem__
+        self.dm = DataManager(model_registry=self.registry, default_model_id='FinBERT')
+        self.tweet = {
+            'text': 'buy $AAPL', 'ticker': 'AAPL', 'source': 'twitter',
+            'date': timezone.now(),
+        }
+
+    def test_shared_tokenizer_preprocesses_once(self):
+        result = self.dm.eval_sentiment_ensemble(self.tweet, ['FinBERT', 'TweetBERT'])
+
+        fin_pre, tweet_pre = self.members['FinBERT'][1], self.members['TweetBERT'][1]
+        self.assertEqual(fin_pre.clean.call_count + tweet_pre.clean.call_count, 1)
+        self.assertEqual(fin_pre.tokenize.call_count + tweet_pre.tokenize.call_count, 1)
+        for manager, _, _ in self.members.values():
+            manager.predict.assert_called_once_with('tok:clean:buy $AAPL', None)
+        self.assertEqual(set(result['models']), {'FinBERT', 'TweetBERT'})
+
+    def test_distinct_tokenizers_each_tokenize(self):
+        self.members['TweetBERT'] = self._member([0.4, 0.2, 0.4], input_key='other')
+        self.dm.eval_sentiment_ensemble(self.tweet, ['FinBERT', 'TweetBERT'])
+        self.members['TweetBERT'][1].tokenize.assert_called_once()
+        self.members['FinBERT'][1].tokenize.assert_called_once()
+
+    def test_combined_probabilities_are_the_member_mean(self):
+        result = self.dm.eval_sentiment_ensemble(self.tweet, ['FinBERT', 'TweetBERT'])
+        for got, want in zip(result['predicted_probabilities'], [0.3, 0.2, 0.5]):
+            self.assertAlmostEqual(got, want)
+        self.assertEqual(result['prediction'], 2)
+        self.assertEqual(result['models']['TweetBERT']['prediction'], 0)
+
+    def test_failed_member_is_left_out_of_the_mean(self):
+        self.members['TweetBERT'][0].predict.side_effect = RuntimeError('boom')
+        result = self.dm.eval_sentiment_ensemble(self.tweet, ['FinBERT', 'TweetBERT'])
+        self.assertEqual(result['predicted_probabilities'], [0.2, 0.2, 0.6])
+        self.assertEqual(result['models']['TweetBERT']['prediction'], 'unknown')
+
+    def test_rejects_cascade_members(self):
+        self.registry.cascade_spec.side_effect = lambda model_id: (
+            CascadeSpec(('LSTMCNNv1', 'FinBERT'), 0.75) if model_id.startswith('Cascade') else None
+        )
+        with self.assertRaises(ValueError):
+            self.dm.eval_sentiment_ensemble(self.tweet, ['FinBERT', 'Cascade:LSTMCNNv1>FinBERT'])
+
+    def test_save_links_member_predictions_to_one_post(self):
+        self.dm.eval_sentiment_ensemble(self.tweet, ['FinBERT', 'TweetBERT'], with_save=True)
+
+        post = Post.objects.get()
+        self.assertEqual(post.post_prediction.model_name, ENSEMBLE_MODEL_NAME)
+        self.assertIsNone(post.post_prediction.model_id)
+        # Members are named like single-model rows: architecture plus registry ID.
+        self.assertEqual(
+            sorted(post.predictions.values_list('model_id', 'model_name')),
+            [('FinBERT', 'transformer_model'), ('TweetBERT', 'transformer_model')],
+        )
+        self.assertEqual(PostPrediction.objects.count(), 3)
@@ -0,0 +1,56 @@
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+from django.test import TestCase
+
+from scraper.managers.data_manager.fast_tokenizers import find_mismatches
+from scraper.managers.data_manager.fast_tokenizers import load_parity_corpus
+from scraper.managers.data_manager.fast_tokenizers import load_slow_tokenizer
+from scraper.managers.data_manager.fast_tokenizers import load_tokenizer
+from scraper.managers.data_manager.model_processors import TransformerPreprocessor
+
+VOCAB = [
+    '[PAD]', '[UNK]', '[CLS]', '[SEP]', '[MASK]',
+    'the', 'market', 'is', 'up', 'buy', '##ing', '$', 'aa', '##pl', '!', '.',
+]
+
+
+class FastTokenizerTests(TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = self.tmp.name
+        Path(self.path, 'vocab.txt').write_text('\n'.join(VOCAB), encoding='utf-8')
+        Path(self.path, 'tokenizer_config.json').write_text('{"do_lower_case": true}', encoding='utf-8')
+
+    def test_loads_fast_bert_tokenizer(self):
+        self.assertTrue(load_tokenizer(self.path, bert=True).is_fast)
+
+    def test_fast_matches_slow_on_parity_corpus(self):
+        fast = load_tokenizer(self.path, bert=True)
+        slow = load_slow_tokenizer(fast)
+        self.assertFalse(slow.is_fast)
+        corpus = load_parity_corpus()
+        self.assertGreater(len(corpus), 10)
+        self.assertEqual(find_mismatches(fast, slow, corpus), [])
+
+    def test_verify_keeps_fast_tokenizer_when_identical(self):
+        self.assertTrue(load_tokenizer(self.path, bert=True, verify=True).is_fast)
+
+    def test_verify_falls_back_to_slow_on_mismatch(self):
+        with patch(
+            'scraper.managers.data_manager.fast_tokenizers.find_mismatches',
+            return_value=[('the', [2, 5, 3], [2, 1, 3])],
+        ):
+            tokenizer = load_tokenizer(self.path, bert=True, verify=True)
+        self.assertFalse(tokenizer.is_fast)
+
+    def test_tokenize_batch_pads_to_longest(self):
+        preprocessor = TransformerPreprocessor(load_tokenizer(self.path, bert=True))
+        batch = preprocessor.tokenize_batch(['the market is up !', 'buy'])
+        self.assertEqual(tuple(batch['input_ids'].shape), (2, 7))
+        self.assertEqual(
+            batch['input_ids'][1].tolist(),
+            preprocessor.tokenize('buy')['input_ids'][0].tolist() + [0] * 4,
+        )
@@ -0,0 +1,82 @@
+import tempfile
+from pathlib import Path
+
+import torch
+from django.core.management import call_command
+from django.test import TestCase
+
+from ml_logic.lstm_cnn import CNNLSTMModel
+from scraper.managers.model_manager.model_loaders import LSTMCNNLoader
+from scraper.managers.model_manager.model_loaders import load_state_dict_mmap
+from scraper.managers.model_manager.model_predictors import LSTMCNNPredictor
+
+SMALL_PARAMS = {
+    'vocab_size': 50,
+    'embedding_dim': 8,
+    'lstm_hidden_dim': 4,
+    'num_classes': 3,
+    'ticker_vocab_size': 5,
+    'dropout': 0.0,
+}
+
+
+class LSTMCNNMmapLoadingTests(TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.dir = Path(self.tmp.name)
+        torch.manual_seed(0)
+        self.reference = CNNLSTMModel(**SMALL_PARAMS).eval()
+        self.pt_path = self.dir / 'model.pt'
+        torch.save({'model_state_dict': self.reference.state_dict()}, self.pt_path)
+        self.x_text = torch.randint(1, 50, (2, 12))
+        self.x_ticker = torch.tensor([[1], [2]])
+
+    def _load(self, path):
+        loader = LSTMCNNLoader()
+        return loader.load_model({**SMALL_PARAMS, 'resolved_weights': str(path)}).eval()
+
+    def _assert_matches_reference(self, model):
+        self.assertFalse(any(p.is_meta for p in model.parameters()))
+        with torch.no_grad():
+            torch.testing.assert_close(
+                model(self.x_text, self.x_ticker),
+                self.reference(self.x_text, self.x_ticker),
+            )
+
+    def test_loads_pt_checkpoint(self):
+        self._assert_matches_reference(self._load(self.pt_path))
+
+    def test_converted_safetensors_loads_identically(self):
+        out = self.dir / 'model.safetensors'
+        call_command('convert_weights', str(self.pt_path), '--output', str(out), stdout=None)
+        self.assertTrue(out.exists())
+        self._assert_matches_reference(self._load(out))
+
+    def test_convert_defaults_to_sibling_path(self):
+        call_command('convert_weights', str(self.pt_path))
+        self.assertTrue((self.dir / 'model.safetensors').exists())
+
+    def test_missing_file_raises_file_not_found(self):
+        with self.assertRaises(FileNotFoundError):
+            load_state_dict_mmap(self.dir / 'missing.pt', torch.device('cpu'))
+
+
+class LSTMCNNBatchPredictionTests(TestCase):
+    def test_batch_matches_single_predictions(self):
+        torch.manual_seed(0)
+        model = CNNLSTMModel(**SMALL_PARAMS).eval()
+        predictor = LSTMCNNPredictor()
+        x_text = torch.randint(1, 50, (3, 12))
+        tickers = [0, 3, 1]
+
+        batch = predictor.predict_batch(model, x_text.numpy(), tickers, torch.device('cpu'))
+
+        self.assertEqual(len(batch), 3)
+        for row, ticker, result in zip(x_text.tolist(), tickers, batch):
+            single = predictor.predict(model, row, [ticker], torch.device('cpu'))
+            self.assertEqual(result['predicted_sentiment'], single['predicted_sentiment'])
+            torch.testing.assert_close(
+                torch.tensor(result['predicted_probabilities']),
+                torch.tensor(single['predicted_probabilities']),
+            )
@@ -1,5 +1,8 @@
+import copy
+import threading
 from unittest.mock import patch, MagicMock
 
+import torch
 from django.test import TestCase
 
 from scraper.managers.model_registry import (
@@ -159,3 +162,261 @@ class ModelIdToConfigKeyTests(TestCase):
 
     def test_lstmcnn_maps_correctly(self):
         self.assertEqual(MODEL_ID_TO_CONFIG_KEY['LSTMCNNv1'], 'cnn_lstm')
+
+
+class ModelRegistryWarmUpTests(TestCase):
+    @patch.object(ModelRegistry, '_build_preprocessor')
+    @patch('scraper.managers.model_registry.ModelManager')
+    def test_warm_up_runs_one_pass_per_seq_len(self, mock_mm_cls, mock_build):
+        mock_manager = MagicMock()
+        mock_mm_cls.return_value = mock_manager
+        mock_build.return_value = MagicMock()
+
+        registry = ModelRegistry(MOCK_CONFIGS)
+        registry.warm_up('FinBERT', seq_lens=[4, 16, 64])
+
+        self.assertEqual(mock_manager.predict.call_count, 3)
+        self.assertIn('FinBERT', registry.loaded_models)
+        # Transformer models take no ticker input
+        self.assertIsNone(mock_manager.predict.call_args.args[1])
+
+    @patch.object(ModelRegistry, '_build_preprocessor')
+    @patch('scraper.managers.model_registry.ModelManager')
+    def test_preload_skips_models_that_fail(self, mock_mm_cls, mock_build):
+        mock_mm_cls.return_value = MagicMock()
+        mock_build.return_value = MagicMock()
+
+        registry = ModelRegistry(MOCK_CONFIGS)
+        ready = registry.preload(['FinBERT', 'LSTMCNNv1', 'Unknown'], seq_lens=[8])
+
+        self.assertEqual(ready, ['FinBERT'])
+
+
+def _manager_with_params(num_floats):
+    """Mock ModelManager whose model holds *num_floats* float32 parameters."""
+    manager = MagicMock()
+    manager.get_model.return_value = torch.nn.Linear(num_floats, 1, bias=False)
+    return manager
+
+
+class ModelRegistryMemoryBudgetTests(TestCase):
+    MODEL_BYTES = 1000 * 4  # nn.Linear(1000, 1) in float32
+
+    def setUp(self):
+        self.configs = copy.deepcopy(MOCK_CONFIGS)
+        self.configs['cnn_lstm']['params']['weights_path'] = '/weights/cnn_lstm.pt'
+
+        patchers = [
+            patch('scraper.managers.model_registry.Path.exists', return_value=True),
+            patch.object(ModelRegistry, '_build_preprocessor', return_value=MagicMock()),
+            patch(
+                'scraper.managers.model_registry.ModelManager',
+                side_effect=lambda *args, **kwargs: _manager_with_params(1000),
+            ),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_tracks_parameter_memory(self):
+        registry = ModelRegistry(self.configs)
+        registry.get('FinBERT')
+        self.assertEqual(registry.stats['loaded'], {'FinBERT': self.MODEL_BYTES})
+        self.assertEqual(registry.stats['memory_used_bytes'], self.MODEL_BYTES)
+
+    def test_no_budget_never_evicts(self):
+        registry = ModelRegistry(self.configs)
+        for model_id in ('FinBERT', 'TweetBERT', 'LSTMCNNv1'):
+            registry.get(model_id)
+        self.assertEqual(len(registry.loaded_models), 3)
+        self.assertEqual(registry.stats['evictions'], 0)
+
+    def test_evicts_least_recently_used_over_budget(self):
+        registry = ModelRegistry(self.configs, memory_budget_bytes=2 * self.MODEL_BYTES)
+        registry.get('FinBERT')
+        registry.get('TweetBERT')
+        registry.get('FinBERT')  # TweetBERT is now the LRU entry
+        registry.get('LSTMCNNv1')
+
+        self.assertEqual(sorted(registry.loaded_models), ['FinBERT', 'LSTMCNNv1'])
+        self.assertEqual(registry.stats['evicted'], {'TweetBERT': 1})
+
+    def test_reload_after_eviction_counts_as_new_load(self):
+        registry = ModelRegistry(self.configs, memory_budget_bytes=self.MODEL_BYTES)
+        registry.get('FinBERT')
+        registry.get('TweetBERT')
+        registry.get('FinBERT')
+
+        self.assertEqual(registry.loaded_models, ['FinBERT'])
+        self.assertEqual(registry.stats['loads'], 3)
+        self.assertEqual(registry.stats['evictions'], 2)
+
+    def test_model_larger_than_budget_still_loads(self):
+        registry = ModelRegistry(self.configs, memory_budget_bytes=10)
+        registry.get('FinBERT')
+        self.assertEqual(registry.loaded_models, ['FinBERT'])
+
+
+class ModelRegistryConcurrencyTests(TestCase):
+    def setUp(self):
+        self.release_finbert = threading.Event()
+        self.finbert_loading = threading.Event()
+        self.load_calls = []
+
+        def slow_finbert_manager(model_name, model_params):
+            self.load_calls.append(model_params['resolved_weights'])
+            if model_params['resolved_weights'] == 'yiyanghkust/finbert-tone':
+                self.finbert_loading.set()
+                self.release_finbert.wait(timeout=5)
+            return MagicMock()
+
+        patchers = [
+            patch.object(ModelRegistry, '_build_preprocessor', return_value=MagicMock()),
+            patch('scraper.managers.model_registry.ModelManager', side_effect=slow_finbert_manager),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.addCleanup(self.release_finbert.set)
+
+        self.registry = ModelRegistry(copy.deepcopy(MOCK_CONFIGS))
+
+    def test_cold_load_does_not_block_other_models(self):
+        self.registry.get('TweetBERT')
+        loader = threading.Thread(target=self.registry.get, args=('FinBERT',))
+        loader.start()
+        self.assertTrue(self.finbert_loading.wait(timeout=5))
+
+        # FinBERT is still loading: an already-loaded model and the global
+        # bookkeeping lock must both remain available.
+        manager, _, _ = self.registry.get('TweetBERT')
+        self.assertIsNotNone(manager)
+        self.assertTrue(self.registry._lock.acquire(timeout=1))
+        self.registry._lock.release()
+
+        self.release_finbert.set()
+        loader.join(timeout=5)
+        self.assertIn('FinBERT', self.registry.loaded_models)
+
+    def test_concurrent_gets_for_same_model_load_once(self):
+        threads = [
+            threading.Thread(target=self.registry.get, args=('FinBERT',))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        self.assertTrue(self.finbert_loading.wait(timeout=5))
+        self.release_finbert.set()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        self.assertEqual(self.load_calls, ['yiyanghkust/finbert-tone'])
+
+
+class ModelRegistryReloadTests(TestCase):
+    def setUp(self):
+        patchers = [
+            patch.object(ModelRegistry, '_build_preprocessor', side_effect=lambda *a: MagicMock()),
+            patch('scraper.managers.model_registry.ModelManager', side_effect=lambda *a: MagicMock()),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.registry = ModelRegistry(copy.deepcopy(MOCK_CONFIGS))
+
+    def _new_finbert_config(self, hf_fallback='org/finbert-v2'):
+        cfg = copy.deepcopy(MOCK_CONFIGS['transformer_finbert'])
+        cfg['params']['hf_fallback'] = hf_fallback
+        return cfg
+
+    def test_reload_swaps_loaded_model(self):
+        old_manager, _, _ = self.registry.get('FinBERT')
+
+        swapped = self.registry.reload('FinBERT', self._new_finbert_config(), seq_lens=[8])
+
+        new_manager, _, _ = self.registry.get('FinBERT')
+        self.assertTrue(swapped)
+        self.assertIsNot(new_manager, old_manager)
+        self.assertEqual(
+            self.registry._configs['transformer_finbert']['params']['resolved_weights'],
+            'org/finbert-v2',
+        )
+        # Warmed up before being published
+        new_manager.predict.assert_called()
+
+    def test_reload_unloaded_model_only_replaces_config(self):
+        swapped = self.registry.reload('FinBERT', self._new_finbert_config())
+        self.assertFalse(swapped)
+        self.assertNotIn('FinBERT', self.registry.loaded_models)
+        self.assertEqual(
+            self.registry._configs['transformer_finbert']['params']['hf_fallback'],
+            'org/finbert-v2',
+        )
+
+    def test_unusable_config_keeps_current_version(self):
+        old_manager, _, _ = self.registry.get('FinBERT')
+        with self.assertRaises(ModelConfigError):
+            self.registry.reload('FinBERT', self._new_finbert_config(hf_fallback=None))
+        self.assertIs(self.registry.get('FinBERT')[0], old_manager)
+
+    def test_failed_load_keeps_current_version(self):
+        old_manager, _, _ = self.registry.get('FinBERT')
+        with patch('scraper.managers.model_registry.ModelManager', side_effect=RuntimeError('boom')):
+            with self.assertRaises(RuntimeError):
+                self.registry.reload('FinBERT', self._new_finbert_config())
+        self.assertIs(self.registry.get('FinBERT')[0], old_manager)
+
+    def test_reload_unknown_model_raises(self):
+        with self.assertRaises(ValueError):
+            self.registry.reload('Nope')
+
+
+class ModelRegistryCascadeTests(TestCase):
+    CASCADE_ID = 'Cascade:LSTMCNNv1>FinBERT'
+
+    def _configs(self, **cascade_params):
+        configs = copy.deepcopy(MOCK_CONFIGS)
+        configs['cascade_lstm_finbert'] = {
+            'model_name': 'cascade',
+            'params': {'stages': ['TweetBERT', 'FinBERT'], **cascade_params},
+        }
+        return configs
+
+    def test_cascade_spec_for_valid_cascade(self):
+        registry = ModelRegistry(self._configs(confidence_threshold=0.6))
+        spec = registry.cascade_spec(self.CASCADE_ID)
+        self.assertEqual(spec.stages, ('TweetBERT', 'FinBERT'))
+        self.assertEqual(spec.confidence_threshold, 0.6)
+        self.assertIn(self.CASCADE_ID, registry.available_models)
+
+    def test_single_model_has_no_cascade_spec(self):
+        registry = ModelRegistry(self._configs())
+        self.assertIsNone(registry.cascade_spec('FinBERT'))
+
+    def test_unknown_stage_makes_cascade_unavailable(self):
+        registry = ModelRegistry(self._configs(stages=['FinBERT', 'Nope']))
+        self.assertIn(self.CASCADE_ID, registry.unavailable_models)
+        with self.assertRaises(ModelConfigError):
+            registry.cascade_spec(self.CASCADE_ID)
+
+    def test_unavailable_stage_makes_cascade_unavailable(self):
+        # cnn_lstm has no weights in MOCK_CONFIGS
+        registry = ModelRegistry(self._configs(stages=['LSTMCNNv1', 'FinBERT']))
+        self.assertIn(self.CASCADE_ID, registry.unavailable_models)
+
+    def test_threshold_out_of_range_is_rejected(self):
+        registry = ModelRegistry(self._configs(confidence_threshold=1.5))
+        self.assertIn(self.CASCADE_ID, registry.unavailable_models)
+
+    def test_get_on_cascade_raises(self):
+        registry = ModelRegistry(self._configs())
+        with self.assertRaises(ValueError):
+            registry.get(self.CASCADE_ID)
+
+    def test_warm_up_warms_every_stage(self):
+        registry = ModelRegistry(self._configs())
+        with patch.object(ModelRegistry, '_run_warmup') as mock_warmup, \
+                patch.object(registry, 'get', return_value=(MagicMock(), MagicMock(), 'transformer_model')) as mock_get:
+            registry.warm_up(self.CASCADE_ID, seq_lens=[8])
+        self.assertEqual([c.args[0] for c in mock_get.call_args_list], ['TweetBERT', 'FinBERT'])
+        self.assertEqual(mock_warmup.call_count, 2)
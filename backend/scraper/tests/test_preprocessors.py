@@ -75,6 +75,11 @@ class LSTMCNNPreprocessorTests(TestCase):
         result = self.preprocessor.preprocess('')
         self.assertEqual(result, [0] * 10)
 
+    def test_single_text_matches_batch_encoding(self):
+        texts = ['apple stock is going up', 'xyz the market', ' '.join(['bullish'] * 12)]
+        batch = self.preprocessor.tokenize_batch(texts).tolist()
+        self.assertEqual([self.preprocessor.tokenize(text) for text in texts], batch)
+
 
 class TransformerPreprocessorTests(TestCase):
     def setUp(self):
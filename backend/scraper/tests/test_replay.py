@@ -0,0 +1,50 @@
+import json
+from pathlib import Path
+
+from django.test import TestCase
+
+from scraper.scrapers.replay import ReplayDriver, offline_redis
+from scraper.scrapers.twitter_scraper import TwitterScraper
+from stocknlp import tasks
+
+FIXTURES = Path(__file__).resolve().parent.parent / 'fixtures'
+PAGE = (FIXTURES / 'twitter_search_page.html').read_text(encoding='utf-8')
+RESPONSE = (FIXTURES / 'search_timeline_response.json').read_text(encoding='utf-8')
+
+
+class ReplayTests(TestCase):
+    def _search(self, driver, capture_mode):
+        with offline_redis() as client:
+            scraper = TwitterScraper()
+            scraper.config.update(capture_mode=capture_mode, scroll_timeout=0.01)
+            count = scraper._scrape_ticker('AAPL', '2024-01-02', '2024-01-03', driver=driver)
+            queued = [json.loads(raw) for raw in client.lrange('scraper_queue', 0, -1)]
+        self.assertEqual(count, len(queued))
+        return queued
+
+    def test_page_snapshot_is_revealed_per_scroll(self):
+        driver = ReplayDriver.from_pages([PAGE], per_scroll=10)
+        queued = self._search(driver, 'dom')
+        self.assertEqual(len(queued), 40)
+        self.assertEqual(driver.scrolls, 4)  # three that grow the page, then the stall at the end
+        self.assertIn('x.com/search?q=AAPL', driver.current_url)
+        self.assertEqual(queued[0]['status_id'], '1740000000000000000')
+
+    def test_overlapping_snapshots_show_each_tweet_once(self):
+        driver = ReplayDriver.from_pages([PAGE, PAGE], per_scroll=25)
+        self.assertEqual(len(driver.steps), 2)
+        self.assertEqual(len(self._search(driver, 'dom')), 40)
+
+    def test_captured_responses(self):
+        driver = ReplayDriver.from_responses([RESPONSE])
+        queued = self._search(driver, 'network')
+        # Single page of results: collected even though the first scroll stalls.
+        self.assertEqual(driver.scrolls, 1)
+        self.assertEqual([t['status_id'] for t in queued], [f'174500000000000000{i}' for i in (1, 2, 3, 5)])
+        self.assertEqual((queued[0]['likes'], queued[0]['views']), (1520, 98231))
+
+    def test_offline_redis_restores_client(self):
+        original = tasks.get_redis
+        with offline_redis() as client:
+            self.assertIs(tasks.get_redis(), client)
+        self.assertIs(tasks.get_redis, original)
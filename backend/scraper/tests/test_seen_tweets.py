@@ -0,0 +1,53 @@
+from datetime import date
+from unittest.mock import MagicMock
+
+import fakeredis
+import redis
+from django.test import TestCase, override_settings
+
+from scraper.scrapers.seen_tweets import SEEN_KEY, filter_unseen, forget_seen, tweet_key
+
+
+def tweet(status_id='1', text='$TSLA up', ticker='TSLA'):
+    return {'status_id': status_id, 'text': text, 'ticker': ticker, 'date': date(2024, 1, 2), 'source': 'twitter'}
+
+
+class FilterUnseenTests(TestCase):
+    def setUp(self):
+        self.client = fakeredis.FakeStrictRedis()
+
+    def test_second_crawl_enqueues_nothing(self):
+        first = [tweet('1'), tweet('2')]
+        self.assertEqual(filter_unseen(first, client=self.client), first)
+        self.assertEqual(filter_unseen([tweet('1'), tweet('2')], client=self.client), [])
+
+    def test_only_new_tweets_pass(self):
+        filter_unseen([tweet('1')], client=self.client)
+        self.assertEqual(
+            [t['status_id'] for t in filter_unseen([tweet('1'), tweet('3')], client=self.client)], ['3'],
+        )
+
+    def test_same_tweet_under_another_ticker_is_new(self):
+        filter_unseen([tweet('1', ticker='TSLA')], client=self.client)
+        self.assertEqual(len(filter_unseen([tweet('1', ticker='AAPL')], client=self.client)), 1)
+
+    def test_text_hash_without_status_id(self):
+        self.assertEqual(tweet_key(tweet(None, 'abc')), tweet_key(tweet(None, 'abc')))
+        self.assertNotEqual(tweet_key(tweet(None, 'abc')), tweet_key(tweet(None, 'abd')))
+
+    @override_settings(SCRAPER_SEEN_TTL_DAYS=2)
+    def test_sets_expire(self):
+        filter_unseen([tweet()], client=self.client)
+        key = SEEN_KEY.format(source='twitter', ticker='TSLA', date='2024-01-02')
+        self.assertAlmostEqual(self.client.ttl(key), 2 * 86400, delta=5)
+
+    def test_forgotten_tweets_pass_again(self):
+        filter_unseen([tweet('1'), tweet('2')], client=self.client)
+        forget_seen([tweet('2')], client=self.client)
+        self.assertEqual([t['status_id'] for t in filter_unseen([tweet('1'), tweet('2')], client=self.client)], ['2'])
+
+    def test_redis_down_lets_everything_through(self):
+        broken = MagicMock()
+        broken.pipeline.return_value.execute.side_effect = redis.ConnectionError('down')
+        tweets = [tweet('1')]
+        self.assertEqual(filter_unseen(tweets, client=broken), tweets)
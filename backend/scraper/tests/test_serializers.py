@@ -98,6 +98,22 @@ class EvalRequestSerializerTests(TestCase):
         serializer = EvalRequestSerializer(data=data)
         self.assertFalse(serializer.is_valid())
 
+    def test_accepts_ensemble_model_ids(self):
+        data = {
+            'tweet': 'test', 'ticker': '$AAPL', 'source_name': 'test',
+            'date': '2024-01-15', 'model_ids': ['FinBERT', 'TweetBERT'],
+        }
+        serializer = EvalRequestSerializer(data=data)
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        self.assertEqual(serializer.validated_data['model_ids'], ['FinBERT', 'TweetBERT'])
+
+    def test_empty_model_ids_invalid(self):
+        data = {
+            'tweet': 'test', 'ticker': '$AAPL', 'source_name': 'test',
+            'date': '2024-01-15', 'model_ids': [],
+        }
+        self.assertFalse(EvalRequestSerializer(data=data).is_valid())
+
 
 class EvalResponseSerializerTests(TestCase):
     def test_serializes_response(self):
@@ -1,7 +1,9 @@
-from unittest.mock import patch, MagicMock, PropertyMock
+from unittest.mock import patch, AsyncMock, MagicMock, PropertyMock
 
 from django.test import TestCase
+from rest_framework.exceptions import APIException, ValidationError
 
+from scraper.services.data_service import DataService
 from scraper.services.scraper_service import ScraperService
 
 
@@ -92,3 +94,42 @@ class ScraperServiceTests(TestCase):
         self.mock_manager.find_and_update_scraper_config.return_value = False
         with self.assertRaises(ValueError):
             self.service.update_config({'source': 'unknown'})
+
+
+class DataServiceWorkerEvalTests(TestCase):
+    tweet_data = {
+        'tweet': 'bullish on apple',
+        'ticker': '$AAPL',
+        'source_name': 'test',
+        'date': '2024-01-01',
+        'model_id': 'TweetBERT',
+    }
+
+    @patch('scraper.services.data_service.request_user_eval', new_callable=AsyncMock)
+    async def test_sends_payload_to_worker(self, mock_request):
+        mock_request.return_value = {'prediction': 2}
+        result = await DataService.evaluate_sentiment_via_worker(
+            self.tweet_data, timeout=5, with_save=True,
+        )
+        self.assertEqual(result, {'prediction': 2})
+        payload, timeout = mock_request.call_args.args
+        self.assertEqual(payload['text'], 'bullish on apple')
+        self.assertEqual(payload['model_id'], 'TweetBERT')
+        self.assertTrue(payload['with_save'])
+        self.assertEqual(timeout, 5)
+
+    @patch('scraper.services.data_service.request_user_eval', new_callable=AsyncMock)
+    async def test_raises_timeout_when_worker_silent(self, mock_request):
+        mock_request.return_value = None
+        with self.assertRaises(TimeoutError):
+            await DataService.evaluate_sentiment_via_worker(self.tweet_data, timeout=1)
+
+    @patch('scraper.services.data_service.request_user_eval', new_callable=AsyncMock)
+    async def test_worker_errors_raise_like_in_process_eval(self, mock_request):
+        mock_request.return_value = {'error': "Unknown model ID 'Nope'", 'status': 400}
+        with self.assertRaises(ValidationError):
+            await DataService.evaluate_sentiment_via_worker(self.tweet_data, timeout=1)
+        mock_request.return_value = {'error': 'Unexpected error during evaluation: boom', 'status': 500}
+        with self.assertRaises(APIException) as raised:
+            await DataService.evaluate_sentiment_via_worker(self.tweet_data, timeout=1)
+        self.assertEqual(raised.exception.status_code, 500)
@@ -0,0 +1,136 @@
+import base64
+import json
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from django.test import TestCase
+
+from scraper.scrapers.timeline_capture import TimelineCapture, parse_timeline
+from scraper.scrapers.twitter_scraper import grid_connection
+
+FIXTURE_RESPONSE = Path(__file__).resolve().parent.parent / 'fixtures' / 'search_timeline_response.json'
+TIMELINE_URL = 'https://x.com/i/api/graphql/UN1i3zUiCWa-6r-Uaho4fw/SearchTimeline?variables=%7B%7D'
+
+
+def perf_entry(method, **params):
+    """One ``driver.get_log('performance')`` entry as chromedriver reports it."""
+    return {'level': 'INFO', 'timestamp': 0, 'message': json.dumps({'message': {'method': method, 'params': params}})}
+
+
+def timeline_request(request_id, url=TIMELINE_URL, finished=True):
+    entries = [perf_entry('Network.responseReceived', requestId=request_id, response={'url': url, 'status': 200})]
+    if finished:
+        entries.append(perf_entry('Network.loadingFinished', requestId=request_id))
+    return entries
+
+
+def fake_driver(logs, bodies):
+    """*logs*: successive get_log batches; *bodies*: request id -> response body (or exception)."""
+    driver = MagicMock()
+    logs = iter(logs)
+    driver.get_log.side_effect = lambda kind: next(logs, [])
+
+    def execute(command, params):
+        body = bodies[params['params']['requestId']]
+        if isinstance(body, Exception):
+            raise body
+        return {'value': {'body': body, 'base64Encoded': False}}
+
+    driver.execute.side_effect = execute
+    return driver
+
+
+class ParseTimelineTests(TestCase):
+    def setUp(self):
+        self.payload = json.loads(FIXTURE_RESPONSE.read_text(encoding='utf-8'))
+
+    def test_recorded_response(self):
+        records = parse_timeline(self.payload)
+        # Five tweets; the tombstone and cursor entries are skipped.
+        self.assertEqual([r['status_id'] for r in records], [f'174500000000000000{i}' for i in range(1, 6)])
+        first = records[0]
+        self.assertEqual(first['datetime'], '2024-01-03T10:00:00.000Z')
+        self.assertEqual((first['likes'], first['retweets'], first['replies'], first['views']), (1520, 210, 48, 98231))
+        self.assertTrue(first['text'].startswith('$TSLA'))
+
+    def test_visibility_wrapper_and_long_tweets(self):
+        records = {r['status_id']: r for r in parse_timeline(self.payload)}
+        self.assertTrue(records['1745000000000000002']['text'].startswith('$NVDA'))
+        self.assertTrue(records['1745000000000000003']['text'].endswith('in one line.'))
+
+    def test_non_english_and_hidden_views(self):
+        records = {r['status_id']: r for r in parse_timeline(self.payload)}
+        self.assertIsNone(records['1745000000000000004']['text'])
+        self.assertIsNone(records['1745000000000000005']['views'])
+        self.assertEqual(records['1745000000000000005']['likes'], 0)
+
+    def test_unexpected_shapes(self):
+        self.assertEqual(parse_timeline({}), [])
+        self.assertEqual(parse_timeline({'data': {'tweet_results': {}}}), [])
+        [record] = parse_timeline({'tweet_results': {'result': {'rest_id': '7', 'legacy': {'lang': 'en'}}}})
+        self.assertEqual(record['status_id'], '7')
+        self.assertIsNone(record['datetime'])
+
+
+class TimelineCaptureTests(TestCase):
+    def setUp(self):
+        self.body = FIXTURE_RESPONSE.read_text(encoding='utf-8')
+
+    def test_reads_finished_timeline_responses(self):
+        other = timeline_request('9', url='https://x.com/i/api/graphql/abc/UserByScreenName')
+        driver = fake_driver([timeline_request('1') + other], {'1': self.body})
+        capture = TimelineCapture(driver)
+        self.assertEqual(len(capture.drain()), 5)
+        self.assertEqual((capture.responses, capture.complete), (1, True))
+        driver.execute.assert_called_once_with(
+            'executeCdpCommand', {'cmd': 'Network.getResponseBody', 'params': {'requestId': '1'}},
+        )
+
+    def test_waits_for_loading_to_finish(self):
+        driver = fake_driver(
+            [timeline_request('1', finished=False), [perf_entry('Network.loadingFinished', requestId='1')]],
+            {'1': self.body},
+        )
+        capture = TimelineCapture(driver)
+        self.assertEqual(capture.drain(), [])
+        self.assertEqual(len(capture.drain()), 5)
+
+    def test_base64_bodies(self):
+        driver = fake_driver([timeline_request('1')], {})
+        driver.execute.side_effect = lambda *a: {
+            'value': {'body': base64.b64encode(self.body.encode()).decode(), 'base64Encoded': True},
+        }
+        self.assertEqual(len(TimelineCapture(driver).drain()), 5)
+
+    def test_unreadable_body_marks_drain_incomplete(self):
+        driver = fake_driver(
+            [timeline_request('1') + timeline_request('2')],
+            {'1': RuntimeError('No resource with given identifier found'), '2': self.body},
+        )
+        capture = TimelineCapture(driver)
+        self.assertEqual(len(capture.drain()), 5)
+        self.assertEqual((capture.responses, capture.complete), (1, False))
+
+    def test_bodies_are_fetched_through_the_grid_connection(self):
+        # execute() as WebDriver.execute does it: the command goes through the
+        # Grid connection's real command table (only _request is faked).
+        connection = grid_connection('http://selenium:4444/wd/hub')
+        driver = fake_driver([timeline_request('1')], {})
+        driver.execute.side_effect = lambda command, params: connection.execute(command, {'sessionId': 's1', **params})
+        reply = {'status': 0, 'value': {'body': self.body, 'base64Encoded': False}}
+        with patch.object(connection, '_request', return_value=reply) as request:
+            self.assertEqual(len(TimelineCapture(driver).drain()), 5)
+        self.assertEqual(request.call_args.args[1], 'http://selenium:4444/wd/hub/session/s1/goog/cdp/execute')
+
+    def test_reset_discards_earlier_requests(self):
+        driver = fake_driver(
+            [timeline_request('1', finished=False),
+             [perf_entry('Network.loadingFinished', requestId='1')] + timeline_request('2')],
+            {'1': '{}', '2': self.body},
+        )
+        capture = TimelineCapture(driver)
+        capture.reset()
+        self.assertEqual(len(capture.drain()), 5)
+        driver.execute.assert_called_once_with(
+            'executeCdpCommand', {'cmd': 'Network.getResponseBody', 'params': {'requestId': '2'}},
+        )
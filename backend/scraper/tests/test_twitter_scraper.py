@@ -0,0 +1,511 @@
+import json
+import time
+from datetime import date, datetime, timezone
+from pathlib import Path
+from unittest.mock import patch, MagicMock
+
+import fakeredis
+import redis
+from django.test import TestCase, override_settings
+from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
+
+from scraper.scrapers.twitter_scraper import (
+    _EXTRACT_NEW_TWEETS_JS, _LEAN_PREFS, _PAGE_STATE_JS, TwitterScraper, _parse_count, _parse_views, extract_tweets,
+    WorkUnit, grid_connection, match_tickers,
+)
+from scraper.tests.test_timeline_capture import FIXTURE_RESPONSE, timeline_request
+
+FIXTURE_PAGE = Path(__file__).resolve().parent.parent / 'fixtures' / 'twitter_search_page.html'
+
+ARTICLE_HTML = (
+    '<article data-testid="tweet">'
+    '<div lang="en">$TSLA to the moon</div>'
+    '<time datetime="2024-01-02T10:00:00.000Z"></time>'
+    '<button data-testid="like">3K</button>'
+    '</article>'
+)
+
+
+def extracted(status_id='1', text='$TSLA to the moon', **overrides):
+    item = {
+        'text': text, 'datetime': '2024-01-02T10:00:00.000Z',
+        'likes': '12', 'retweets': '3K', 'replies': None,
+        'views': '1,234 views. View post analytics', 'status_id': status_id,
+    }
+    item.update(overrides)
+    return item
+
+
+class TwitterScraperTestCase(TestCase):
+    def setUp(self):
+        with patch('scraper.scrapers.twitter_scraper.apps'):
+            self.scraper = TwitterScraper()
+        self.scraper.instance = MagicMock()
+        self.redis = fakeredis.FakeStrictRedis(server=fakeredis.FakeServer())
+        patcher = patch('stocknlp.tasks.get_redis', return_value=self.redis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _fake_page(self, states, batches):
+        """Drive execute_script: ``states[n]`` is the page (height, articles) after n scrolls."""
+        scrolls = 0
+        batches = iter(batches)
+
+        def execute_script(script):
+            nonlocal scrolls
+            if script == _PAGE_STATE_JS:
+                return states[min(scrolls, len(states) - 1)]
+            if 'scrollTo' in script:
+                scrolls += 1
+                return None
+            return next(batches, '[]')
+
+        self.scraper.instance.execute_script.side_effect = execute_script
+
+
+class ParseHelpersTests(TestCase):
+    def test_parse_count(self):
+        self.assertEqual(_parse_count('12'), 12)
+        self.assertEqual(_parse_count('3K'), 3000)
+        self.assertIsNone(_parse_count(''))
+        self.assertIsNone(_parse_count('1.2K'))
+        self.assertEqual(_parse_count(0), 0)  # exact counts from captured responses
+
+    def test_parse_views(self):
+        self.assertEqual(_parse_views('1,234 Views. View post analytics'), 1234)
+        self.assertIsNone(_parse_views(None))
+
+
+class ExtractTweetsTests(TestCase):
+    def test_saved_page(self):
+        records = extract_tweets(FIXTURE_PAGE.read_text(encoding='utf-8'))
+        self.assertEqual(len(records), 40)
+        first = records[0]
+        self.assertEqual(first['status_id'], '1740000000000000000')
+        self.assertEqual(first['datetime'], '2024-01-02T10:00:00.000Z')
+        self.assertIn('$AAPL', first['text'])
+        self.assertTrue(first['views'].endswith('views. View post analytics'))
+        self.assertEqual(len({r['status_id'] for r in records}), 40)
+
+    def test_missing_fields_are_none(self):
+        [record] = extract_tweets('<article data-testid="tweet"><div lang="en">hi</div></article>')
+        self.assertEqual(record['text'], 'hi')
+        self.assertIsNone(record['datetime'])
+        self.assertIsNone(record['likes'])
+
+    def test_empty_page(self):
+        self.assertEqual(extract_tweets(''), [])
+
+
+class IncrementalExtractionTests(TwitterScraperTestCase):
+    def test_parse_tweet(self):
+        tweet = self.scraper._parse_tweet(extracted(), 'TSLA')
+        self.assertEqual(tweet['date'], date(2024, 1, 2))
+        self.assertEqual((tweet['likes'], tweet['retweets'], tweet['views']), (12, 3000, 1234))
+        self.assertEqual((tweet['ticker'], tweet['source'], tweet['status_id']), ('TSLA', 'twitter', '1'))
+
+    def test_parse_tweet_skips_tweets_without_text(self):
+        self.assertIsNone(self.scraper._parse_tweet(extracted(text=None), 'TSLA'))
+
+    def test_collect_uses_injected_script(self):
+        self.scraper.instance.execute_script.return_value = json.dumps([extracted()])
+        [item] = self.scraper._collect_new_tweets(self.scraper.instance)
+        self.assertEqual(item['status_id'], '1')
+        self.scraper.instance.execute_script.assert_called_once_with(_EXTRACT_NEW_TWEETS_JS)
+
+    def test_collect_falls_back_to_page_source(self):
+        self.scraper.instance.execute_script.side_effect = RuntimeError('no js')
+        self.scraper.instance.page_source = f'<html><body>{ARTICLE_HTML}</body></html>'
+        [item] = self.scraper._collect_new_tweets(self.scraper.instance)
+        self.assertEqual(self.scraper._parse_tweet(item, 'TSLA')['likes'], 3000)
+
+    @patch('scraper.scrapers.twitter_scraper.enqueue_scraper_data')
+    def test_scroll_enqueues_each_status_once(self, mock_enqueue):
+        self.scraper.config['scroll_timeout'] = 0.01
+        # Page grows on the first two scrolls, then stops growing (loop ends).
+        self._fake_page(
+            [[100, 0], [200, 2], [300, 3]],
+            [
+                json.dumps([extracted('1'), extracted('2', text='other')]),
+                json.dumps([extracted('2', text='other')]),  # re-rendered node
+            ],
+        )
+        self.scraper.instance.find_element.side_effect = Exception('no Latest tab')
+
+        self.assertEqual(self.scraper._scroll_and_collect('TSLA'), 2)
+        self.assertEqual(mock_enqueue.call_count, 2)
+
+    @patch('scraper.scrapers.twitter_scraper.enqueue_scraper_data')
+    def test_recrawl_skips_tweets_enqueued_before(self, mock_enqueue):
+        self.scraper.config['scroll_timeout'] = 0.01
+        self.scraper.instance.find_element.side_effect = Exception('no Latest tab')
+        for _ in range(2):
+            self._fake_page([[100, 0], [200, 2]], [json.dumps([extracted('1'), extracted('2', text='b')])])
+            self.scraper._scroll_and_collect('TSLA')
+        self.assertEqual(mock_enqueue.call_count, 2)
+
+    @patch('scraper.scrapers.twitter_scraper.enqueue_scraper_data')
+    def test_tweet_that_failed_to_enqueue_is_retried_next_crawl(self, mock_enqueue):
+        self.scraper.config['scroll_timeout'] = 0.01
+        self.scraper.instance.find_element.side_effect = Exception('no Latest tab')
+        mock_enqueue.side_effect = [redis.ConnectionError('down'), None, None]
+        for _ in range(2):
+            self._fake_page([[100, 0], [200, 2]], [json.dumps([extracted('1'), extracted('2', text='b')])])
+            self.scraper._scroll_and_collect('TSLA')
+        self.assertEqual([c.args[0]['status_id'] for c in mock_enqueue.call_args_list], ['1', '2', '1'])
+
+    @patch('scraper.scrapers.twitter_scraper.enqueue_scraper_data')
+    def test_results_are_exhausted_only_after_the_latest_tab(self, _enqueue):
+        self.scraper.config['scroll_timeout'] = 0.01
+        self._fake_page([[100, 0], [200, 2]], [])
+        stats = {}
+        self.scraper._scroll_and_collect('TSLA', stats=stats)
+        self.scraper.instance.find_element.return_value.click.assert_called_once()
+        self.assertTrue(stats['exhausted'])
+
+    @patch('scraper.scrapers.twitter_scraper.enqueue_scraper_data')
+    def test_missing_latest_tab_leaves_results_open(self, _enqueue):
+        self.scraper.config['scroll_timeout'] = 0.01
+        self.scraper.instance.find_element.side_effect = Exception('no Latest tab')
+        self._fake_page([[100, 0], [200, 2]], [])
+        stats = {}
+        with patch.object(self.scraper, '_log') as log:
+            self.scraper._scroll_and_collect('TSLA', stats=stats)
+        self.assertFalse(stats['exhausted'])
+        self.assertIn('Latest tab', log.call_args_list[0].args[1])
+
+    @patch('scraper.scrapers.twitter_scraper.enqueue_scraper_data')
+    def test_scroll_returns_as_soon_as_page_grows(self, _enqueue):
+        self._fake_page([[100, 0], [200, 5]], [])
+        self.scraper.config['scroll_timeout'] = 0.3
+        with patch.object(self.scraper, '_page_says_error', return_value=False), \
+                patch.object(self.scraper.instance, 'find_element', side_effect=Exception('no tab')):
+            started = time.monotonic()
+            self.scraper._scroll_and_collect('TSLA')
+        # One immediate step plus one stall at the ceiling — no fixed 5 s sleeps.
+        self.assertLess(time.monotonic() - started, 1.5)
+
+    @patch('scraper.scrapers.twitter_scraper.enqueue_scraper_data')
+    def test_rate_limit_backs_off_then_retries(self, _enqueue):
+        self.scraper.config['scroll_timeout'] = 0.01
+        self._fake_page([[100, 0], [100, 0], [200, 1]], [])
+        errors = iter([True, False])
+        with patch.object(self.scraper, '_page_says_error', side_effect=lambda *a: next(errors, False)), \
+                patch.object(self.scraper, '_back_off', return_value=True) as back_off, \
+                patch.object(self.scraper.instance, 'find_element', side_effect=Exception('no tab')):
+            self.scraper._scroll_and_collect('TSLA')
+        back_off.assert_called_once_with(self.scraper.instance, 0)
+
+    def test_back_off_is_interrupted_by_stop(self):
+        self.scraper.stop_event.set()
+        self.assertFalse(self.scraper._back_off(self.scraper.instance, 3))
+
+
+class NetworkCaptureTests(TwitterScraperTestCase):
+    def setUp(self):
+        super().setUp()
+        self.scraper.config['capture_mode'] = 'network'
+        self.driver = self.scraper.instance
+        self.driver.execute.return_value = {'value': {'body': FIXTURE_RESPONSE.read_text(encoding='utf-8')}}
+
+    def test_captured_responses_replace_page_scraping(self):
+        self.driver.get_log.return_value = timeline_request('1')
+        records = self.scraper._collect_new_tweets(self.driver)
+        self.assertEqual(len(records), 5)
+        self.driver.execute_script.assert_not_called()
+        tweet = self.scraper._parse_tweet(records[0], 'TSLA')
+        self.assertEqual((tweet['likes'], tweet['retweets'], tweet['views']), (1520, 210, 98231))
+        self.assertEqual(tweet['date'], date(2024, 1, 3))
+
+    def test_scrapes_page_until_a_response_is_captured(self):
+        self.driver.get_log.return_value = []
+        self.driver.execute_script.return_value = json.dumps([extracted()])
+        self.assertEqual([r['status_id'] for r in self.scraper._collect_new_tweets(self.driver)], ['1'])
+
+    def test_unreadable_response_adds_page_scraping(self):
+        self.driver.get_log.return_value = timeline_request('1') + timeline_request('2')
+        self.driver.execute.side_effect = [
+            {'value': {'body': FIXTURE_RESPONSE.read_text(encoding='utf-8')}}, RuntimeError('evicted'),
+        ]
+        self.driver.execute_script.return_value = json.dumps([extracted('9')])
+        self.assertEqual(len(self.scraper._collect_new_tweets(self.driver)), 6)
+
+    def test_capture_failure_falls_back_for_good(self):
+        self.driver.get_log.side_effect = RuntimeError("log type 'performance' not found")
+        self.driver.execute_script.return_value = '[]'
+        self.scraper._collect_new_tweets(self.driver)
+        self.scraper._collect_new_tweets(self.driver)
+        self.driver.get_log.assert_called_once()
+        self.assertEqual(self.driver.execute_script.call_count, 2)
+
+    def test_dom_mode_never_reads_the_log(self):
+        self.scraper.config['capture_mode'] = 'dom'
+        self.driver.execute_script.return_value = '[]'
+        self.scraper._collect_new_tweets(self.driver)
+        self.driver.get_log.assert_not_called()
+
+    def test_dom_is_the_default(self):
+        del self.scraper.config['capture_mode']
+        with patch('scraper.scrapers.twitter_scraper.webdriver') as webdriver, \
+                patch('scraper.scrapers.twitter_scraper.os.getenv', return_value='local'):
+            self.scraper._new_driver()
+        webdriver.ChromeOptions.return_value.set_capability.assert_not_called()
+
+    @patch('scraper.scrapers.twitter_scraper.enqueue_scraper_data')
+    def test_new_search_discards_earlier_responses(self, mock_enqueue):
+        self.scraper.config['scroll_timeout'] = 0.01
+        self.driver.find_element.side_effect = Exception('no Latest tab')
+        self._fake_page([[100, 0], [200, 5]], [])
+        logs = iter([timeline_request('old'), timeline_request('1')])
+        self.driver.get_log.side_effect = lambda kind: next(logs, [])
+
+        with patch.object(self.scraper, '_wait_until_loaded'):
+            self.assertEqual(self.scraper._scrape_ticker('TSLA', '2024-01-03', '2024-01-04'), 4)
+        self.driver.execute.assert_called_once()
+        self.assertEqual(mock_enqueue.call_args_list[0].args[0]['status_id'], '1745000000000000001')
+
+    def test_network_mode_enables_performance_log(self):
+        with patch('scraper.scrapers.twitter_scraper.webdriver') as webdriver, \
+                patch('scraper.scrapers.twitter_scraper.os.getenv', return_value='local'):
+            self.scraper._new_driver()
+        webdriver.ChromeOptions.return_value.set_capability.assert_called_once_with(
+            'goog:loggingPrefs', {'performance': 'ALL'},
+        )
+
+
+class BrowserProfileTests(TwitterScraperTestCase):
+    def _new_driver(self, **config):
+        self.scraper.config.update(config)
+        with patch('scraper.scrapers.twitter_scraper.webdriver') as webdriver, \
+                patch('scraper.scrapers.twitter_scraper.os.getenv', return_value='local'):
+            driver = self.scraper._new_driver()
+        options = webdriver.ChromeOptions.return_value
+        arguments = [c.args[0] for c in options.add_argument.call_args_list]
+        return driver, options, arguments
+
+    def test_lean_profile_blocks_heavy_content(self):
+        driver, options, arguments = self._new_driver(browser_profile='lean')
+        options.add_experimental_option.assert_any_call('prefs', _LEAN_PREFS)
+        self.assertIn('--blink-settings=imagesEnabled=false', arguments)
+        self.assertNotIn('--headless=new', arguments)
+        commands = {c.args[1]['cmd']: c.args[1]['params'] for c in driver.execute.call_args_list}
+        self.assertIn('Network.enable', commands)
+        self.assertIn('*pbs.twimg.com/*', commands['Network.setBlockedURLs']['urls'])
+
+    def test_full_profile_loads_everything(self):
+        driver, options, arguments = self._new_driver(browser_profile='full', headless=True)
+        self.assertNotIn('--blink-settings=imagesEnabled=false', arguments)
+        self.assertIn('--headless=new', arguments)
+        driver.execute.assert_not_called()
+
+    def test_full_is_the_default(self):
+        del self.scraper.config['browser_profile']
+        driver, _options, arguments = self._new_driver()
+        self.assertNotIn('--blink-settings=imagesEnabled=false', arguments)
+        driver.execute.assert_not_called()
+
+    def test_blocking_failure_keeps_the_session(self):
+        self.scraper.config['browser_profile'] = 'lean'
+        with patch('scraper.scrapers.twitter_scraper.webdriver') as webdriver, \
+                patch('scraper.scrapers.twitter_scraper.os.getenv', return_value='local'), \
+                patch.object(self.scraper, '_log') as log:
+            webdriver.Chrome.return_value.execute.side_effect = RuntimeError('unknown command')
+            self.assertIs(self.scraper._new_driver(), webdriver.Chrome.return_value)
+        self.assertIn('Could not block media requests', log.call_args.args[1])
+
+    def test_grid_connection_routes_cdp_commands(self):
+        # A real connection's command table, not a mocked driver: the request
+        # must resolve to chromedriver's CDP endpoint on the Grid.
+        connection = grid_connection('http://selenium:4444/wd/hub')
+        with patch.object(connection, '_request', return_value={'status': 0, 'value': {}}) as request:
+            connection.execute('executeCdpCommand', {'sessionId': 'abc', 'cmd': 'Network.enable', 'params': {}})
+        method, url = request.call_args.args
+        self.assertEqual((method, url), ('POST', 'http://selenium:4444/wd/hub/session/abc/goog/cdp/execute'))
+        self.assertEqual(json.loads(request.call_args.kwargs['body']), {'cmd': 'Network.enable', 'params': {}})
+
+    @override_settings(SELENIUM_GRID_URL='http://selenium:4444/wd/hub')
+    def test_grid_sessions_can_send_cdp_commands(self):
+        with patch('scraper.scrapers.twitter_scraper.webdriver') as webdriver, \
+                patch('scraper.scrapers.twitter_scraper.os.getenv', return_value='grid'):
+            self.scraper._new_driver()
+        executor = webdriver.Remote.call_args.kwargs['command_executor']
+        self.assertIsInstance(executor, ChromiumRemoteConnection)
+        self.assertIn('executeCdpCommand', executor._commands)
+
+    @patch('scraper.scrapers.twitter_scraper.SCRAPER_PAGE_LOAD')
+    def test_page_load_time_is_recorded_per_profile(self, page_load):
+        self.scraper.config['browser_profile'] = 'lean'
+        with patch.object(self.scraper, '_wait_until_loaded'), \
+                patch.object(self.scraper, '_scroll_and_collect', return_value=0):
+            self.scraper._scrape_ticker('TSLA', '2024-01-03', '2024-01-04')
+        self.assertEqual(page_load.observe.call_args.kwargs, {'profile': 'lean'})
+
+
+class ParallelSessionTests(TwitterScraperTestCase):
+    def setUp(self):
+        super().setUp()
+        self.scraper.config['twitter_query'].update({'start_date': '2024-01-01', 'end_date': '2024-01-02'})
+        self.scraper.config['twitter_query']['params']['ticker'] = ['TSLA', 'AAPL']
+
+    def test_work_units_newest_date_first(self):
+        units = self.scraper._gen_work_units()
+        self.assertEqual([units.get() for _ in range(units.qsize())], [
+            WorkUnit(('TSLA',), '2024-01-02', '2024-01-03'), WorkUnit(('AAPL',), '2024-01-02', '2024-01-03'),
+            WorkUnit(('TSLA',), '2024-01-01', '2024-01-02'), WorkUnit(('AAPL',), '2024-01-01', '2024-01-02'),
+        ])
+
+    def test_extra_sessions_reuse_login_cookies(self):
+        self.scraper.instance.get_cookies.return_value = [
+            {'name': 'auth_token', 'value': 'x', 'domain': '.x.com', 'path': '/', 'sameSite': 'None', 'size': 3},
+        ]
+        extra = MagicMock()
+        with patch.object(self.scraper, '_new_driver', return_value=extra):
+            sessions = self.scraper._open_sessions(2)
+        self.assertEqual(sessions, [self.scraper.instance, extra])
+        extra.add_cookie.assert_called_once_with(
+            {'name': 'auth_token', 'value': 'x', 'domain': '.x.com', 'path': '/', 'sameSite': 'None'},
+        )
+
+    def test_surplus_sessions_are_closed(self):
+        extra = MagicMock()
+        self.scraper.sessions = [self.scraper.instance, extra]
+        self.assertEqual(self.scraper._open_sessions(1), [self.scraper.instance])
+        extra.quit.assert_called_once()
+
+    def test_units_are_spread_over_sessions_and_aggregated(self):
+        self.scraper.config['threads'] = 2
+        drivers = [self.scraper.instance, MagicMock()]
+        used = []
+
+        def scrape(ticker, since, until, driver=None, progress=None, **kwargs):
+            used.append(driver)
+            progress(1)
+            progress(2)
+            return 2
+
+        with patch.object(self.scraper, '_open_sessions', return_value=drivers) as open_sessions, \
+                patch.object(self.scraper, '_scrape_ticker', side_effect=scrape):
+            self.scraper._crawl()
+
+        open_sessions.assert_called_once_with(2)
+        self.assertEqual(len(used), 4)
+        task = self.scraper.current_task
+        self.assertEqual((task['count'], task['units_done'], task['units_total']), (8, 4, 4))
+        self.assertEqual(task['sessions'], {})
+        self.assertEqual(task['source'], 'twitter')
+
+    def test_dead_session_leaves_remaining_units(self):
+        dead = MagicMock()
+        type(dead).window_handles = property(lambda self: (_ for _ in ()).throw(RuntimeError('gone')))
+        units = self.scraper._gen_work_units()
+        self.scraper._start_cycle(units.qsize(), 2)
+        with patch.object(self.scraper, '_scrape_ticker', side_effect=RuntimeError('session deleted')):
+            self.scraper._session_worker('session-1', dead, units)
+        self.assertEqual(units.qsize(), 3)
+        self.assertEqual(self.scraper.current_task['units_done'], 1)
+
+    def test_crashed_session_is_logged(self):
+        with patch.object(self.scraper, '_open_sessions', return_value=[self.scraper.instance]), \
+                patch.object(self.scraper, '_report_progress', side_effect=RuntimeError('boom')), \
+                patch.object(self.scraper, '_log') as log:
+            self.scraper._crawl()
+        messages = [c.args[1] for c in log.call_args_list]
+        self.assertIn('[session-1] Session crashed: boom', messages)
+        self.assertIn('3 work units left unscraped this cycle.', messages)
+
+
+class CheckpointTests(TwitterScraperTestCase):
+    def setUp(self):
+        super().setUp()
+        self.scraper.config['twitter_query'].update({'start_date': '2024-01-01', 'end_date': '2024-01-02'})
+        self.scraper.config['twitter_query']['params']['ticker'] = ['TSLA']
+
+    def _finish(self, unit, started_at, newest='2024-01-02T18:30:00.000Z', exhausted=True):
+        self.scraper._save_checkpoint(unit, {'newest': newest, 'exhausted': exhausted}, started_at)
+
+    def test_closed_days_are_skipped_and_open_days_resume(self):
+        after_midnight = datetime(2024, 1, 3, 2, tzinfo=timezone.utc)
+        self._finish(WorkUnit(('TSLA',), '2024-01-01', '2024-01-02'), after_midnight, '2024-01-01T20:00:00.000Z')
+        self._finish(WorkUnit(('TSLA',), '2024-01-02', '2024-01-03'), datetime(2024, 1, 2, 19, tzinfo=timezone.utc))
+
+        units = self.scraper._gen_work_units()
+        self.assertEqual(units.qsize(), 1)
+        unit = units.get()
+        self.assertEqual(unit.date, '2024-01-02')
+        self.assertEqual(unit.since_time, int(datetime(2024, 1, 2, 18, 30, tzinfo=timezone.utc).timestamp()))
+
+    def test_day_is_not_closed_within_grace(self):
+        self._finish(WorkUnit(('TSLA',), '2024-01-02', '2024-01-03'), datetime(2024, 1, 3, 0, 10, tzinfo=timezone.utc))
+        self.assertEqual(self.scraper._gen_work_units().qsize(), 2)
+
+    def test_interrupted_crawl_leaves_no_mark(self):
+        self._finish(WorkUnit(('TSLA',), '2024-01-02', '2024-01-03'), datetime(2024, 1, 2, 19, tzinfo=timezone.utc),
+                     exhausted=False)
+        self.assertIsNone(self.scraper._gen_work_units().get().since_time)
+
+    def test_high_water_mark_never_moves_back(self):
+        unit = WorkUnit(('TSLA',), '2024-01-02', '2024-01-03')
+        started = datetime(2024, 1, 2, 19, tzinfo=timezone.utc)
+        self._finish(unit, started, '2024-01-02T18:30:00.000Z')
+        self._finish(unit, started, None)
+        self._finish(unit, started, '2024-01-02T10:00:00.000Z')
+        since = self.scraper._gen_work_units().get().since_time
+        self.assertEqual(since, int(datetime(2024, 1, 2, 18, 30, tzinfo=timezone.utc).timestamp()))
+
+    def test_group_starts_at_least_advanced_ticker(self):
+        self.scraper.config['twitter_query']['params']['ticker'] = ['TSLA', 'NVDA', 'AAPL']
+        self.scraper.config['ticker_group_size'] = 2
+        started = datetime(2024, 1, 2, 19, tzinfo=timezone.utc)
+        self._finish(WorkUnit(('TSLA',), '2024-01-02', '2024-01-03'), started, '2024-01-02T18:00:00.000Z')
+        self._finish(WorkUnit(('NVDA',), '2024-01-02', '2024-01-03'), started, '2024-01-02T12:00:00.000Z')
+        self._finish(WorkUnit(('AAPL',), '2024-01-01', '2024-01-02'), datetime(2024, 1, 3, tzinfo=timezone.utc))
+
+        units = self.scraper._gen_work_units()
+        got = [units.get() for _ in range(units.qsize())]
+        self.assertEqual([(u.tickers, u.date) for u in got], [
+            (('TSLA', 'NVDA'), '2024-01-02'), (('AAPL',), '2024-01-02'), (('TSLA', 'NVDA'), '2024-01-01'),
+        ])
+        self.assertEqual(got[0].since_time, int(datetime(2024, 1, 2, 12, tzinfo=timezone.utc).timestamp()))
+        self.assertIsNone(got[1].since_time)
+
+    def test_group_checkpoint_marks_every_ticker(self):
+        self.scraper.config['twitter_query']['params']['ticker'] = ['TSLA', 'NVDA']
+        self._finish(WorkUnit(('TSLA', 'NVDA'), '2024-01-01', '2024-01-02'), datetime(2024, 1, 3, tzinfo=timezone.utc))
+        self.assertEqual([u.date for u in [self.scraper._gen_work_units().get()]], ['2024-01-02'])
+
+    def test_query_uses_since_time(self):
+        [query] = self.scraper._generate_twitter_query('TSLA', '2024-01-02', '2024-01-03', since_time=1704200000)
+        self.assertIn('since_time:1704200000 until:2024-01-03', query)
+        self.assertNotIn('since:', query)
+
+
+class TickerGroupTests(TwitterScraperTestCase):
+    def test_group_query_ors_cashtags(self):
+        [query] = self.scraper._generate_twitter_query(('TSLA', 'NVDA'), '2024-01-02', '2024-01-03')
+        self.assertTrue(query.startswith('($TSLA OR $NVDA) lang:en since:2024-01-02'))
+        [single] = self.scraper._generate_twitter_query(('TSLA',), '2024-01-02', '2024-01-03')
+        self.assertTrue(single.startswith('TSLA lang:en'))
+
+    def test_match_tickers(self):
+        group = ('TSLA', 'NVDA', 'BRK.B')
+        self.assertEqual(match_tickers('$nvda and $TSLA, not $AAPL', group), ['NVDA', 'TSLA'])
+        self.assertEqual(match_tickers('loading up on $BRK.B.', group), ['BRK.B'])
+        self.assertEqual(match_tickers('markets are up', group), [])
+
+    def test_match_tickers_ignores_bare_words(self):
+        self.assertEqual(match_tickers('TSLA deliveries beat', ('TSLA',)), [])
+        self.assertEqual(match_tickers('buy it NOW, all of it', ('NOW', 'ALL', 'IT')), [])
+
+    @patch('scraper.scrapers.twitter_scraper.enqueue_scraper_data')
+    def test_tweet_is_enqueued_once_per_matching_ticker(self, mock_enqueue):
+        self.scraper.config['scroll_timeout'] = 0.01
+        self.scraper.instance.find_element.side_effect = Exception('no Latest tab')
+        self._fake_page([[100, 0], [200, 3]], [json.dumps([
+            extracted('1', text='$TSLA and $NVDA both up'),
+            extracted('2', text='$NVDA earnings'),
+            extracted('3', text='nothing relevant'),
+        ])])
+        count = self.scraper._scroll_and_collect(('TSLA', 'NVDA'))
+        enqueued = sorted((c.args[0]['status_id'], c.args[0]['ticker']) for c in mock_enqueue.call_args_list)
+        self.assertEqual(enqueued, [('1', 'NVDA'), ('1', 'TSLA'), ('2', 'NVDA')])
+        self.assertEqual(count, 3)
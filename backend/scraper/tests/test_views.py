@@ -1,13 +1,21 @@
-from unittest.mock import patch, MagicMock
+import base64
+import json
+from unittest.mock import patch, AsyncMock
 
-from django.test import TestCase
+from asgiref.sync import sync_to_async
+from django.contrib.auth.models import User
+from django.test import AsyncRequestFactory, TestCase
 from django.utils import timezone
+from rest_framework.authentication import BasicAuthentication, SessionAuthentication
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import IsAuthenticatedOrReadOnly
 from rest_framework.test import APIRequestFactory, APIClient
 
 from scraper.models import (
     Config, Source, Content, PostMeta, PostPrediction, Post,
 )
 from scraper.views.control import ScraperControlView, ScraperLogsView, ScraperConfigView
+from scraper.views.eval import AsyncEvalView, EvalView
 from tickers.models import Ticker
 
 
@@ -212,3 +220,81 @@ class EvalViewTests(TestCase):
         request = self.factory.post('/api/eval/', {})
         response = view(request)
         self.assertEqual(response.status_code, 400)
+
+
+# EvalView's classes outside DEBUG (the suite runs with DJANGO_DEBUG, i.e. AllowAny).
+production_auth = patch.multiple(
+    EvalView,
+    authentication_classes=[SessionAuthentication, BasicAuthentication],
+    permission_classes=[IsAuthenticatedOrReadOnly],
+)
+
+
+class AsyncEvalViewTests(TestCase):
+    def setUp(self):
+        self.factory = AsyncRequestFactory()
+        self.payload = {
+            'tweet': 'test tweet',
+            'ticker': '$AAPL',
+            'source_name': 'test',
+            'date': '2024-01-01',
+        }
+
+    def _request(self, data, **headers):
+        return self.factory.post('/api/eval/', data, content_type='application/json', headers=headers)
+
+    @patch('scraper.views.eval.DataService.evaluate_sentiment_via_worker', new_callable=AsyncMock)
+    async def test_successful_evaluation(self, mock_eval):
+        mock_eval.return_value = {
+            'text': 'test tweet',
+            'cleaned_text': 'test tweet',
+            'ticker': '$AAPL',
+            'prediction': 2,
+            'predicted_probabilities': [0.1, 0.2, 0.7],
+        }
+        response = await AsyncEvalView.as_view()(self._request(self.payload))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.content)['predicted_sentiment'], 2)
+
+    @patch('scraper.views.eval.DataService.evaluate_sentiment_via_worker', new_callable=AsyncMock)
+    async def test_worker_timeout_returns_504(self, mock_eval):
+        mock_eval.side_effect = TimeoutError('Result not received from worker in 30s')
+        response = await AsyncEvalView.as_view()(self._request(self.payload))
+        self.assertEqual(response.status_code, 504)
+
+    @patch('scraper.views.eval.DataService.evaluate_sentiment_via_worker', new_callable=AsyncMock)
+    async def test_worker_rejecting_input_returns_400(self, mock_eval):
+        mock_eval.side_effect = ValidationError("Unknown model ID 'Nope'")
+        response = await AsyncEvalView.as_view()(self._request(self.payload))
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(json.loads(response.content), ["Unknown model ID 'Nope'"])
+
+    @patch('scraper.views.eval.DataService.evaluate_sentiment_via_worker', new_callable=AsyncMock)
+    async def test_missing_required_fields(self, mock_eval):
+        response = await AsyncEvalView.as_view()(self._request({}))
+        self.assertEqual(response.status_code, 400)
+        mock_eval.assert_not_called()
+
+    @production_auth
+    async def test_anonymous_user_rejected_like_eval_view(self):
+        response = await AsyncEvalView.as_view()(self._request(self.payload))
+        sync_response = EvalView.as_view()(APIRequestFactory().post('/api/eval/', self.payload, format='json'))
+        self.assertEqual(response.status_code, sync_response.status_code)
+        self.assertEqual(response.status_code, 403)
+
+    @production_auth
+    @patch('scraper.views.eval.DataService.evaluate_sentiment_via_worker', new_callable=AsyncMock)
+    async def test_basic_auth_is_accepted(self, mock_eval):
+        mock_eval.return_value = {
+            'text': 'test tweet', 'cleaned_text': 'test tweet', 'ticker': '$AAPL',
+            'prediction': 2, 'predicted_probabilities': [0.1, 0.2, 0.7],
+        }
+        await sync_to_async(User.objects.create_user)('api', password='secret')
+        credentials = base64.b64encode(b'api:secret').decode()
+        response = await AsyncEvalView.as_view()(
+            self._request(self.payload, Authorization=f'Basic {credentials}'),
+        )
+        self.assertEqual(response.status_code, 200, response.content)
+
+    def test_exempt_from_csrf_middleware(self):
+        self.assertTrue(AsyncEvalView.as_view().csrf_exempt)
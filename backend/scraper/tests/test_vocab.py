@@ -0,0 +1,108 @@
+import json
+import mmap
+import os
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+import numpy as np
+from django.core.management import call_command
+from django.test import TestCase
+
+from scraper.managers.data_manager.model_processors import LSTMCNNPreprocessor
+from scraper.managers.data_manager.vocab import _CACHE_SIZE
+from scraper.managers.data_manager.vocab import CompactVocab
+from scraper.managers.data_manager.vocab import compiled_path
+from scraper.managers.data_manager.vocab import load_vocab
+
+WORDS = {'apple': 1, 'stock': 2, 'is': 3, 'going': 4, 'up': 5, 'café': 6}
+
+
+class CompactVocabTests(TestCase):
+    def setUp(self):
+        self.vocab = CompactVocab.from_mapping(WORDS)
+
+    def test_dict_style_lookup(self):
+        self.assertEqual(len(self.vocab), len(WORDS))
+        for word, index in WORDS.items():
+            self.assertEqual(self.vocab[word], index)
+            self.assertIn(word, self.vocab)
+        self.assertEqual(self.vocab.get('missing', 0), 0)
+        self.assertNotIn('missing', self.vocab)
+        with self.assertRaises(KeyError):
+            self.vocab['missing']
+
+    def test_encode_batch_pads_truncates_and_defaults(self):
+        encoded = self.vocab.encode_batch(
+            [['apple', 'is', 'going', 'up', 'stock'], ['unknown', 'café'], []],
+            max_len=4,
+            pad_token=0,
+        )
+        self.assertEqual(encoded.dtype, np.int64)
+        np.testing.assert_array_equal(encoded, [
+            [1, 3, 4, 5],
+            [0, 6, 0, 0],
+            [0, 0, 0, 0],
+        ])
+
+    def test_repeated_lookups_are_cached(self):
+        for _ in range(2):
+            self.assertEqual(self.vocab.get('café'), 6)
+            self.assertEqual(self.vocab.get('missing', -1), -1)
+            self.assertIsNone(self.vocab.get('missing'))
+        info = self.vocab._lookup.cache_info()
+        self.assertEqual((info.currsize, info.misses), (2, 2))
+
+    def test_lookup_cache_stays_bounded(self):
+        for i in range(_CACHE_SIZE * 2):
+            self.vocab.get(f'oov{i}')
+        self.assertEqual(self.vocab._lookup.cache_info().currsize, _CACHE_SIZE)
+
+        preprocessor = LSTMCNNPreprocessor(self.vocab, max_len=8)
+        for i in range(_CACHE_SIZE * 2):
+            preprocessor.tokenize(f'apple word{i}')
+        self.assertEqual(self.vocab._lookup.cache_info().currsize, _CACHE_SIZE)
+
+    def test_empty_vocab_encodes_to_padding(self):
+        encoded = CompactVocab.from_mapping({}).encode_batch([['a']], max_len=2)
+        np.testing.assert_array_equal(encoded, [[0, 0]])
+
+
+class CompiledVocabFileTests(TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.json_path = Path(self.tmp.name) / 'word_to_index.json'
+        self.json_path.write_text(json.dumps(WORDS), encoding='utf-8')
+
+    def test_compiled_file_is_memory_mapped_and_equivalent(self):
+        call_command('compile_vocab', str(self.json_path), stdout=open(os.devnull, 'w'))
+        vocab = load_vocab(self.json_path)
+        self.assertIsInstance(vocab._blob.obj, mmap.mmap)
+        self.assertFalse(vocab._hashes.flags.owndata)
+        for word, index in WORDS.items():
+            self.assertEqual(vocab[word], index)
+
+    def test_stale_compiled_file_is_ignored(self):
+        CompactVocab.from_mapping({'apple': 99}).save(compiled_path(self.json_path))
+        stale = compiled_path(self.json_path).stat().st_mtime
+        os.utime(self.json_path, (stale + 10, stale + 10))
+        self.assertEqual(load_vocab(self.json_path)['apple'], 1)
+
+    def test_save_leaves_no_temporary_file(self):
+        CompactVocab.from_mapping(WORDS).save(compiled_path(self.json_path))
+        self.assertEqual(
+            sorted(p.name for p in Path(self.tmp.name).iterdir()),
+            ['word_to_index.json', 'word_to_index.vocab'],
+        )
+
+    def test_compile_can_skip_missing_files(self):
+        missing = Path(self.tmp.name) / 'ticker_to_index.json'
+        out = StringIO()
+        call_command('compile_vocab', str(self.json_path), str(missing), '--skip-missing', stdout=out)
+        self.assertTrue(compiled_path(self.json_path).exists())
+        self.assertIn('skipped', out.getvalue())
+
+    def test_rejects_non_vocab_file(self):
+        with self.assertRaises(ValueError):
+            CompactVocab.load(self.json_path)
@@ -1,6 +1,8 @@
+from django.conf import settings
 from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 from .views import (
+    AsyncEvalView,
     ConfigViewSet,
     EvalView,
     PostViewSet,
@@ -27,7 +29,11 @@ urlpatterns = [
     path("scraper/config/", ScraperConfigView.as_view(), name="scraper-config"),
 
     # NLP / prediction endpoints
-    path("eval/", EvalView.as_view(), name="eval"),
+    path(
+        "eval/",
+        AsyncEvalView.as_view() if settings.EVAL_VIA_WORKER else EvalView.as_view(),
+        name="eval",
+    ),
     path("predictions-by-day/", PredictionsByDayView.as_view(), name="predictions-by-day"),
 
     # ViewSets
@@ -1,5 +1,5 @@
 from .control import ScraperControlView, ScraperLogsView, ScraperConfigView
 from .source import SourceViewSet
 from .config import ConfigViewSet
-from .eval import EvalView, PredictionsByDayView
+from .eval import AsyncEvalView, EvalView, PredictionsByDayView
 from .post import PostViewSet
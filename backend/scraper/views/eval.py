@@ -1,3 +1,12 @@
+import json
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import JsonResponse
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import exceptions
+from rest_framework.exceptions import APIException
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from ..serializers import EvalRequestSerializer, EvalResponseSerializer
@@ -20,6 +29,77 @@ class EvalView(APIView):
         response_serializer = EvalResponseSerializer(result)
         return Response(response_serializer.data)
 
+class AsyncEvalView(View):
+    """
+    On-demand sentiment evaluation delegated to the LLM worker.
+
+    Used for /eval/ when EVAL_VIA_WORKER is enabled. The request goes through
+    user_queue and the response key is awaited, so this process never loads
+    a model and no thread is blocked while the worker runs inference.
+
+    Access is decided by ``EvalView``'s own DRF authenticators, permission
+    and throttle classes, so both endpoints accept the same clients.
+    """
+    @classmethod
+    def as_view(cls, **initkwargs):
+        # As with APIView: CSRF is enforced by SessionAuthentication (for
+        # session-authenticated requests only), not by the middleware.
+        return csrf_exempt(super().as_view(**initkwargs))
+
+    @staticmethod
+    def _check_access(request) -> JsonResponse | None:
+        """Authenticate and authorize *request* as ``EvalView`` would; a response if refused."""
+        gate = EvalView()
+        gate.args, gate.kwargs, gate.headers = (), {}, {}
+        drf_request = gate.initialize_request(request)
+        gate.request = drf_request
+        try:
+            gate.perform_authentication(drf_request)
+            gate.check_permissions(drf_request)
+            gate.check_throttles(drf_request)
+        except exceptions.APIException as e:
+            status, headers = e.status_code, {}
+            if isinstance(e, (exceptions.NotAuthenticated, exceptions.AuthenticationFailed)):
+                # APIView answers 401 only when an authenticator can issue a challenge.
+                challenge = gate.get_authenticate_header(drf_request)
+                if challenge:
+                    headers['WWW-Authenticate'] = challenge
+                else:
+                    status = 403
+            return JsonResponse({'detail': str(e.detail)}, status=status, headers=headers)
+        return None
+
+    async def post(self, request):
+        # Session/basic auth hit the database, so run them off the event loop.
+        refused = await sync_to_async(self._check_access)(request)
+        if refused is not None:
+            return refused
+
+        if request.content_type == 'application/json':
+            try:
+                data = json.loads(request.body or b'{}')
+            except json.JSONDecodeError:
+                return JsonResponse({'detail': 'Malformed JSON body.'}, status=400)
+        else:
+            data = request.POST
+
+        serializer = EvalRequestSerializer(data=data)
+        if not serializer.is_valid():
+            return JsonResponse(serializer.errors, status=400)
+
+        try:
+            result = await DataService.evaluate_sentiment_via_worker(
+                serializer.validated_data,
+                timeout=settings.EVAL_WORKER_TIMEOUT,
+                with_save=serializer.validated_data.get('with_save', False),
+            )
+        except TimeoutError as e:
+            return JsonResponse({'error': str(e)}, status=504)
+        except APIException as e:
+            return JsonResponse(e.detail, status=e.status_code, safe=False)
+
+        return JsonResponse(EvalResponseSerializer(result).data)
+
 class PredictionsByDayView(APIView):
     """
     Aggregated prediction statistics optimized for performance.
@@ -15,3 +15,18 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'stocknlp.settings')
 
 application = get_asgi_application()
+
+# Optionally load and warm models before the server accepts traffic
+# (API_PRELOAD_MODELS); by default the API leaves inference to the worker.
+from django.conf import settings  # noqa: E402
+
+if settings.API_PRELOAD_MODELS:
+    from django.apps import apps
+
+    from stocknlp.tasks import start_model_reload_listener
+
+    apps.get_app_config('scraper').MODEL_REGISTRY.preload(
+        settings.API_PRELOAD_MODELS, settings.MODEL_WARMUP_SEQ_LENS,
+    )
+    # Hot-swap the preloaded models on `manage.py reload_model` broadcasts.
+    start_model_reload_listener()
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import itertools
+import json
+import os
+import platform
+import resource
+import time
+from collections import Counter
+
+from django.apps import apps
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+
+from scraper.managers.data_manager.fast_tokenizers import load_parity_corpus
+from stocknlp.stage_timer import percentile
+
+
+def _int_list(value: str) -> list[int]:
+    return [int(item) for item in value.split(',') if item.strip()]
+
+
+def _peak_rss_mb() -> float:
+    """High-water mark of the whole process so far (covers every model loaded before)."""
+    # ru_maxrss is KiB on Linux, bytes on macOS.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (2**20 if platform.system() == 'Darwin' else 2**10), 1)
+
+
+def _rss_mb() -> float | None:
+    """Current resident set size, or None where /proc is unavailable (macOS)."""
+    try:
+        with open('/proc/self/statm') as file:
+            pages = int(file.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+    return round(pages * os.sysconf('SC_PAGE_SIZE') / 2**20, 1)
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark preprocessing + prediction for each model over a grid of batch "
+        "sizes, tweet lengths and torch thread counts (JSON output)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--models',
+            default=None,
+            help='Comma-separated model IDs, cascades included (default: every available model).',
+        )
+        parser.add_argument('--batch-sizes', type=_int_list, default=[1, 8, 32])
+        parser.add_argument(
+            '--seq-lens',
+            type=_int_list,
+            default=[8, 32, 128],
+            help='Synthetic tweet lengths in words (ignored with --texts).',
+        )
+        parser.add_argument('--threads', type=_int_list, default=[1, os.cpu_count() or 1])
+        parser.add_argument('--iterations', type=int, default=20, help='Timed batches per grid point.')
+        parser.add_argument('--warmup', type=int, default=3, help='Untimed batches per grid point.')
+        parser.add_argument(
+            '--texts',
+            default=None,
+            help='File with one tweet per line to use instead of synthetic tweets.',
+        )
+        parser.add_argument('--output', '-o', default=None, help='Also write the JSON report here.')
+
+    @staticmethod
+    def _tweets(lines: list[str], batch_size: int, seq_len: int | None, offset: int) -> list[dict]:
+        """*batch_size* tweets of *seq_len* words (or fixture lines as-is if None)."""
+        if seq_len is None:
+            picked = [lines[(offset + i) % len(lines)] for i in range(batch_size)]
+        else:
+            words = ' '.join(lines).split()
+            picked = [
+                ' '.join(itertools.islice(itertools.cycle(words), offset + i * 7, offset + i * 7 + seq_len))
+                for i in range(batch_size)
+            ]
+        return [{'text': text, 'ticker': 'AAPL'} for text in picked]
+
+    def _run_point(self, data_manager, model_id, lines, batch_size, seq_len, iterations, warmup) -> dict:
+        latencies = []
+        answered_by = Counter()
+        failures = 0
+        for i in range(warmup + iterations):
+            tweets = self._tweets(lines, batch_size, seq_len, offset=i * batch_size)
+            start = time.perf_counter()
+            results = data_manager.eval_sentiment_batch(tweets, model_id=model_id)
+            elapsed = time.perf_counter() - start
+            if i < warmup:
+                continue
+            latencies.append(elapsed)
+            failures += sum(1 for r in results if r['prediction'] == 'unknown')
+            answered_by.update(r['answered_by'] for r in results if 'answered_by' in r)
+
+        point = {
+            'batch_p50_ms': round(percentile(latencies, 50) * 1000, 3),
+            'batch_p95_ms': round(percentile(latencies, 95) * 1000, 3),
+            'batch_p99_ms': round(percentile(latencies, 99) * 1000, 3),
+            'tweets_per_sec': round(batch_size * len(latencies) / sum(latencies), 1),
+            'failed_predictions': failures,
+        }
+        if answered_by:
+            point['answered_by'] = dict(answered_by)
+        return point
+
+    def handle(self, *args, **options):
+        import torch
+
+        scraper_app = apps.get_app_config('scraper')
+        registry = scraper_app.MODEL_REGISTRY
+        data_manager = scraper_app.DATA_MANAGER
+
+        model_ids = (
+            [m.strip() for m in options['models'].split(',') if m.strip()]
+            if options['models'] else registry.available_models
+        )
+        unknown = sorted(set(model_ids) - set(registry.available_models))
+        if unknown:
+            raise CommandError(
+                f"Unavailable model ID(s): {', '.join(unknown)}. "
+                f"Available: {', '.join(registry.available_models)}"
+            )
+        if options['iterations'] < 1:
+            raise CommandError('--iterations must be at least 1.')
+
+        lines = load_parity_corpus(options['texts'])
+        seq_lens = [None] if options['texts'] else options['seq_lens']
+        original_threads = torch.get_num_threads()
+
+        report = {
+            'torch': torch.__version__,
+            'cpu_count': os.cpu_count(),
+            'device': 'cuda' if torch.cuda.is_available() else 'cpu',
+            'iterations': options['iterations'],
+            'results': [],
+        }
+        try:
+            for model_id in model_ids:
+                # Models stay loaded for the whole run, so the process peak only
+                # grows; what this model costs is the RSS growth since its load.
+                rss_before = _rss_mb()
+                load_start = time.perf_counter()
+                registry.warm_up(model_id, seq_lens=[8])
+                load_s = round(time.perf_counter() - load_start, 3)
+                self.stderr.write(f"{model_id}: loaded in {load_s}s")
+
+                for threads, batch_size, seq_len in itertools.product(
+                    options['threads'], options['batch_sizes'], seq_lens,
+                ):
+                    torch.set_num_threads(threads)
+                    point = self._run_point(
+                        data_manager, model_id, lines, batch_size, seq_len,
+                        options['iterations'], options['warmup'],
+                    )
+                    rss = _rss_mb()
+                    rss_delta = round(rss - rss_before, 1) if rss is not None and rss_before is not None else None
+                    report['results'].append({
+                        'model_id': model_id,
+                        'threads': threads,
+                        'batch_size': batch_size,
+                        'seq_len': seq_len if seq_len is not None else 'fixture',
+                        **point,
+                        'load_s': load_s,
+                        'rss_delta_mb': rss_delta,
+                        'process_peak_rss_mb': _peak_rss_mb(),
+                    })
+                    self.stderr.write(
+                        f"  threads={threads} batch={batch_size} seq_len={seq_len}: "
+                        f"{point['tweets_per_sec']} tweets/s, p95 {point['batch_p95_ms']}ms"
+                    )
+        finally:
+            torch.set_num_threads(original_threads)
+
+        output = json.dumps(report, indent=2)
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as file:
+                file.write(output)
+        self.stdout.write(output)
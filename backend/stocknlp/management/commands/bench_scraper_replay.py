@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import json
+import statistics
+import time
+import tracemalloc
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+
+from scraper.scrapers.replay import ReplayDriver
+from scraper.scrapers.replay import offline_redis
+from scraper.scrapers.twitter_scraper import TwitterScraper
+from stocknlp.stage_timer import percentile
+
+FIXTURES = Path(settings.BASE_DIR) / 'scraper' / 'fixtures'
+DEFAULT_PAGE = FIXTURES / 'twitter_search_page.html'
+DEFAULT_RESPONSE = FIXTURES / 'search_timeline_response.json'
+MODES = ('dom', 'network')
+
+
+def _read(paths: list[Path]) -> list[str]:
+    try:
+        return [path.read_text(encoding='utf-8') for path in paths]
+    except OSError as e:
+        raise CommandError(f'Cannot read {e.filename}: {e.strerror}')
+
+
+class Command(BaseCommand):
+    help = (
+        "Replay recorded search pages (dom) and timeline responses (network) through "
+        "TwitterScraper offline; report tweets/s, CPU and allocations per scroll (JSON output)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'pages',
+            nargs='*',
+            help=f'Saved search page HTML files (default: {DEFAULT_PAGE.relative_to(settings.BASE_DIR)}).',
+        )
+        parser.add_argument(
+            '--responses',
+            nargs='*',
+            default=None,
+            help=f'Captured SearchTimeline bodies (default: {DEFAULT_RESPONSE.relative_to(settings.BASE_DIR)}).',
+        )
+        parser.add_argument('--modes', default=','.join(MODES), help='Comma-separated capture modes to replay.')
+        parser.add_argument('--per-scroll', type=int, default=10, help='Tweets a replayed page scroll reveals.')
+        parser.add_argument('--repeat', type=int, default=5, help='Timed replays per mode.')
+        parser.add_argument('--output', '-o', default=None, help='Also write the JSON report here.')
+
+    def handle(self, *args, **options):
+        modes = [mode for mode in options['modes'].split(',') if mode]
+        unknown = set(modes) - set(MODES)
+        if unknown:
+            raise CommandError(f'Unknown mode(s): {", ".join(sorted(unknown))}')
+        pages = _read([Path(p) for p in options['pages']] or [DEFAULT_PAGE])
+        responses = _read([Path(p) for p in options['responses'] or [DEFAULT_RESPONSE]])
+        per_scroll = max(1, options['per_scroll'])
+
+        def replay_driver(mode: str, on_scroll) -> ReplayDriver:
+            if mode == 'dom':
+                return ReplayDriver.from_pages(pages, per_scroll=per_scroll, on_scroll=on_scroll)
+            return ReplayDriver.from_responses(responses, on_scroll=on_scroll)
+
+        report = {
+            'pages': len(pages), 'responses': len(responses), 'per_scroll': per_scroll,
+            'repeat': max(1, options['repeat']), 'modes': {},
+        }
+        for mode in modes:
+            report['modes'][mode] = self._bench(mode, replay_driver, report['repeat'])
+
+        output = json.dumps(report, indent=2)
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as file:
+                file.write(output)
+        self.stdout.write(output)
+
+    @staticmethod
+    def _replay(mode: str, driver: ReplayDriver) -> int:
+        """One offline search through the real scraper; returns the tweets it enqueued."""
+        with offline_redis():
+            scraper = TwitterScraper()
+            # Only the final stall waits out the timeout; it sleeps rather than burning CPU.
+            scraper.config.update(capture_mode=mode, scroll_timeout=0.01)
+            return scraper._scrape_ticker('TSLA', '2024-01-02', '2024-01-03', driver=driver)
+
+    def _bench(self, mode: str, replay_driver, repeat: int) -> dict:
+        # CPU per scroll: process time between successive scrolls, i.e. one
+        # collect/parse/dedup/enqueue step of _scroll_and_collect.
+        totals, steps = [], []
+        tweets = scrolls = 0
+        for _ in range(repeat):
+            marks = []
+            driver = replay_driver(mode, lambda d: marks.append(time.process_time()))
+            start = time.process_time()
+            tweets = self._replay(mode, driver)
+            end = time.process_time()
+            totals.append(end - start)
+            marks.append(end)
+            steps += [later - earlier for earlier, later in zip(marks, marks[1:])]
+            scrolls = driver.scrolls
+
+        # Allocations in a separate, untimed pass (tracemalloc slows everything down).
+        peaks = []
+        base = 0
+
+        def on_scroll(driver):
+            nonlocal base
+            current, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - base)
+            tracemalloc.reset_peak()
+            base = current
+
+        tracemalloc.start()
+        try:
+            self._replay(mode, replay_driver(mode, on_scroll))
+            peaks.append(tracemalloc.get_traced_memory()[1] - base)
+        finally:
+            tracemalloc.stop()
+        peaks = peaks[1:]  # the first reading covers setup and the page load
+
+        cpu_s = statistics.median(totals)
+        return {
+            'tweets': tweets,
+            'scrolls': scrolls,
+            'cpu_ms': round(cpu_s * 1000, 2),
+            'tweets_per_cpu_s': round(tweets / cpu_s, 1) if cpu_s else None,
+            'cpu_ms_per_scroll': {
+                'median': round(statistics.median(steps) * 1000, 3) if steps else None,
+                'p95': round(percentile(steps, 95) * 1000, 3) if steps else None,
+            },
+            'peak_alloc_kb_per_scroll': {
+                'median': round(statistics.median(peaks) / 1024, 1),
+                'max': round(max(peaks) / 1024, 1),
+            },
+        }
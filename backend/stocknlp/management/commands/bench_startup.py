@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+# Modules whose presence after boot means the ML / browser stack was imported.
+HEAVY_MODULES = ('torch', 'transformers', 'selenium', 'bs4')
+
+# Boots the API the way a WSGI server does (settings, apps, URLconf) and
+# reports which heavy modules ended up in sys.modules.
+_API_BOOT_SNIPPET = """
+import json, os, sys
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'stocknlp.settings')
+from stocknlp.wsgi import application
+from django.urls import get_resolver
+get_resolver().url_patterns
+print(json.dumps([m for m in {heavy!r} if m in sys.modules]))
+"""
+
+
+class Command(BaseCommand):
+    help = "Measure process startup time for `manage.py check` and API boot (JSON output)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--repeat', type=int, default=5, help='Runs per scenario (default: 5)')
+
+    def _time_subprocess(self, argv: list[str], repeat: int) -> tuple[list[float], str]:
+        timings = []
+        stdout = ''
+        for _ in range(repeat):
+            start = time.perf_counter()
+            proc = subprocess.run(
+                argv,
+                cwd=settings.BASE_DIR,
+                env=os.environ.copy(),
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            timings.append(time.perf_counter() - start)
+            stdout = proc.stdout
+        return timings, stdout
+
+    @staticmethod
+    def _summary(timings: list[float]) -> dict:
+        return {
+            'runs': len(timings),
+            'min_s': round(min(timings), 3),
+            'median_s': round(statistics.median(timings), 3),
+            'max_s': round(max(timings), 3),
+        }
+
+    def handle(self, *args, **options):
+        repeat = max(1, options['repeat'])
+        report = {}
+
+        timings, _ = self._time_subprocess(
+            [sys.executable, 'manage.py', 'check'], repeat,
+        )
+        report['manage_check'] = self._summary(timings)
+
+        timings, stdout = self._time_subprocess(
+            [sys.executable, '-c', _API_BOOT_SNIPPET.format(heavy=HEAVY_MODULES)], repeat,
+        )
+        report['api_boot'] = {
+            **self._summary(timings),
+            'heavy_modules_loaded': json.loads(stdout.strip().splitlines()[-1]),
+        }
+
+        self.stdout.write(json.dumps(report, indent=2))
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import json
+import statistics
+import time
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+
+from scraper.scrapers.twitter_scraper import extract_tweets
+
+DEFAULT_PAGE = Path(settings.BASE_DIR) / 'scraper' / 'fixtures' / 'twitter_search_page.html'
+
+
+def _two_pass_bs4(page_source: str) -> list[dict]:
+    """The pre-lxml fallback: html.parser over the page, then again per article for metadata."""
+    records = []
+    for article in BeautifulSoup(page_source, 'html.parser').find_all('article', {'data-testid': 'tweet'}):
+        text_div = article.find('div', {'lang': 'en'})
+        time_el = article.find('time')
+        soup = BeautifulSoup(str(article), 'html.parser')
+        buttons = {
+            field: soup.find('button', {'data-testid': testid})
+            for field, testid in (('likes', 'like'), ('retweets', 'retweet'), ('replies', 'reply'))
+        }
+        views = soup.find('a', {'aria-label': lambda x: x and 'views' in x.lower()})
+        records.append({
+            'text': text_div.get_text(strip=True) if text_div else None,
+            'datetime': time_el['datetime'] if time_el else None,
+            **{field: button.get_text(strip=True) if button else None for field, button in buttons.items()},
+            'views': views['aria-label'] if views else None,
+        })
+    return records
+
+
+PARSERS = {
+    'bs4_two_pass': _two_pass_bs4,
+    'lxml_single_pass': extract_tweets,
+}
+
+
+class Command(BaseCommand):
+    help = "Compare tweet extraction from saved search pages: BeautifulSoup two-pass vs lxml (JSON output)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'pages',
+            nargs='*',
+            help=f'Saved page HTML files (default: {DEFAULT_PAGE.relative_to(settings.BASE_DIR)}).',
+        )
+        parser.add_argument('--repeat', type=int, default=20, help='Timed parses per page and parser.')
+
+    def handle(self, *args, **options):
+        paths = [Path(p) for p in options['pages']] or [DEFAULT_PAGE]
+        repeat = max(1, options['repeat'])
+        pages = []
+        for path in paths:
+            try:
+                pages.append(path.read_text(encoding='utf-8'))
+            except OSError as e:
+                raise CommandError(f'Cannot read {path}: {e}')
+
+        report = {'pages': [str(p) for p in paths], 'page_bytes': sum(len(p) for p in pages), 'parsers': {}}
+        for name, parse in PARSERS.items():
+            timings = []
+            tweets = 0
+            for _ in range(repeat):
+                start = time.perf_counter()
+                tweets = sum(len(parse(page)) for page in pages)
+                timings.append(time.perf_counter() - start)
+            report['parsers'][name] = {
+                'tweets': tweets,
+                'min_ms': round(min(timings) * 1000, 2),
+                'median_ms': round(statistics.median(timings) * 1000, 2),
+                'us_per_tweet': round(statistics.median(timings) * 1e6 / max(tweets, 1), 1),
+            }
+
+        parsers = report['parsers']
+        report['speedup'] = round(
+            parsers['bs4_two_pass']['median_ms'] / max(parsers['lxml_single_pass']['median_ms'], 1e-6), 1,
+        )
+        self.stdout.write(json.dumps(report, indent=2))
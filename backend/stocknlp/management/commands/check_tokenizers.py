@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+
+from scraper.managers.data_manager.fast_tokenizers import find_mismatches
+from scraper.managers.data_manager.fast_tokenizers import load_parity_corpus
+from scraper.managers.data_manager.fast_tokenizers import load_slow_tokenizer
+from scraper.managers.data_manager.fast_tokenizers import load_tokenizer
+from scraper.managers.model_registry import ModelRegistry
+from scraper.managers.model_registry import MODEL_ID_TO_CONFIG_KEY
+from scraper.managers.model_registry import _BERT_TOKENIZER_HF_IDS
+from scraper.managers.model_registry import load_model_configs
+
+
+class Command(BaseCommand):
+    help = (
+        "Check that each transformer model's fast tokenizer produces the same "
+        "token IDs as its slow counterpart on the parity corpus."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'model_ids',
+            nargs='*',
+            help='Model IDs to check (default: every transformer model).',
+        )
+        parser.add_argument(
+            '--corpus',
+            default=None,
+            help='Text file, one sample per line (default: scraper/configs/tokenizer_parity_corpus.txt).',
+        )
+
+    def handle(self, *args, **options):
+        registry = ModelRegistry(load_model_configs())
+        configs = registry._configs
+        model_ids = options['model_ids'] or [
+            model_id for model_id, key in MODEL_ID_TO_CONFIG_KEY.items()
+            if configs.get(key, {}).get('model_name') == 'transformer_model'
+        ]
+        corpus = load_parity_corpus(options['corpus'])
+
+        failed = []
+        for model_id in model_ids:
+            cfg = configs.get(MODEL_ID_TO_CONFIG_KEY.get(model_id, ''), {})
+            if cfg.get('model_name') != 'transformer_model':
+                raise CommandError(f"{model_id} is not a transformer model.")
+            resolved = cfg['params'].get('resolved_weights')
+            if resolved is None:
+                self.stderr.write(f"  {model_id}: unavailable, skipped.")
+                continue
+
+            fast = load_tokenizer(resolved, bert=resolved in _BERT_TOKENIZER_HF_IDS)
+            slow = load_slow_tokenizer(fast) if fast.is_fast else None
+            if slow is None:
+                self.stdout.write(f"  {model_id}: no fast/slow pair to compare, skipped.")
+                continue
+
+            mismatches = find_mismatches(fast, slow, corpus)
+            if mismatches:
+                failed.append(model_id)
+                self.stderr.write(f"  {model_id}: {len(mismatches)}/{len(corpus)} line(s) differ")
+                for text, fast_ids, slow_ids in mismatches[:3]:
+                    self.stderr.write(f"    {text!r}\n      fast={fast_ids}\n      slow={slow_ids}")
+            else:
+                self.stdout.write(f"  {model_id}: identical on {len(corpus)} line(s)")
+
+        if failed:
+            raise CommandError(f"Tokenizer parity failed for: {', '.join(failed)}")
+        self.stdout.write(self.style.SUCCESS("Tokenizer parity OK."))
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+
+from scraper.managers.data_manager.vocab import compile_vocab
+
+
+class Command(BaseCommand):
+    help = (
+        "Compile word/ticker index JSON maps into memory-mappable .vocab files "
+        "(written next to each JSON and picked up automatically at load time)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'paths',
+            nargs='*',
+            help='JSON maps to compile (default: WORD_TO_INDEX_PATH and TICKER_TO_INDEX_PATH).',
+        )
+        parser.add_argument(
+            '--skip-missing',
+            action='store_true',
+            help='Skip maps that do not exist instead of failing (for image builds without model files).',
+        )
+
+    def handle(self, *args, **options):
+        paths = options['paths'] or [settings.WORD_TO_INDEX_PATH, settings.TICKER_TO_INDEX_PATH]
+        for path in map(Path, paths):
+            if not path.is_file():
+                if options['skip_missing']:
+                    self.stdout.write(f"  {path} not found, skipped")
+                    continue
+                raise CommandError(f"Vocabulary file not found: {path}")
+            output = compile_vocab(path)
+            self.stdout.write(f"  {path.name} -> {output} ({output.stat().st_size} bytes)")
+        self.stdout.write(self.style.SUCCESS("Vocabularies compiled."))
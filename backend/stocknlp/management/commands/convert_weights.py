@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+
+
+class Command(BaseCommand):
+    help = (
+        "Convert model weights to safetensors so they can be memory-mapped and "
+        "shared between worker processes. Converts a local .pt checkpoint, or "
+        "(with --hf) mirrors a HuggingFace model into a local directory."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'source',
+            help='Path to a .pt checkpoint, or a HuggingFace model ID with --hf.',
+        )
+        parser.add_argument(
+            '--output', '-o',
+            default=None,
+            help=(
+                'Destination (default: <source>.safetensors next to the '
+                'checkpoint; required with --hf).'
+            ),
+        )
+        parser.add_argument(
+            '--hf',
+            action='store_true',
+            help='Treat source as a HuggingFace model ID and save_pretrained() it as safetensors.',
+        )
+        parser.add_argument(
+            '--num-labels',
+            type=int,
+            default=3,
+            help='num_labels passed to from_pretrained with --hf (default: 3).',
+        )
+
+    def handle(self, *args, **options):
+        if options['hf']:
+            if not options['output']:
+                raise CommandError('--output is required with --hf.')
+            output = self._convert_hf(options['source'], Path(options['output']), options['num_labels'])
+        else:
+            source = Path(options['source'])
+            if not source.is_file():
+                raise CommandError(f"Checkpoint not found: {source}")
+            output = Path(options['output']) if options['output'] else source.with_suffix('.safetensors')
+            self._convert_checkpoint(source, output)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Wrote {output}. Point the model's weights_path at it in model_configs.json."
+        ))
+
+    @staticmethod
+    def _convert_checkpoint(source: Path, output: Path) -> None:
+        import torch
+        from safetensors.torch import save_file
+
+        try:
+            checkpoint = torch.load(source, map_location='cpu', weights_only=True)
+        except Exception as e:
+            raise CommandError(f"Could not read {source}: {e}") from e
+
+        state_dict = checkpoint.get('model_state_dict', checkpoint)
+        if not all(isinstance(t, torch.Tensor) for t in state_dict.values()):
+            raise CommandError(f"{source} does not contain a tensor state dict.")
+
+        # safetensors refuses shared/non-contiguous storage; give each tensor its own.
+        tensors = {name: t.detach().contiguous().clone() for name, t in state_dict.items()}
+        save_file(tensors, output, metadata={'format': 'pt'})
+
+    @staticmethod
+    def _convert_hf(model_id: str, output: Path, num_labels: int) -> Path:
+        from transformers import AutoModelForSequenceClassification
+        from transformers import AutoTokenizer
+
+        try:
+            model = AutoModelForSequenceClassification.from_pretrained(model_id, num_labels=num_labels)
+            tokenizer = AutoTokenizer.from_pretrained(model_id)
+        except Exception as e:
+            raise CommandError(f"Could not load {model_id}: {e}") from e
+
+        output.mkdir(parents=True, exist_ok=True)
+        model.save_pretrained(output)  # safetensors is the only format transformers writes
+        tokenizer.save_pretrained(output)
+        return output
@@ -0,0 +1,323 @@
+from __future__ import annotations
+
+import json
+import multiprocessing
+import random
+import socket
+import threading
+import time
+import uuid
+from datetime import date, timedelta
+
+from django.apps import apps
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+from django.db import connections
+
+from scraper.managers.data_manager.fast_tokenizers import load_parity_corpus
+from stocknlp.stage_timer import PIPELINE_STAGES, percentile
+from stocknlp.tasks import enqueue_scraper_data, get_ready_workers, get_redis, priority_worker
+
+TICKERS = ('AAPL', 'TSLA', 'NVDA', 'MSFT', 'AMZN')
+
+
+def synthetic_tweet(index: int, lines: list[str], source: str, rng: random.Random) -> dict:
+    """A post shaped like ``TwitterScraper._parse_tweet`` output.
+
+    The trailing hashtag makes every text unique (so each one saves a new
+    ``Content`` row) and is stripped again by the cleaning pipelines.
+    """
+    return {
+        'likes': rng.choice([None, rng.randint(0, 5000)]),
+        'retweets': rng.randint(0, 500),
+        'replies': rng.randint(0, 200),
+        'views': rng.randint(0, 100_000),
+        'ticker': rng.choice(TICKERS),
+        'date': date.today() - timedelta(days=rng.randint(0, 30)),
+        'text': f"{rng.choice(lines)} #lt{index}",
+        'source': source,
+    }
+
+
+def _ms_summary(samples: list[float]) -> dict:
+    if not samples:
+        return {}
+    return {
+        'p50_ms': round(percentile(samples, 50) * 1000, 1),
+        'p95_ms': round(percentile(samples, 95) * 1000, 1),
+        'p99_ms': round(percentile(samples, 99) * 1000, 1),
+        'max_ms': round(max(samples) * 1000, 1),
+    }
+
+
+def summarize_stages(snapshots: list[dict]) -> dict:
+    """Sum per-worker ``StageTimer`` snapshots; ``share`` is of the summed stage time."""
+    totals: dict[str, dict] = {}
+    for snapshot in snapshots:
+        for name, stage in snapshot.items():
+            total = totals.setdefault(name, {'calls': 0, 'items': 0, 'seconds': 0.0})
+            for field in total:
+                total[field] += stage[field]
+
+    grand_total = sum(t['seconds'] for t in totals.values()) or 1.0
+    ordered = [s for s in PIPELINE_STAGES if s in totals] + sorted(set(totals) - set(PIPELINE_STAGES))
+    return {
+        name: {
+            'seconds': round(totals[name]['seconds'], 3),
+            'share': round(totals[name]['seconds'] / grand_total, 3),
+            'items': totals[name]['items'],
+            'us_per_item': round(totals[name]['seconds'] / max(totals[name]['items'], 1) * 1e6, 1),
+        }
+        for name in ordered
+    }
+
+
+def _worker_main(redis_host: str, redis_port: int, model_id: str, batch_size: int) -> None:
+    # Forked from the harness: drop the inherited DB/Redis connections first.
+    connections.close_all()
+    settings.REDIS_HOST, settings.REDIS_PORT = redis_host, redis_port
+    settings.SCRAPER_MODEL_ID = model_id
+    settings.WORKER_SCRAPER_BATCH_SIZE = batch_size
+    settings.WORKER_METRICS_PORT = 0  # N workers on one host would fight over the port
+    get_redis.cache_clear()
+    priority_worker(preload_models=[model_id])
+
+
+class Command(BaseCommand):
+    help = (
+        "Load-test the scraper ingest path: push synthetic tweets through "
+        "enqueue_scraper_data into N priority_worker processes and report "
+        "queue lag, end-to-end latency, DB write rate and per-stage time (JSON)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--tweets', type=int, default=1000)
+        parser.add_argument('--workers', type=int, default=2, help='priority_worker processes to fork.')
+        parser.add_argument(
+            '--rate', type=float, default=0,
+            help='Enqueue rate in tweets/sec (default 0: as fast as possible).',
+        )
+        parser.add_argument('--model', default=None, help='Model ID or cascade (default: SCRAPER_MODEL_ID).')
+        parser.add_argument(
+            '--batch-size', type=int, default=None,
+            help='Posts per worker batch (default: WORKER_SCRAPER_BATCH_SIZE).',
+        )
+        parser.add_argument(
+            '--fake-redis', action='store_true',
+            help='Serve Redis from an in-process fakeredis TCP server instead of REDIS_HOST.',
+        )
+        parser.add_argument(
+            '--texts', default=None,
+            help='File with one tweet text per line (default: the tokenizer parity corpus).',
+        )
+        parser.add_argument('--timeout', type=float, default=600, help='Give up after this many seconds.')
+        parser.add_argument(
+            '--stall-timeout', type=float, default=60,
+            help='Give up once the queue is empty and nothing was saved for this long.',
+        )
+        parser.add_argument('--sample-interval', type=float, default=0.5)
+        parser.add_argument('--keep-data', action='store_true', help="Don't delete the rows this run saved.")
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--output', '-o', default=None, help='Also write the JSON report here.')
+
+    def handle(self, *args, **options):
+        model_id = options['model'] or settings.SCRAPER_MODEL_ID
+        batch_size = options['batch_size'] or settings.WORKER_SCRAPER_BATCH_SIZE
+
+        fake_server = self._start_fake_redis() if options['fake_redis'] else None
+        client = get_redis()
+        try:
+            if client.llen('scraper_queue'):
+                raise CommandError(
+                    'scraper_queue is not empty; point REDIS_HOST at a scratch Redis or use --fake-redis.'
+                )
+            run_id = uuid.uuid4().hex[:8]
+            source = f'loadtest-{run_id}'
+            rng = random.Random(options['seed'])
+            lines = load_parity_corpus(options['texts'])
+            tweets = [synthetic_tweet(i, lines, source, rng) for i in range(options['tweets'])]
+
+            connections.close_all()  # don't hand the parent's DB connection to the forks
+            workers = self._start_workers(options['workers'], model_id, batch_size)
+            try:
+                report = self._run(client, workers, tweets, source, options)
+            finally:
+                for process in workers:
+                    process.terminate()
+                for process in workers:
+                    process.join(timeout=10)
+            if not options['keep_data']:
+                self._delete_run_data(source)
+        finally:
+            if fake_server is not None:
+                fake_server.shutdown()
+                fake_server.server_close()
+
+        report = {
+            'run_id': run_id,
+            'model_id': model_id,
+            'workers': options['workers'],
+            'batch_size': batch_size,
+            'rate': options['rate'],
+            'database': connections['default'].vendor,
+            'redis': 'fakeredis' if fake_server is not None else f'{settings.REDIS_HOST}:{settings.REDIS_PORT}',
+            **report,
+        }
+        output = json.dumps(report, indent=2)
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as file:
+                file.write(output)
+        self.stdout.write(output)
+
+    # ------------------------------------------------------------------
+    # Setup
+    # ------------------------------------------------------------------
+
+    def _start_fake_redis(self):
+        from fakeredis import TcpFakeServer
+
+        server = TcpFakeServer(('127.0.0.1', 0), server_type='redis')
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, name='fake_redis', daemon=True).start()
+        settings.REDIS_HOST, settings.REDIS_PORT = server.server_address
+        get_redis.cache_clear()
+        self.stderr.write(f"fakeredis listening on {settings.REDIS_HOST}:{settings.REDIS_PORT}")
+        return server
+
+    def _start_workers(self, count: int, model_id: str, batch_size: int) -> list:
+        # fork, so each worker inherits the configured Django process as-is.
+        context = multiprocessing.get_context('fork')
+        workers = [
+            context.Process(
+                target=_worker_main,
+                args=(settings.REDIS_HOST, settings.REDIS_PORT, model_id, batch_size),
+                name=f'loadtest-worker-{i}',
+                daemon=True,
+            )
+            for i in range(count)
+        ]
+        for process in workers:
+            process.start()
+        return workers
+
+    @staticmethod
+    def _worker_payloads(workers: list) -> list[dict]:
+        ids = {f'{socket.gethostname()}:{process.pid}' for process in workers}
+        return [payload for worker_id, payload in get_ready_workers().items() if worker_id in ids]
+
+    # ------------------------------------------------------------------
+    # Run
+    # ------------------------------------------------------------------
+
+    def _run(self, client, workers: list, tweets: list[dict], source: str, options: dict) -> dict:
+        started = time.perf_counter()
+        while len(self._worker_payloads(workers)) < len(workers):
+            if not any(p.is_alive() for p in workers):
+                raise CommandError('Every worker process exited during startup; see the log above.')
+            if time.perf_counter() - started > options['timeout']:
+                raise CommandError('Workers did not become ready before --timeout.')
+            time.sleep(0.2)
+        startup_s = time.perf_counter() - started
+        self.stderr.write(f"{len(workers)} worker(s) ready in {startup_s:.1f}s; enqueueing {len(tweets)} tweets")
+
+        sent_at: dict[str, float] = {}
+        enqueue_done = threading.Event()
+        enqueue_seconds = []
+
+        def produce():
+            start = time.time()
+            interval = 1 / options['rate'] if options['rate'] > 0 else 0
+            for i, tweet in enumerate(tweets):
+                if interval:
+                    delay = start + i * interval - time.time()
+                    if delay > 0:
+                        time.sleep(delay)
+                sent_at[tweet['text']] = time.time()
+                enqueue_scraper_data(tweet)
+            enqueue_seconds.append(time.time() - start)
+            enqueue_done.set()
+
+        Post = apps.get_model('scraper', 'Post')
+        run_posts = Post.objects.filter(post_metadata__source__name=source)
+
+        producer = threading.Thread(target=produce, name='loadtest_producer', daemon=True)
+        producer.start()
+        run_start = time.time()
+
+        depths, lags = [], []
+        saved, last_progress = 0, time.time()
+        timed_out = False
+        while saved < len(tweets):
+            time.sleep(options['sample_interval'])
+            now = time.time()
+            depths.append(client.llen('scraper_queue'))
+            head = client.lindex('scraper_queue', 0)
+            if head is not None:
+                text = json.loads(head)['text']
+                if text in sent_at:
+                    lags.append(now - sent_at[text])
+
+            count = run_posts.count()
+            if count > saved:
+                saved, last_progress = count, now
+            if now - run_start > options['timeout'] or (
+                enqueue_done.is_set() and depths[-1] == 0
+                and now - last_progress > options['stall_timeout']
+            ):
+                timed_out = True
+                break
+            if not any(p.is_alive() for p in workers):
+                raise CommandError('Every worker process died mid-run; see the log above.')
+        producer.join()
+
+        saved_at = {
+            text: created_at.timestamp()
+            for text, created_at in run_posts.values_list('related_content__text', 'related_content__created_at')
+        }
+        latencies = [saved_at[text] - sent_at[text] for text in saved_at if text in sent_at]
+
+        # Workers publish their stage totals when they next poll; give the
+        # last batch a moment to show up.
+        deadline = time.time() + 5
+        while True:
+            snapshots = [payload.get('stages', {}) for payload in self._worker_payloads(workers)]
+            save_items = sum(s.get('save', {}).get('items', 0) for s in snapshots)
+            if save_items >= len(saved_at) or time.time() > deadline:
+                break
+            time.sleep(0.2)
+
+        first_save, last_save = (min(saved_at.values()), max(saved_at.values())) if saved_at else (0, 0)
+        elapsed = (last_save - run_start) if saved_at else 0
+        return {
+            'tweets': len(tweets),
+            'saved': len(saved_at),
+            'timed_out': timed_out,
+            'worker_startup_s': round(startup_s, 2),
+            'enqueue': {
+                'seconds': round(enqueue_seconds[0], 3),
+                'tweets_per_sec': round(len(tweets) / max(enqueue_seconds[0], 1e-9), 1),
+            },
+            'throughput_tweets_per_min': round(len(saved_at) / elapsed * 60, 1) if elapsed else 0,
+            'queue': {'max_depth': max(depths, default=0), 'lag': _ms_summary(lags)},
+            'end_to_end': _ms_summary(latencies),
+            'db': {
+                'writes_per_sec': round(len(saved_at) / (last_save - first_save), 1) if last_save > first_save else 0,
+            },
+            'stages': summarize_stages(snapshots),
+        }
+
+    @staticmethod
+    def _delete_run_data(source: str) -> None:
+        Content = apps.get_model('scraper', 'Content')
+        PostMeta = apps.get_model('scraper', 'PostMeta')
+        PostPrediction = apps.get_model('scraper', 'PostPrediction')
+        Post = apps.get_model('scraper', 'Post')
+        Source = apps.get_model('scraper', 'Source')
+
+        posts = Post.objects.filter(post_metadata__source__name=source)
+        prediction_ids = list(posts.values_list('post_prediction_id', flat=True))
+        Content.objects.filter(post__in=posts).delete()  # cascades to the posts
+        PostMeta.objects.filter(source__name=source).delete()
+        PostPrediction.objects.filter(pk__in=prediction_ids, post__isnull=True).delete()
+        Source.objects.filter(name=source).delete()
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+
+from scraper.managers.model_registry import MODEL_ID_TO_CONFIG_KEY
+from scraper.managers.model_registry import load_model_configs
+from stocknlp.tasks import publish_model_reload
+
+
+class Command(BaseCommand):
+    help = (
+        "Broadcast a zero-downtime model reload to every API and worker process. "
+        "Each process loads and warms the new version from model_configs.json "
+        "in the background, then swaps it in atomically."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'model_ids',
+            nargs='*',
+            help='Model IDs to reload (default: all configured models).',
+        )
+        parser.add_argument(
+            '--config-file',
+            default=None,
+            help='Read configs from this file instead of scraper/configs/model_configs.json.',
+        )
+
+    def handle(self, *args, **options):
+        model_ids = options['model_ids'] or list(MODEL_ID_TO_CONFIG_KEY)
+        unknown = [m for m in model_ids if m not in MODEL_ID_TO_CONFIG_KEY]
+        if unknown:
+            raise CommandError(
+                f"Unknown model ID(s): {', '.join(unknown)}. "
+                f"Available: {', '.join(MODEL_ID_TO_CONFIG_KEY)}"
+            )
+
+        configs = load_model_configs(options['config_file'])
+        for model_id in model_ids:
+            config_key = MODEL_ID_TO_CONFIG_KEY[model_id]
+            if config_key not in configs:
+                self.stderr.write(f"  {model_id}: no '{config_key}' entry in config file, skipped.")
+                continue
+            receivers = publish_model_reload(model_id, configs[config_key])
+            self.stdout.write(f"  {model_id}: reload sent to {receivers} process(es).")
+
+        self.stdout.write(self.style.SUCCESS("Reload broadcast complete."))
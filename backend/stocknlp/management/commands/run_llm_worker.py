@@ -1,15 +1,43 @@
 from __future__ import annotations
 
+from django.conf import settings
 from django.core.management.base import BaseCommand
 
 from stocknlp.tasks import priority_worker
 
 
+def _csv_list(value: str) -> list[str]:
+    return [item.strip() for item in value.split(',') if item.strip()]
+
+
 class Command(BaseCommand):
     help = "Start the LLM evaluation worker (reads from user_queue and scraper_queue)"
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--preload',
+            type=_csv_list,
+            default=None,
+            help='Comma-separated model IDs to load and warm up before consuming '
+                 '(default: WORKER_PRELOAD_MODELS; pass "" to skip).',
+        )
+        parser.add_argument(
+            '--warmup-lengths',
+            type=lambda value: [int(n) for n in _csv_list(value)],
+            default=None,
+            help='Comma-separated word counts for warm-up passes (default: MODEL_WARMUP_SEQ_LENS).',
+        )
+
     def handle(self, *args, **options):
+        preload = options['preload']
+        if preload is None:
+            preload = settings.WORKER_PRELOAD_MODELS
+
         self.stdout.write(self.style.SUCCESS("Starting LLM worker..."))
         self.stdout.write("  Priority: user_queue > scraper_queue")
+        self.stdout.write(f"  Preload: {', '.join(preload) or 'none'}")
         self.stdout.write("  Press Ctrl+C to stop.\n")
-        priority_worker()
+        priority_worker(
+            preload_models=preload,
+            warmup_seq_lens=options['warmup_lengths'],
+        )
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import time
+
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+
+from stocknlp.tasks import get_ready_workers
+
+
+class Command(BaseCommand):
+    help = "Block until enough LLM workers have finished warm-up (for deploy scripts)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--count', type=int, default=1, help='Ready workers required (default: 1)')
+        parser.add_argument('--timeout', type=int, default=300, help='Seconds to wait before failing (default: 300)')
+        parser.add_argument(
+            '--model',
+            action='append',
+            default=[],
+            help='Only count workers that have this model loaded (repeatable).',
+        )
+
+    def handle(self, *args, **options):
+        required_models = set(options['model'])
+        deadline = time.monotonic() + options['timeout']
+
+        while True:
+            workers = get_ready_workers()
+            # A worker whose preloads failed is up, but not serving what it was deployed for.
+            failed = {worker_id: info['failed'] for worker_id, info in workers.items() if info.get('failed')}
+            ready = {
+                worker_id: info for worker_id, info in workers.items()
+                if worker_id not in failed and required_models.issubset(info.get('models', []))
+            }
+            if len(ready) >= options['count']:
+                for worker_id, info in ready.items():
+                    self.stdout.write(f"  {worker_id}: {', '.join(info.get('models', [])) or 'no models'}")
+                self.stdout.write(self.style.SUCCESS(f"{len(ready)} worker(s) ready."))
+                return
+
+            if time.monotonic() >= deadline:
+                failures = ''.join(
+                    f"\n  {worker_id}: preload failed for {', '.join(models)}" for worker_id, models in failed.items()
+                )
+                raise CommandError(
+                    f"Timed out after {options['timeout']}s: {len(ready)}/{options['count']} worker(s) ready.{failures}"
+                )
+            time.sleep(1)
@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import logging
+import math
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import redis
+
+logger = logging.getLogger(__name__)
+
+# Every process adds its deltas into this Redis hash, so a scrape of any one
+# process (the worker's port or the API's /metrics) sees the fleet-wide sums.
+METRICS_KEY = 'metrics'
+FLUSH_INTERVAL = 1.0  # seconds between a process's writes to METRICS_KEY
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+QUEUES = ('user_queue', 'scraper_queue', 'dead_letter_queue')
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128)
+
+
+def _format_value(value) -> str:
+    if value == math.inf:
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
+
+
+def _escape(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _series(name: str, labels: dict) -> str:
+    if not labels:
+        return name
+    pairs = ','.join('%s="%s"' % (key, _escape(value)) for key, value in labels.items())
+    return f'{name}{{{pairs}}}'
+
+
+class MetricsRegistry:
+    """Process-local counters, flushed as deltas into a shared Redis hash.
+
+    Recording is a dict update under a lock; at most once per
+    ``flush_interval`` the pending deltas go to Redis in one pipelined
+    round trip (HINCRBYFLOAT per series).  A forked child starts with no
+    pending deltas, so nothing is counted twice.  If Redis is unreachable
+    the deltas are kept and retried on the next flush.
+    """
+
+    def __init__(self, flush_interval: float = FLUSH_INTERVAL):
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._pending: dict[str, float] = {}
+        self._last_flush = time.monotonic()
+        self._metrics: dict[str, tuple[str, str]] = {}  # name -> (type, help)
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=self._after_fork)
+
+    def _after_fork(self) -> None:
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._last_flush = time.monotonic()
+
+    def counter(self, name: str, documentation: str) -> Counter:
+        self._metrics[name] = ('counter', documentation)
+        return Counter(self, name)
+
+    def histogram(self, name: str, documentation: str, buckets=LATENCY_BUCKETS) -> Histogram:
+        self._metrics[name] = ('histogram', documentation)
+        return Histogram(self, name, buckets)
+
+    def add(self, increments: dict[str, float]) -> None:
+        with self._lock:
+            for field, amount in increments.items():
+                self._pending[field] = self._pending.get(field, 0) + amount
+        self.maybe_flush()
+
+    def maybe_flush(self) -> None:
+        """Flush if ``flush_interval`` has passed; idle loops call this so deltas don't linger."""
+        if time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self, client=None) -> None:
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._last_flush = time.monotonic()
+        if not pending:
+            return
+        try:
+            if client is None:
+                from stocknlp.tasks import get_redis
+                client = get_redis()
+            pipe = client.pipeline(transaction=False)
+            for field, amount in pending.items():
+                pipe.hincrbyfloat(METRICS_KEY, field, amount)
+            pipe.execute()
+        except redis.RedisError as e:
+            logger.debug('Metrics flush failed (%s); keeping %d series for retry.', e, len(pending))
+            with self._lock:
+                for field, amount in pending.items():
+                    self._pending[field] = self._pending.get(field, 0) + amount
+
+    def render(self, client=None) -> str:
+        """Prometheus text exposition of the shared counters plus queue depths."""
+        if client is None:
+            from stocknlp.tasks import get_redis
+            client = get_redis()
+        self.flush(client)
+
+        pipe = client.pipeline(transaction=False)
+        pipe.hgetall(METRICS_KEY)
+        for queue in QUEUES:
+            pipe.llen(queue)
+        stored, *depths = pipe.execute()
+
+        by_metric: dict[str, list[tuple[str, float]]] = {}
+        for raw_field, raw_value in stored.items():
+            field = raw_field.decode() if isinstance(raw_field, bytes) else raw_field
+            base = field.split('{', 1)[0]
+            for suffix in ('_bucket', '_sum', '_count'):
+                if base.endswith(suffix) and base[:-len(suffix)] in self._metrics:
+                    base = base[:-len(suffix)]
+                    break
+            by_metric.setdefault(base, []).append((field, float(raw_value)))
+
+        lines = [
+            '# HELP stocknlp_queue_depth Messages waiting in each Redis queue.',
+            '# TYPE stocknlp_queue_depth gauge',
+        ]
+        lines += [
+            f'{_series("stocknlp_queue_depth", {"queue": queue})} {depth}'
+            for queue, depth in zip(QUEUES, depths)
+        ]
+        for name, (kind, documentation) in self._metrics.items():
+            lines.append(f'# HELP {name} {documentation}')
+            lines.append(f'# TYPE {name} {kind}')
+            samples = sorted(by_metric.get(name, []), key=lambda sample: _sort_key(sample[0]))
+            lines += [f'{field} {_format_value(value)}' for field, value in samples]
+        return '\n'.join(lines) + '\n'
+
+
+def _sort_key(field: str):
+    # Group a histogram's series by labels, with buckets in numeric `le` order.
+    name, _, labels = field.partition('{')
+    labels = labels.rstrip('}')
+    head, found, tail = labels.rpartition('le="')
+    if not found:
+        return labels, name, math.inf
+    le = tail.split('"', 1)[0]
+    return head.rstrip(','), name, math.inf if le == '+Inf' else float(le)
+
+
+class Counter:
+    def __init__(self, registry: MetricsRegistry, name: str):
+        self._registry = registry
+        self.name = name
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        self._registry.add({_series(self.name, labels): amount})
+
+
+class Histogram:
+    def __init__(self, registry: MetricsRegistry, name: str, buckets):
+        self._registry = registry
+        self.name = name
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+
+    def observe(self, value: float, **labels) -> None:
+        # Buckets the value misses still get a 0 so every series exists from the start.
+        increments = {
+            _series(f'{self.name}_bucket', {**labels, 'le': _format_value(bound)}): int(value <= bound)
+            for bound in self.buckets
+        }
+        increments[_series(f'{self.name}_sum', labels)] = value
+        increments[_series(f'{self.name}_count', labels)] = 1
+        self._registry.add(increments)
+
+
+registry = MetricsRegistry()
+
+MESSAGES_PROCESSED = registry.counter(
+    'stocknlp_messages_processed_total', 'Messages evaluated by the worker, by queue and model.',
+)
+STAGE_SECONDS = registry.histogram(
+    'stocknlp_stage_seconds', 'Time per call of each inference stage (see stage_timer.PIPELINE_STAGES).',
+)
+BATCH_SIZE = registry.histogram(
+    'stocknlp_batch_size', 'Scraper posts evaluated per worker batch.', buckets=BATCH_SIZE_BUCKETS,
+)
+CACHE_REQUESTS = registry.counter(
+    'stocknlp_cache_requests_total', 'Cache lookups by cache and result (hit/miss).',
+)
+PREDICTION_FAILURES = registry.counter(
+    'stocknlp_prediction_failures_total', "Predictions that came back 'unknown', by model.",
+)
+SCRAPER_PAGE_LOAD = registry.histogram(
+    'stocknlp_scraper_page_load_seconds',
+    'Search page load time (navigation to document complete), by browser profile.',
+)
+WORKER_ERRORS = registry.counter(
+    'stocknlp_worker_errors_total', 'Worker errors, by kind (redis/payload/unexpected).',
+)
+DEAD_LETTERS = registry.counter(
+    'stocknlp_dead_letters_total', 'Payloads moved to dead_letter_queue, by source queue.',
+)
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split('?', 1)[0] not in ('/', '/metrics'):
+            self.send_error(404)
+            return
+        try:
+            body = registry.render().encode()
+        except redis.RedisError as e:
+            self.send_error(503, f'Redis unavailable: {e}')
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', CONTENT_TYPE)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug('metrics %s - %s', self.address_string(), format % args)
+
+
+def start_metrics_server(port: int, host: str = '127.0.0.1') -> ThreadingHTTPServer | None:
+    """Serve ``/metrics`` on *port* from a daemon thread; None if the port is taken."""
+    try:
+        server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    except OSError as e:
+        logger.warning('Metrics server not started on port %s: %s', port, e)
+        return None
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name='metrics_server', daemon=True).start()
+    logger.info('Serving metrics on http://%s:%s/metrics', host, port)
+    return server
@@ -121,6 +121,21 @@ DATABASES = {
     },
 }
 
+# Local stand-in for Postgres (e.g. for ``manage.py loadtest_pipeline``).
+if os.getenv('SQLITE_PATH'):
+    DATABASES['default'] = {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': os.getenv('SQLITE_PATH'),
+        # Several worker processes write at once: WAL lets reads run alongside
+        # the writer, and IMMEDIATE transactions queue for the write lock
+        # (up to timeout) instead of failing when a read tries to upgrade.
+        'OPTIONS': {
+            'timeout': 30,
+            'transaction_mode': 'IMMEDIATE',
+            'init_command': 'PRAGMA journal_mode=WAL;',
+        },
+    }
+
 # ---------------------------------------------------------------------------
 # Redis / RQ
 # ---------------------------------------------------------------------------
@@ -164,6 +179,17 @@ CACHE_TTL_STOCK_DATA    = int(os.getenv('CACHE_TTL_STOCK_DATA',    60 * 60))   #
 CACHE_TTL_PREDICTIONS   = int(os.getenv('CACHE_TTL_PREDICTIONS',   60 * 10))   # 10 minutes
 CACHE_TTL_WORKER_RESULT = int(os.getenv('CACHE_TTL_WORKER_RESULT', 60 * 5))    # 5 minutes
 
+# ---------------------------------------------------------------------------
+# On-demand evaluation
+# ---------------------------------------------------------------------------
+
+# When enabled, /api/eval/ is served by an async view that hands the request to
+# the LLM worker through user_queue and awaits the response key, so web
+# processes never load a model.  Run under an ASGI server (stocknlp.asgi) so
+# the wait does not hold a thread.
+EVAL_VIA_WORKER     = os.getenv('EVAL_VIA_WORKER', 'False').lower() in ('1', 'true', 'yes')
+EVAL_WORKER_TIMEOUT = int(os.getenv('EVAL_WORKER_TIMEOUT', 30))   # seconds
+
 # ---------------------------------------------------------------------------
 # Static files
 # ---------------------------------------------------------------------------
@@ -215,6 +241,82 @@ SELENIUM_GRID_URL = os.getenv('SELENIUM_GRID_URL', 'http://selenium:4444/wd/hub'
 # Must match a key in scraper.managers.model_registry.MODEL_ID_TO_CONFIG_KEY
 DEFAULT_MODEL_ID = os.getenv('DEFAULT_MODEL_ID', 'FinBERT')
 
+# Models loaded and warmed up before a process starts serving (comma-separated
+# model IDs).  The worker preloads the default model unless told otherwise;
+# the API preloads nothing by default since it normally delegates to the worker.
+WORKER_PRELOAD_MODELS = [
+    m.strip() for m in os.getenv('WORKER_PRELOAD_MODELS', DEFAULT_MODEL_ID).split(',') if m.strip()
+]
+API_PRELOAD_MODELS = [
+    m.strip() for m in os.getenv('API_PRELOAD_MODELS', '').split(',') if m.strip()
+]
+
+# Input lengths (in words) of the dummy forward passes run during warm-up, so
+# kernels for short and long tweets are initialised before real traffic.
+MODEL_WARMUP_SEQ_LENS = [
+    int(n) for n in os.getenv('MODEL_WARMUP_SEQ_LENS', '8,32,128').split(',') if n.strip()
+]
+
+# Compare each fast (Rust) tokenizer with the slow one on
+# scraper/configs/tokenizer_parity_corpus.txt when a model loads, and use the
+# slow tokenizer if they disagree.  Costs a fraction of a second per model.
+VERIFY_FAST_TOKENIZERS = os.getenv('VERIFY_FAST_TOKENIZERS', 'True').lower() in ('1', 'true', 'yes')
+
+# Upper bound on parameter memory held by loaded models per process; the least
+# recently used model is evicted to make room.  0 disables the limit.
+MODEL_MEMORY_BUDGET_MB = int(os.getenv('MODEL_MEMORY_BUDGET_MB', 0))
+
+# The worker refreshes its Redis readiness key on every poll; the key expires
+# this many seconds after the worker stops refreshing it.
+WORKER_READY_TTL = int(os.getenv('WORKER_READY_TTL', 30))
+
+# Model ID for scraped posts that don't name one.  Set it to a cascade such as
+# 'Cascade:LSTMCNNv1>FinBERT' to run the cheap model first and send only
+# low-confidence posts to BERT.
+SCRAPER_MODEL_ID = os.getenv('SCRAPER_MODEL_ID') or DEFAULT_MODEL_ID
+
+# The worker evaluates up to this many queued scraper posts per forward pass.
+# User requests wait for at most one batch, so keep it modest.
+WORKER_SCRAPER_BATCH_SIZE = int(os.getenv('WORKER_SCRAPER_BATCH_SIZE', 16))
+
+# Pending user requests the worker takes off user_queue per pass; those for the
+# same model share one forward pass.
+WORKER_USER_BATCH_SIZE = int(os.getenv('WORKER_USER_BATCH_SIZE', 8))
+
+# The worker serves Prometheus metrics on this port (0 disables); the API
+# exposes the same, fleet-wide numbers at /metrics.  The worker binds to
+# loopback unless WORKER_METRICS_HOST says otherwise (e.g. 0.0.0.0 for a
+# Prometheus in another container).
+WORKER_METRICS_PORT = int(os.getenv('WORKER_METRICS_PORT', 9100))
+WORKER_METRICS_HOST = os.getenv('WORKER_METRICS_HOST', '127.0.0.1')
+
+# /metrics and /traces/summary only answer clients in these networks (loopback
+# and private ranges by default), and never requests relayed by a proxy
+# (X-Forwarded-For set), since those may come from anywhere.
+INTERNAL_NETWORKS = [
+    net.strip() for net in os.getenv(
+        'INTERNAL_NETWORKS', '127.0.0.0/8,::1/128,10.0.0.0/8,172.16.0.0/12,192.168.0.0/16',
+    ).split(',') if net.strip()
+]
+
+# dead_letter_queue keeps at most this many failed payloads (oldest dropped).
+DEAD_LETTER_MAX_LENGTH = int(os.getenv('DEAD_LETTER_MAX_LENGTH', 10000))
+
+# Every queue payload carries a trace id and enqueue time; the worker logs one
+# JSON line per payload (logger 'stocknlp.tracing') with its queue wait and
+# stage timings, and keeps TRACE_RETENTION_MINUTES of them in Redis for
+# /traces/summary, at most TRACE_MAX_SAMPLES (oldest dropped).  Set TRACE_FILE
+# to also append OpenTelemetry-shaped span records (JSON lines) to that path.
+TRACE_FILE = os.getenv('TRACE_FILE', '')
+TRACE_RETENTION_MINUTES = int(os.getenv('TRACE_RETENTION_MINUTES', 60))
+TRACE_MAX_SAMPLES = int(os.getenv('TRACE_MAX_SAMPLES', 10000))
+
+# The scraper remembers which tweets it has enqueued, per ticker and date, so
+# recrawling a date does not send them to the worker again.  A date's record
+# expires this many days after it was last crawled; keep it longer than the
+# span of dates a crawl cycle revisits.
+SCRAPER_SEEN_TTL_DAYS = int(os.getenv('SCRAPER_SEEN_TTL_DAYS', 30))
+
 # ---------------------------------------------------------------------------
 # Django REST Framework
 # ---------------------------------------------------------------------------
@@ -256,12 +358,20 @@ LOGGING = {
             'format': '[{asctime}] {levelname} {name}: {message}',
             'style': '{',
         },
+        'json_lines': {
+            'format': '{message}',
+            'style': '{',
+        },
     },
     'handlers': {
         'console': {
             'class': 'logging.StreamHandler',
             'formatter': 'verbose',
         },
+        'traces': {
+            'class': 'logging.StreamHandler',
+            'formatter': 'json_lines',
+        },
     },
     'loggers': {
         'signals.views': {
@@ -269,6 +379,11 @@ LOGGING = {
             'level': 'DEBUG',
             'propagate': False,
         },
+        'stocknlp.tracing': {
+            'handlers': ['traces'],
+            'level': os.getenv('TRACE_LOG_LEVEL', 'INFO'),
+            'propagate': False,
+        },
         'httpcore': {
             'handlers': ['console'],
             'level': 'WARNING',
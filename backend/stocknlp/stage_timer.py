@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import math
+import threading
+import time
+from contextlib import contextmanager
+
+from stocknlp.metrics import STAGE_SECONDS
+from stocknlp.tracing import record_span
+
+# Where a scraped tweet spends its time inside the worker, in pipeline order.
+# Single-tweet evaluations (user requests, ensembles) record clean+tokenize
+# together as 'preprocess'.
+PIPELINE_STAGES = ('decode', 'clean', 'tokenize', 'preprocess', 'forward', 'save')
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Nearest-rank percentile of *samples* (which must be non-empty)."""
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+class StageTimer:
+    """Cumulative wall-clock totals per pipeline stage, for this process.
+
+    Each ``stage()`` block costs two ``perf_counter`` calls and a locked
+    dict update, so it is left on in production.  The worker publishes
+    ``snapshot()`` with its readiness key, which is how the load-test
+    harness sees where time went in each worker process.  With a
+    *histogram*, every call is also observed there under a ``stage`` label.
+    """
+
+    def __init__(self, histogram=None):
+        self._lock = threading.Lock()
+        self._totals: dict[str, list] = {}  # name -> [calls, items, seconds]
+        self._histogram = histogram
+
+    @contextmanager
+    def stage(self, name: str, items: int = 1):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            self.add(name, seconds, items)
+            record_span(name, start, seconds)
+
+    def add(self, name: str, seconds: float, items: int = 1) -> None:
+        with self._lock:
+            totals = self._totals.setdefault(name, [0, 0, 0.0])
+            totals[0] += 1
+            totals[1] += items
+            totals[2] += seconds
+        if self._histogram is not None:
+            self._histogram.observe(seconds, stage=name)
+
+    def snapshot(self) -> dict[str, dict]:
+        """{stage: {'calls', 'items', 'seconds'}} accumulated so far."""
+        with self._lock:
+            return {
+                name: {'calls': calls, 'items': items, 'seconds': seconds}
+                for name, (calls, items, seconds) in self._totals.items()
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._totals.clear()
+
+
+stage_timer = StageTimer(histogram=STAGE_SECONDS)
+
+
+def timed(name: str, items: int = 1):
+    """Time a block under *name* on the process-wide :data:`stage_timer`."""
+    return stage_timer.stage(name, items)
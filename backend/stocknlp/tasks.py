@@ -3,15 +3,35 @@ from __future__ import annotations
 import functools
 import json
 import logging
+import os
+import socket
+import threading
 import time
 import uuid
 from datetime import date
 
 import redis
+import redis.asyncio
 from django.apps import apps
 
+from stocknlp.metrics import (
+    BATCH_SIZE,
+    DEAD_LETTERS,
+    MESSAGES_PROCESSED,
+    WORKER_ERRORS,
+    registry as metrics_registry,
+    start_metrics_server,
+)
+from stocknlp.stage_timer import stage_timer, timed
+from stocknlp.tracing import exporter as trace_exporter
+from stocknlp.tracing import stamp, trace_batch
+
 logger = logging.getLogger(__name__)
 
+WORKER_READY_KEY_PREFIX = 'llm_worker:ready'
+MODEL_RELOAD_CHANNEL = 'model_reload'
+DEAD_LETTER_QUEUE = 'dead_letter_queue'
+
 
 @functools.lru_cache(maxsize=1)
 def get_redis() -> redis.StrictRedis:
@@ -40,72 +60,448 @@ def enqueue_user_data(user_data: dict) -> str:
     """
     if 'request_id' not in user_data:
         user_data['request_id'] = str(uuid.uuid4())
+    stamp(user_data)
     get_redis().rpush('user_queue', json.dumps(user_data, default=_serialize))
     return user_data['request_id']
 
 
 def enqueue_scraper_data(scraper_data: dict) -> None:
     """Push a background scraper post to the low-priority scraper queue."""
+    stamp(scraper_data)
     get_redis().rpush('scraper_queue', json.dumps(scraper_data, default=_serialize))
 
 
+async def request_user_eval(user_data: dict, timeout: float) -> dict | None:
+    """
+    Async counterpart of enqueue_user_data + brpop for ASGI views.
+
+    Pushes the request to user_queue and awaits the worker's response key
+    without tying up a thread.  Returns None if no result arrives within
+    *timeout* seconds.  A fresh client is used per call because asyncio
+    connections are bound to the event loop that opened them.
+    """
+    from django.conf import settings
+
+    if 'request_id' not in user_data:
+        user_data['request_id'] = str(uuid.uuid4())
+    request_id = user_data['request_id']
+
+    client = redis.asyncio.StrictRedis(
+        host=getattr(settings, 'REDIS_HOST', 'localhost'),
+        port=int(getattr(settings, 'REDIS_PORT', 6379)),
+        db=0,
+    )
+    try:
+        await client.rpush('user_queue', json.dumps(stamp(user_data), default=_serialize))
+        result = await client.blpop([f'response_queue:{request_id}'], timeout=timeout)
+    finally:
+        await client.aclose()
+
+    if result is None:
+        return None
+    _, raw = result
+    return json.loads(raw)
+
+
+# ---------------------------------------------------------------------------
+# Worker readiness  (lets deploys wait until a worker is warm)
+# ---------------------------------------------------------------------------
+
+def _worker_id() -> str:
+    return f'{socket.gethostname()}:{os.getpid()}'
+
+
+def mark_worker_ready(
+    worker_id: str,
+    models: list[str],
+    ttl: int,
+    stats: dict | None = None,
+    stages: dict | None = None,
+    failed: list[str] | None = None,
+) -> None:
+    """Set (or refresh) this worker's readiness key; it expires after *ttl* seconds.
+
+    *stats* (the model registry's memory/eviction counters) rides along so
+    operators can size worker pods from the same key, as do the cumulative
+    per-stage timings in *stages* (see ``stocknlp.stage_timer``).  *failed*
+    lists preloads that did not load; ``wait_for_worker`` does not count such
+    a worker as ready.
+    """
+    get_redis().set(
+        f'{WORKER_READY_KEY_PREFIX}:{worker_id}',
+        json.dumps({
+            'models': models,
+            'failed': failed or [],
+            'ready_at': time.time(),
+            'registry': stats or {},
+            'stages': stages or {},
+        }),
+        ex=ttl,
+    )
+
+
+def clear_worker_ready(worker_id: str) -> None:
+    get_redis().delete(f'{WORKER_READY_KEY_PREFIX}:{worker_id}')
+
+
+def get_ready_workers() -> dict[str, dict]:
+    """Return {worker_id: readiness payload} for every worker currently warm."""
+    client = get_redis()
+    ready = {}
+    for key in client.scan_iter(match=f'{WORKER_READY_KEY_PREFIX}:*'):
+        raw = client.get(key)
+        if raw is None:
+            continue
+        worker_id = key.decode().split(f'{WORKER_READY_KEY_PREFIX}:', 1)[1]
+        ready[worker_id] = json.loads(raw)
+    return ready
+
+
+# ---------------------------------------------------------------------------
+# Model hot reload  (broadcast via: python manage.py reload_model)
+# ---------------------------------------------------------------------------
+
+def publish_model_reload(model_id: str, config: dict) -> int:
+    """Broadcast a new config for *model_id*; returns how many processes received it."""
+    message = json.dumps({'model_id': model_id, 'config': config})
+    return get_redis().publish(MODEL_RELOAD_CHANNEL, message)
+
+
+def apply_model_reload(raw: bytes | str) -> None:
+    """Handle one reload broadcast in this process.
+
+    Processes that have not built a registry yet have nothing to swap: they
+    will read the updated model_configs.json when they do.
+    """
+    from django.conf import settings
+
+    registry = apps.get_app_config('scraper').get_if_initialized('MODEL_REGISTRY')
+    if registry is None:
+        return
+
+    message = json.loads(raw)
+    registry.reload(
+        message['model_id'],
+        message.get('config'),
+        seq_lens=settings.MODEL_WARMUP_SEQ_LENS,
+    )
+
+
+def _listen_for_model_reloads() -> None:
+    backoff = 1
+    while True:
+        try:
+            pubsub = get_redis().pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(MODEL_RELOAD_CHANNEL)
+            backoff = 1
+            for message in pubsub.listen():
+                try:
+                    apply_model_reload(message['data'])
+                except Exception:
+                    logger.exception("Model reload failed; current version kept.")
+        except redis.RedisError as e:
+            logger.error("Model reload listener lost Redis: %s — retrying in %ss", e, backoff)
+            time.sleep(backoff)
+            backoff = min(backoff * 2, 60)
+
+
+def start_model_reload_listener() -> threading.Thread:
+    """Run the reload subscriber in a daemon thread so swaps never block serving."""
+    thread = threading.Thread(
+        target=_listen_for_model_reloads,
+        name='model_reload_listener',
+        daemon=True,
+    )
+    thread.start()
+    return thread
+
+
 # ---------------------------------------------------------------------------
 # Consumer  (run via: python manage.py run_llm_worker)
 # ---------------------------------------------------------------------------
 
-def priority_worker() -> None:
+def dead_letter(queue_name: str, raw_payloads: list[bytes], error: Exception) -> None:
+    """Park payloads the worker could not process, with the error, for inspection.
+
+    Only the newest DEAD_LETTER_MAX_LENGTH entries are kept, so a flood of bad
+    payloads cannot grow the list without bound.
+    """
+    from django.conf import settings
+
+    pipe = get_redis().pipeline(transaction=False)
+    for raw in raw_payloads:
+        pipe.rpush(DEAD_LETTER_QUEUE, json.dumps({
+            'queue': queue_name,
+            'payload': raw.decode('utf-8', errors='replace') if isinstance(raw, bytes) else raw,
+            'error': repr(error),
+            'failed_at': time.time(),
+        }))
+    pipe.ltrim(DEAD_LETTER_QUEUE, -settings.DEAD_LETTER_MAX_LENGTH, -1)
+    pipe.execute()
+    DEAD_LETTERS.inc(len(raw_payloads), queue=queue_name)
+
+
+def _check_user_request(data) -> dict:
+    """Return *data* if it is a user request the worker can answer; raise otherwise."""
+    if not isinstance(data, dict) or 'request_id' not in data:
+        raise ValueError('User request has no request_id to answer to.')
+    return data
+
+
+def eval_user_request(data_manager, data: dict) -> dict:
+    """Evaluate one on-demand request; failures come back as ``{'error', 'status'}``.
+
+    ``status`` is what the API answers with: 400 for input the models
+    reject (ValueError, e.g. an unknown model ID), 500 otherwise, matching
+    the in-process ``EvalView``.
+    """
+    try:
+        if data.get('model_ids'):
+            return data_manager.eval_sentiment_ensemble(
+                data, data['model_ids'], with_save=data.get('with_save', False),
+            )
+        return data_manager.eval_sentiment(
+            data, with_save=data.get('with_save', False), model_id=data.get('model_id'),
+        )
+    except ValueError as e:
+        WORKER_ERRORS.inc(kind='payload')
+        return {'error': str(e), 'status': 400}
+    except Exception as e:
+        WORKER_ERRORS.inc(kind='payload')
+        logger.exception("Evaluation failed for user request %s", data.get('request_id'))
+        return {'error': f'Unexpected error during evaluation: {e}', 'status': 500}
+
+
+def eval_user_batch(data_manager, requests: list[dict]) -> list[dict]:
+    """Evaluate pending on-demand requests together; one result per request, in order.
+
+    Single-model requests with the same model ID and ``with_save`` share one
+    ``eval_sentiment_batch`` call; ensembles are evaluated one at a time.  If
+    a shared batch raises, its requests are retried one by one so each caller
+    gets its own result or error (see ``eval_user_request``).
+    """
+    results: list[dict | None] = [None] * len(requests)
+    groups: dict[tuple, list[int]] = {}
+    for i, data in enumerate(requests):
+        if data.get('model_ids'):
+            results[i] = eval_user_request(data_manager, data)
+        else:
+            model_id = data.get('model_id') or data_manager.default_model_id
+            groups.setdefault((model_id, bool(data.get('with_save', False))), []).append(i)
+
+    for (model_id, with_save), indexes in groups.items():
+        if len(indexes) > 1:
+            try:
+                batch = data_manager.eval_sentiment_batch(
+                    [requests[i] for i in indexes], with_save=with_save, model_id=model_id,
+                )
+            except Exception as e:
+                logger.debug("Batch of %d user request(s) failed (%s); evaluating one by one", len(indexes), e)
+            else:
+                for i, result in zip(indexes, batch):
+                    results[i] = result
+                continue
+        for i in indexes:
+            results[i] = eval_user_request(data_manager, requests[i])
+    return results
+
+
+def reply_to_user(client, request_id: str, result: dict) -> None:
+    """Hand *result* to the caller awaiting ``response_queue:{request_id}``."""
+    from django.conf import settings
+
+    key = f'response_queue:{request_id}'
+    pipe = client.pipeline(transaction=False)
+    pipe.rpush(key, json.dumps(result, default=_serialize))
+    pipe.expire(key, settings.CACHE_TTL_WORKER_RESULT)
+    pipe.execute()
+
+
+def eval_scraper_batch(data_manager, posts: list[dict], default_model_id: str) -> list[tuple[int, Exception]]:
+    """Evaluate and save scraped posts, one batched forward pass per model ID.
+
+    If a model's batch raises, its posts are retried one at a time so a bad
+    post can't take the rest of the batch down with it.  Returns
+    ``(index, error)`` for every post in *posts* that still failed.
+    """
+    BATCH_SIZE.observe(len(posts))
+    by_model: dict[str, list[int]] = {}
+    for i, post in enumerate(posts):
+        by_model.setdefault(post.get('model_id') or default_model_id, []).append(i)
+
+    failed = []
+    for model_id, indexes in by_model.items():
+        logger.debug("Processing %d scraper post(s) (model=%s)", len(indexes), model_id)
+        errors: dict[int, Exception] = {}
+        try:
+            data_manager.eval_sentiment_batch([posts[i] for i in indexes], with_save=True, model_id=model_id)
+        except Exception as e:
+            if len(indexes) == 1:
+                errors[indexes[0]] = e
+            else:
+                logger.warning(
+                    "Batch of %d post(s) failed (model=%s): %s — evaluating one by one", len(indexes), model_id, e,
+                )
+                for i in indexes:
+                    try:
+                        data_manager.eval_sentiment_batch([posts[i]], with_save=True, model_id=model_id)
+                    except Exception as post_error:
+                        errors[i] = post_error
+        for i, error in errors.items():
+            WORKER_ERRORS.inc(kind='payload')
+            logger.error("Scraper post could not be evaluated (model=%s): %r", model_id, error)
+            failed.append((i, error))
+        MESSAGES_PROCESSED.inc(len(indexes) - len(errors), queue='scraper_queue', model=model_id)
+    return failed
+
+
+def priority_worker(
+    preload_models: list[str] | None = None,
+    warmup_seq_lens: list[int] | None = None,
+) -> None:
     """
     Single-threaded LLM worker:
-      1. Always drain user_queue first (high priority).
-      2. Only process scraper_queue when user_queue is empty.
+      1. Always drain user_queue first (high priority), taking up to
+         WORKER_USER_BATCH_SIZE pending requests per pass.
+      2. Only process scraper_queue when user_queue is empty, taking up to
+         WORKER_SCRAPER_BATCH_SIZE posts per forward pass.
+
+    Before consuming, every model in *preload_models* is loaded and warmed
+    up, then a readiness key is published in Redis and refreshed on every
+    poll for as long as the worker runs.  Preloads that failed (and have not
+    loaded since) are listed in the key, which keeps ``wait_for_worker``
+    from counting the worker.
 
     Uses blpop (blocking pop) so the process sleeps when both queues are
     empty instead of spinning at 100% CPU.
-    Includes exponential backoff on repeated errors to protect against
-    Redis outages or consistently broken payloads.
+    Redis errors are retried with exponential backoff.  A bad payload never
+    stalls the queues: a user request that fails is answered with the error,
+    a scraped post that fails (on its own, after its batch fails) is moved to
+    dead_letter_queue, as is any payload that cannot be decoded.
+
+    Metrics (``stocknlp.metrics``) are served on WORKER_METRICS_PORT.
     """
     from django.conf import settings
 
     client = get_redis()
-    data_manager = apps.get_app_config('scraper').DATA_MANAGER
+    scraper_app = apps.get_app_config('scraper')
+    data_manager = scraper_app.DATA_MANAGER
     backoff = 1  # seconds; doubles on each consecutive error, resets on success
 
-    logger.info("LLM worker started. Listening on user_queue → scraper_queue …")
+    if preload_models is None:
+        preload_models = settings.WORKER_PRELOAD_MODELS
+    if warmup_seq_lens is None:
+        warmup_seq_lens = settings.MODEL_WARMUP_SEQ_LENS
 
-    while True:
-        try:
-            # blpop blocks until at least one queue has data.
-            # Priority: user_queue is listed first — Redis checks left-to-right.
-            result = client.blpop(['user_queue', 'scraper_queue'], timeout=5)
+    failed_preloads = []
+    if preload_models:
+        logger.info("Preloading models: %s", preload_models)
+        loaded = scraper_app.MODEL_REGISTRY.preload(preload_models, warmup_seq_lens)
+        failed_preloads = [model_id for model_id in preload_models if model_id not in loaded]
+        if failed_preloads:
+            logger.error("Preloading failed for %s; the worker will not report ready.", failed_preloads)
 
-            if result is None:
-                continue
+    start_model_reload_listener()
+    if settings.WORKER_METRICS_PORT:
+        start_metrics_server(settings.WORKER_METRICS_PORT, settings.WORKER_METRICS_HOST)
 
-            queue_name, raw = result
-            data = json.loads(raw)
+    worker_id = _worker_id()
+    logger.info("LLM worker %s started. Listening on user_queue → scraper_queue …", worker_id)
 
-            if queue_name == b'user_queue':
-                request_id = data['request_id']
-                model_id = data.get('model_id')
-                logger.debug("Processing user request %s (model=%s)", request_id, model_id)
-                sentiment_result = data_manager.eval_sentiment(
-                    data, with_save=False, model_id=model_id,
+    try:
+        while True:
+            queue_name, in_flight = None, []
+            try:
+                # Refreshing on every poll keeps the key alive while the loop runs;
+                # a hung or dead worker drops out once WORKER_READY_TTL lapses.
+                registry = data_manager.registry
+                loaded_models = registry.loaded_models
+                mark_worker_ready(
+                    worker_id, loaded_models, settings.WORKER_READY_TTL,
+                    registry.stats, stage_timer.snapshot(),
+                    failed=[model_id for model_id in failed_preloads if model_id not in loaded_models],
                 )
-                client.rpush(f'response_queue:{request_id}', json.dumps(sentiment_result, default=_serialize))
-                client.expire(f'response_queue:{request_id}', settings.CACHE_TTL_WORKER_RESULT)
-            else:
-                model_id = data.get('model_id')
-                logger.debug("Processing scraper post for ticker %s (model=%s)", data.get('ticker'), model_id or 'default')
-                data_manager.eval_sentiment(data, with_save=True, model_id=model_id)
+                metrics_registry.maybe_flush()
+                trace_exporter.maybe_flush()
 
-            backoff = 1  # reset after a successful cycle
+                # blpop blocks until at least one queue has data.
+                # Priority: user_queue is listed first — Redis checks left-to-right.
+                result = client.blpop(['user_queue', 'scraper_queue'], timeout=5)
 
-        except redis.RedisError as e:
-            logger.error("Redis error: %s — retrying in %ss", e, backoff)
-            time.sleep(backoff)
-            backoff = min(backoff * 2, 60)
+                if result is None:
+                    continue
 
-        except Exception as e:
-            logger.exception("Unexpected worker error: %s — retrying in %ss", e, backoff)
-            time.sleep(backoff)
-            backoff = min(backoff * 2, 60)
+                queue_name, raw = result
+                in_flight = [raw]
+                # Spans recorded inside (decode, tokenize, forward, save, ...) are
+                # exported per payload when the block exits.
+                with trace_batch(queue_name.decode()) as trace:
+                    with timed('decode'):
+                        data = json.loads(raw)
+                    trace.attach(data)
+
+                    if queue_name == b'user_queue':
+                        requests = [_check_user_request(data)]
+                        if settings.WORKER_USER_BATCH_SIZE > 1:
+                            extra = client.lpop('user_queue', settings.WORKER_USER_BATCH_SIZE - 1) or []
+                            in_flight.extend(extra)
+                            with timed('decode', len(extra)):
+                                for item in extra:
+                                    # One unreadable request is parked without holding up the rest.
+                                    try:
+                                        requests.append(_check_user_request(json.loads(item)))
+                                    except ValueError as e:
+                                        dead_letter('user_queue', [item], e)
+                            trace.attach(*requests[1:])
+                        logger.debug("Processing %d user request(s)", len(requests))
+                        results = eval_user_batch(data_manager, requests)
+                        in_flight = []  # answered, even if with an error
+                        for request, result in zip(requests, results):
+                            reply_to_user(client, request['request_id'], result)
+                            MESSAGES_PROCESSED.inc(
+                                queue='user_queue',
+                                model='ensemble' if request.get('model_ids')
+                                else (request.get('model_id') or data_manager.default_model_id),
+                            )
+                    else:
+                        posts = [data]
+                        if settings.WORKER_SCRAPER_BATCH_SIZE > 1:
+                            extra = client.lpop('scraper_queue', settings.WORKER_SCRAPER_BATCH_SIZE - 1) or []
+                            with timed('decode', len(extra)):
+                                for item in extra:
+                                    try:
+                                        posts.append(json.loads(item))
+                                    except ValueError as e:
+                                        dead_letter('scraper_queue', [item], e)
+                                    else:
+                                        in_flight.append(item)
+                            trace.attach(*posts[1:])
+                        failed = eval_scraper_batch(data_manager, posts, settings.SCRAPER_MODEL_ID)
+                        raws, in_flight = in_flight, []
+                        # Only the posts that failed on their own are parked.
+                        for i, error in failed:
+                            dead_letter('scraper_queue', [raws[i]], error)
+
+                backoff = 1  # reset after a successful cycle
+
+            except redis.RedisError as e:
+                WORKER_ERRORS.inc(kind='redis')
+                logger.error("Redis error: %s — retrying in %ss", e, backoff)
+                time.sleep(backoff)
+                backoff = min(backoff * 2, 60)
+
+            except Exception as e:
+                # A payload problem, not an outage: park the payloads and carry on
+                # without backing off, so one bad message can't stall the queues.
+                WORKER_ERRORS.inc(kind='unexpected')
+                logger.exception("Unexpected worker error: %s", e)
+                if in_flight:
+                    try:
+                        dead_letter(queue_name.decode(), in_flight, e)
+                    except redis.RedisError:
+                        logger.error("Could not dead-letter %d payload(s); dropped.", len(in_flight))
+    finally:
+        try:
+            clear_worker_ready(worker_id)
+        except redis.RedisError:
+            pass
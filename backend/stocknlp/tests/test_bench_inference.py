@@ -0,0 +1,76 @@
+import json
+from io import StringIO
+from types import SimpleNamespace
+from unittest.mock import patch, MagicMock
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from stocknlp.stage_timer import percentile
+
+
+class PercentileTests(TestCase):
+    def test_nearest_rank(self):
+        samples = [float(i) for i in range(1, 101)]
+        self.assertEqual(percentile(samples, 50), 50.0)
+        self.assertEqual(percentile(samples, 99), 99.0)
+        self.assertEqual(percentile([3.0], 95), 3.0)
+
+
+class BenchInferenceCommandTests(TestCase):
+    def setUp(self):
+        self.registry = MagicMock()
+        self.registry.available_models = ['FinBERT', 'Cascade:LSTMCNNv1>FinBERT']
+        self.data_manager = MagicMock()
+        self.data_manager.eval_sentiment_batch.side_effect = lambda tweets, model_id: [
+            {**t, 'prediction': 'positive', 'predicted_probabilities': [0.1, 0.1, 0.8]}
+            for t in tweets
+        ]
+        app = SimpleNamespace(MODEL_REGISTRY=self.registry, DATA_MANAGER=self.data_manager)
+        patcher = patch(
+            'stocknlp.management.commands.bench_inference.apps.get_app_config', return_value=app,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _run(self, *args):
+        out = StringIO()
+        call_command('bench_inference', *args, stdout=out, stderr=StringIO())
+        return json.loads(out.getvalue())
+
+    def test_reports_every_grid_point(self):
+        report = self._run(
+            '--models', 'FinBERT', '--batch-sizes', '1,4', '--seq-lens', '8,16',
+            '--threads', '1', '--iterations', '3', '--warmup', '1',
+        )
+        self.assertEqual(len(report['results']), 4)
+        point = report['results'][0]
+        for key in (
+            'batch_p50_ms', 'batch_p95_ms', 'batch_p99_ms', 'tweets_per_sec', 'rss_delta_mb', 'process_peak_rss_mb',
+        ):
+            self.assertIn(key, point)
+        self.registry.warm_up.assert_called_once()
+        # 4 grid points x (1 warmup + 3 timed) batches
+        self.assertEqual(self.data_manager.eval_sentiment_batch.call_count, 16)
+
+    def test_rss_delta_is_measured_from_before_the_model_loads(self):
+        with patch('stocknlp.management.commands.bench_inference._rss_mb', side_effect=[100.0, 130.5]):
+            report = self._run(
+                '--models', 'FinBERT', '--batch-sizes', '1', '--seq-lens', '8',
+                '--threads', '1', '--iterations', '1', '--warmup', '0',
+            )
+        self.assertEqual(report['results'][0]['rss_delta_mb'], 30.5)
+
+    def test_synthetic_tweets_have_requested_length(self):
+        self._run(
+            '--models', 'FinBERT', '--batch-sizes', '2', '--seq-lens', '12',
+            '--threads', '1', '--iterations', '1', '--warmup', '0',
+        )
+        tweets = self.data_manager.eval_sentiment_batch.call_args.args[0]
+        self.assertEqual(len(tweets), 2)
+        self.assertTrue(all(len(t['text'].split()) == 12 for t in tweets))
+
+    def test_rejects_unavailable_model(self):
+        with self.assertRaises(CommandError):
+            self._run('--models', 'NoSuchModel')
@@ -0,0 +1,28 @@
+import json
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+
+class BenchScraperReplayTests(TestCase):
+    def test_reports_each_mode(self):
+        out = StringIO()
+        call_command('bench_scraper_replay', '--repeat', '1', stdout=out)
+        report = json.loads(out.getvalue())
+        self.assertEqual(set(report['modes']), {'dom', 'network'})
+        self.assertEqual(report['modes']['dom']['tweets'], 40)
+        self.assertEqual(report['modes']['network']['tweets'], 4)
+        for result in report['modes'].values():
+            self.assertGreater(result['tweets_per_cpu_s'], 0)
+            self.assertIn('median', result['cpu_ms_per_scroll'])
+            self.assertGreater(result['peak_alloc_kb_per_scroll']['max'], 0)
+
+    def test_unknown_mode(self):
+        with self.assertRaises(CommandError):
+            call_command('bench_scraper_replay', '--modes', 'html', stdout=StringIO())
+
+    def test_missing_page(self):
+        with self.assertRaises(CommandError):
+            call_command('bench_scraper_replay', '/nonexistent.html', stdout=StringIO())
@@ -0,0 +1,30 @@
+import json
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from stocknlp.management.commands.bench_tweet_parser import DEFAULT_PAGE, PARSERS
+
+
+class BenchTweetParserTests(TestCase):
+    def test_parsers_agree_on_fixture(self):
+        page = DEFAULT_PAGE.read_text(encoding='utf-8')
+        legacy, lxml_records = (PARSERS[name](page) for name in ('bs4_two_pass', 'lxml_single_pass'))
+        self.assertEqual(len(legacy), len(lxml_records))
+        for old, new in zip(legacy, lxml_records):
+            for field in ('datetime', 'likes', 'retweets', 'replies', 'views'):
+                self.assertEqual(old[field], new[field], field)
+
+    def test_reports_each_parser(self):
+        out = StringIO()
+        call_command('bench_tweet_parser', '--repeat', '1', stdout=out)
+        report = json.loads(out.getvalue())
+        self.assertEqual(set(report['parsers']), set(PARSERS))
+        self.assertEqual(report['parsers']['lxml_single_pass']['tweets'], 40)
+        self.assertIn('speedup', report)
+
+    def test_missing_page(self):
+        with self.assertRaises(CommandError):
+            call_command('bench_tweet_parser', '/nonexistent.html', stdout=StringIO())
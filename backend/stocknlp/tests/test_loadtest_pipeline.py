@@ -0,0 +1,61 @@
+import json
+import random
+from datetime import date
+
+from django.test import TestCase
+
+from stocknlp.management.commands.loadtest_pipeline import summarize_stages, synthetic_tweet
+from stocknlp.stage_timer import StageTimer
+from stocknlp.tasks import _serialize
+
+
+class StageTimerTests(TestCase):
+    def test_accumulates_calls_items_and_seconds(self):
+        timer = StageTimer()
+        with timer.stage('forward', items=8):
+            pass
+        timer.add('forward', 0.5, items=4)
+        forward = timer.snapshot()['forward']
+        self.assertEqual(forward['calls'], 2)
+        self.assertEqual(forward['items'], 12)
+        self.assertGreaterEqual(forward['seconds'], 0.5)
+
+    def test_records_time_when_block_raises(self):
+        timer = StageTimer()
+        with self.assertRaises(RuntimeError):
+            with timer.stage('save'):
+                raise RuntimeError('db down')
+        self.assertEqual(timer.snapshot()['save']['calls'], 1)
+
+    def test_reset(self):
+        timer = StageTimer()
+        timer.add('clean', 0.1)
+        timer.reset()
+        self.assertEqual(timer.snapshot(), {})
+
+
+class SyntheticTweetTests(TestCase):
+    def test_matches_scraper_shape_and_is_unique(self):
+        rng = random.Random(0)
+        tweets = [synthetic_tweet(i, ['great quarter'], 'loadtest-x', rng) for i in range(3)]
+        self.assertEqual(
+            set(tweets[0]),
+            {'likes', 'retweets', 'replies', 'views', 'ticker', 'date', 'text', 'source'},
+        )
+        self.assertIsInstance(tweets[0]['date'], date)
+        self.assertEqual(len({t['text'] for t in tweets}), 3)
+        # Goes through the same JSON encoding as enqueue_scraper_data.
+        json.dumps(tweets[0], default=_serialize)
+
+
+class SummarizeStagesTests(TestCase):
+    def test_sums_workers_in_pipeline_order(self):
+        worker = {
+            'save': {'calls': 1, 'items': 10, 'seconds': 3.0},
+            'decode': {'calls': 10, 'items': 10, 'seconds': 1.0},
+        }
+        summary = summarize_stages([worker, worker])
+        self.assertEqual(list(summary), ['decode', 'save'])
+        self.assertEqual(summary['save']['items'], 20)
+        self.assertEqual(summary['save']['share'], 0.75)
+        self.assertEqual(summary['decode']['us_per_item'], 100000.0)
@@ -0,0 +1,119 @@
+import json
+from unittest.mock import patch, MagicMock
+
+import fakeredis
+import redis
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from stocknlp.metrics import CONTENT_TYPE, METRICS_KEY, MetricsRegistry
+from stocknlp.tasks import DEAD_LETTER_QUEUE, dead_letter
+
+
+class MetricsRegistryTests(TestCase):
+    def setUp(self):
+        self.client = fakeredis.FakeStrictRedis()
+
+    def _registry(self):
+        registry = MetricsRegistry(flush_interval=3600)
+        return registry, registry.counter('t_total', 'Test counter.'), registry.histogram(
+            't_seconds', 'Test histogram.', buckets=(0.1, 1),
+        )
+
+    def test_counter_renders_after_flush(self):
+        registry, counter, _ = self._registry()
+        counter.inc(queue='scraper_queue', model='FinBERT')
+        counter.inc(2, queue='scraper_queue', model='FinBERT')
+        # Nothing reaches Redis until the flush interval passes.
+        self.assertFalse(self.client.exists(METRICS_KEY))
+
+        text = registry.render(self.client)
+        self.assertIn('# TYPE t_total counter', text)
+        self.assertIn('t_total{queue="scraper_queue",model="FinBERT"} 3', text)
+        self.assertIn('stocknlp_queue_depth{queue="user_queue"} 0', text)
+
+    def test_histogram_buckets_are_cumulative_and_ordered(self):
+        registry, _, histogram = self._registry()
+        histogram.observe(0.05, stage='forward')
+        histogram.observe(0.5, stage='forward')
+        lines = [
+            line for line in registry.render(self.client).splitlines()
+            if line.startswith('t_seconds')
+        ]
+        self.assertEqual(lines[:3], [
+            't_seconds_bucket{stage="forward",le="0.1"} 1',
+            't_seconds_bucket{stage="forward",le="1"} 2',
+            't_seconds_bucket{stage="forward",le="+Inf"} 2',
+        ])
+        self.assertIn('t_seconds_count{stage="forward"} 2', lines)
+        self.assertIn('t_seconds_sum{stage="forward"} 0.55', lines)
+
+    def test_processes_aggregate_through_redis(self):
+        worker_a, counter_a, _ = self._registry()
+        worker_b, counter_b, _ = self._registry()
+        counter_a.inc(queue='user_queue')
+        counter_b.inc(4, queue='user_queue')
+        worker_a.flush(self.client)
+        self.assertIn('t_total{queue="user_queue"} 5', worker_b.render(self.client))
+
+    def test_failed_flush_keeps_deltas(self):
+        registry, counter, _ = self._registry()
+        counter.inc()
+        broken = MagicMock()
+        broken.pipeline.return_value.execute.side_effect = redis.ConnectionError('down')
+        registry.flush(broken)
+        self.assertIn('t_total 1', registry.render(self.client))
+
+    def test_fork_drops_pending_deltas(self):
+        registry, counter, _ = self._registry()
+        counter.inc()
+        registry._after_fork()
+        self.assertNotIn('t_total 1', registry.render(self.client))
+
+
+class MetricsEndpointTests(TestCase):
+    def test_serves_prometheus_text(self):
+        with patch('stocknlp.tasks.get_redis', return_value=fakeredis.FakeStrictRedis()):
+            response = self.client.get(reverse('metrics'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], CONTENT_TYPE)
+        self.assertIn(b'# TYPE stocknlp_messages_processed_total counter', response.content)
+
+    def test_redis_down_returns_503(self):
+        broken = MagicMock()
+        broken.pipeline.return_value.execute.side_effect = redis.ConnectionError('down')
+        with patch('stocknlp.tasks.get_redis', return_value=broken):
+            response = self.client.get(reverse('metrics'))
+        self.assertEqual(response.status_code, 503)
+
+    def test_outside_clients_are_refused(self):
+        for meta in ({'REMOTE_ADDR': '203.0.113.9'}, {'HTTP_X_FORWARDED_FOR': '203.0.113.9'}):
+            with self.subTest(**meta):
+                self.assertEqual(self.client.get(reverse('metrics'), **meta).status_code, 403)
+                self.assertEqual(self.client.get(reverse('trace-summary'), **meta).status_code, 403)
+
+    @override_settings(INTERNAL_NETWORKS=['10.1.0.0/16'])
+    def test_internal_networks_are_configurable(self):
+        with patch('stocknlp.tasks.get_redis', return_value=fakeredis.FakeStrictRedis()):
+            self.assertEqual(self.client.get(reverse('metrics'), REMOTE_ADDR='10.1.2.3').status_code, 200)
+            self.assertEqual(self.client.get(reverse('metrics')).status_code, 403)
+
+
+class DeadLetterTests(TestCase):
+    def test_parks_payload_with_error(self):
+        client = fakeredis.FakeStrictRedis()
+        with patch('stocknlp.tasks.get_redis', return_value=client):
+            dead_letter('scraper_queue', [b'{"text": "x"}'], ValueError('bad'))
+        entry = json.loads(client.lpop(DEAD_LETTER_QUEUE))
+        self.assertEqual(entry['queue'], 'scraper_queue')
+        self.assertEqual(entry['payload'], '{"text": "x"}')
+        self.assertIn('bad', entry['error'])
+
+    @override_settings(DEAD_LETTER_MAX_LENGTH=3)
+    def test_keeps_only_the_newest_entries(self):
+        client = fakeredis.FakeStrictRedis()
+        with patch('stocknlp.tasks.get_redis', return_value=client):
+            dead_letter('scraper_queue', [b'1', b'2'], ValueError('bad'))
+            dead_letter('scraper_queue', [b'3', b'4'], ValueError('bad'))
+        payloads = [json.loads(e)['payload'] for e in client.lrange(DEAD_LETTER_QUEUE, 0, -1)]
+        self.assertEqual(payloads, ['2', '3', '4'])
@@ -0,0 +1,208 @@
+import json
+from io import StringIO
+from unittest.mock import patch, MagicMock
+
+import fakeredis
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from stocknlp.tasks import (
+    MODEL_RELOAD_CHANNEL,
+    WORKER_READY_KEY_PREFIX,
+    apply_model_reload,
+    clear_worker_ready,
+    eval_scraper_batch,
+    eval_user_batch,
+    eval_user_request,
+    get_ready_workers,
+    mark_worker_ready,
+    publish_model_reload,
+    reply_to_user,
+)
+
+
+class WorkerReadinessTests(TestCase):
+    def setUp(self):
+        self.client = MagicMock()
+        patcher = patch('stocknlp.tasks.get_redis', return_value=self.client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_mark_ready_sets_key_with_ttl(self):
+        mark_worker_ready('host:1', ['FinBERT'], ttl=30)
+        key, raw = self.client.set.call_args.args
+        self.assertEqual(key, f'{WORKER_READY_KEY_PREFIX}:host:1')
+        self.assertEqual(json.loads(raw)['models'], ['FinBERT'])
+        self.assertEqual(self.client.set.call_args.kwargs['ex'], 30)
+
+    def test_mark_ready_carries_stage_timings(self):
+        stages = {'forward': {'calls': 1, 'items': 16, 'seconds': 0.2}}
+        mark_worker_ready('host:1', ['FinBERT'], ttl=30, stages=stages)
+        _, raw = self.client.set.call_args.args
+        self.assertEqual(json.loads(raw)['stages'], stages)
+
+    def test_mark_ready_lists_failed_preloads(self):
+        mark_worker_ready('host:1', ['FinBERT'], ttl=30, failed=['TweetBERT'])
+        _, raw = self.client.set.call_args.args
+        self.assertEqual(json.loads(raw)['failed'], ['TweetBERT'])
+
+    def test_clear_ready_deletes_key(self):
+        clear_worker_ready('host:1')
+        self.client.delete.assert_called_once_with(f'{WORKER_READY_KEY_PREFIX}:host:1')
+
+    def test_get_ready_workers_parses_keys(self):
+        self.client.scan_iter.return_value = [f'{WORKER_READY_KEY_PREFIX}:host:1'.encode()]
+        self.client.get.return_value = json.dumps({'models': ['FinBERT'], 'ready_at': 0})
+        self.assertEqual(get_ready_workers(), {'host:1': {'models': ['FinBERT'], 'ready_at': 0}})
+
+    def test_get_ready_workers_skips_expired_keys(self):
+        self.client.scan_iter.return_value = [f'{WORKER_READY_KEY_PREFIX}:host:1'.encode()]
+        self.client.get.return_value = None
+        self.assertEqual(get_ready_workers(), {})
+
+
+class WaitForWorkerCommandTests(TestCase):
+    def _run(self, workers, *args):
+        out = StringIO()
+        with patch('stocknlp.management.commands.wait_for_worker.get_ready_workers', return_value=workers):
+            call_command('wait_for_worker', *args, stdout=out)
+        return out.getvalue()
+
+    def test_counts_warm_workers(self):
+        output = self._run({'host:1': {'models': ['FinBERT'], 'failed': []}}, '--model', 'FinBERT')
+        self.assertIn('1 worker(s) ready', output)
+
+    def test_worker_with_failed_preload_is_not_ready(self):
+        workers = {'host:1': {'models': ['FinBERT'], 'failed': ['TweetBERT']}}
+        with self.assertRaisesMessage(CommandError, 'host:1: preload failed for TweetBERT'):
+            self._run(workers, '--timeout', '0')
+
+
+class ModelReloadTests(TestCase):
+    @patch('stocknlp.tasks.get_redis')
+    def test_publish_sends_model_and_config(self, mock_get_redis):
+        mock_get_redis.return_value.publish.return_value = 2
+        receivers = publish_model_reload('FinBERT', {'model_name': 'transformer_model'})
+        self.assertEqual(receivers, 2)
+        channel, raw = mock_get_redis.return_value.publish.call_args.args
+        self.assertEqual(channel, MODEL_RELOAD_CHANNEL)
+        self.assertEqual(json.loads(raw)['model_id'], 'FinBERT')
+
+    @patch('stocknlp.tasks.apps')
+    def test_apply_reloads_initialized_registry(self, mock_apps):
+        registry = MagicMock()
+        mock_apps.get_app_config.return_value.get_if_initialized.return_value = registry
+        apply_model_reload(json.dumps({'model_id': 'FinBERT', 'config': {'a': 1}}))
+        registry.reload.assert_called_once()
+        self.assertEqual(registry.reload.call_args.args, ('FinBERT', {'a': 1}))
+
+    @patch('stocknlp.tasks.apps')
+    def test_apply_is_noop_without_registry(self, mock_apps):
+        mock_apps.get_app_config.return_value.get_if_initialized.return_value = None
+        apply_model_reload(json.dumps({'model_id': 'FinBERT', 'config': None}))
+
+
+class ScraperBatchTests(TestCase):
+    def test_groups_posts_by_model_and_saves(self):
+        data_manager = MagicMock()
+        posts = [
+            {'text': 'a', 'ticker': 'AAPL'},
+            {'text': 'b', 'ticker': 'AAPL', 'model_id': 'TweetBERT'},
+            {'text': 'c', 'ticker': 'TSLA'},
+        ]
+        eval_scraper_batch(data_manager, posts, 'Cascade:LSTMCNNv1>FinBERT')
+
+        calls = {
+            c.kwargs['model_id']: c.args[0] for c in data_manager.eval_sentiment_batch.call_args_list
+        }
+        self.assertEqual(calls['Cascade:LSTMCNNv1>FinBERT'], [posts[0], posts[2]])
+        self.assertEqual(calls['TweetBERT'], [posts[1]])
+        for c in data_manager.eval_sentiment_batch.call_args_list:
+            self.assertTrue(c.kwargs['with_save'])
+
+    def test_failed_batch_retries_posts_one_by_one(self):
+        data_manager = MagicMock()
+        bad = {'text': 'b', 'ticker': 'AAPL'}
+
+        def evaluate(group, **kwargs):
+            if bad in group:
+                raise KeyError('source')
+
+        data_manager.eval_sentiment_batch.side_effect = evaluate
+        posts = [{'text': 'a', 'ticker': 'AAPL'}, bad, {'text': 'c', 'ticker': 'TSLA'}]
+        failed = eval_scraper_batch(data_manager, posts, 'FinBERT')
+
+        self.assertEqual([(i, type(e)) for i, e in failed], [(1, KeyError)])
+        # One batched attempt, then each post on its own.
+        self.assertEqual(data_manager.eval_sentiment_batch.call_count, 4)
+
+    def test_clean_batch_reports_no_failures(self):
+        self.assertEqual(eval_scraper_batch(MagicMock(), [{'text': 'a', 'ticker': 'AAPL'}], 'FinBERT'), [])
+
+
+class UserRequestTests(TestCase):
+    def setUp(self):
+        self.data_manager = MagicMock()
+        self.request = {'request_id': 'r1', 'text': 'a', 'ticker': 'AAPL', 'model_id': 'Nope'}
+
+    def test_result_is_returned(self):
+        self.data_manager.eval_sentiment.return_value = {'prediction': 2}
+        self.assertEqual(eval_user_request(self.data_manager, self.request), {'prediction': 2})
+        self.assertEqual(self.data_manager.eval_sentiment.call_args.kwargs['model_id'], 'Nope')
+
+    def test_bad_input_is_reported_as_400(self):
+        self.data_manager.eval_sentiment.side_effect = ValueError("Unknown model ID 'Nope'")
+        result = eval_user_request(self.data_manager, self.request)
+        self.assertEqual(result, {'error': "Unknown model ID 'Nope'", 'status': 400})
+
+    def test_other_failures_are_reported_as_500(self):
+        self.data_manager.eval_sentiment_ensemble.side_effect = RuntimeError('CUDA error')
+        result = eval_user_request(self.data_manager, {**self.request, 'model_ids': ['A', 'B']})
+        self.assertEqual(result['status'], 500)
+        self.assertIn('CUDA error', result['error'])
+
+    def test_batch_shares_forward_pass_per_model(self):
+        self.data_manager.default_model_id = 'FinBERT'
+        self.data_manager.eval_sentiment_batch.side_effect = lambda group, **kw: [
+            {'text': t['text'], 'model': kw['model_id']} for t in group
+        ]
+        self.data_manager.eval_sentiment_ensemble.return_value = {'prediction': 1}
+        self.data_manager.eval_sentiment.return_value = {'text': 'd', 'model': 'TweetBERT'}
+        requests = [
+            {'request_id': 'r1', 'text': 'a', 'ticker': 'AAPL'},
+            {'request_id': 'r2', 'text': 'b', 'ticker': 'AAPL', 'model_ids': ['A', 'B']},
+            {'request_id': 'r3', 'text': 'c', 'ticker': 'AAPL', 'model_id': 'FinBERT'},
+            {'request_id': 'r4', 'text': 'd', 'ticker': 'AAPL', 'model_id': 'TweetBERT'},
+        ]
+        results = eval_user_batch(self.data_manager, requests)
+
+        self.assertEqual(results, [
+            {'text': 'a', 'model': 'FinBERT'}, {'prediction': 1},
+            {'text': 'c', 'model': 'FinBERT'}, {'text': 'd', 'model': 'TweetBERT'},
+        ])
+        # r1 and r3 ran together; the lone TweetBERT request took the single path.
+        self.data_manager.eval_sentiment_batch.assert_called_once()
+        self.assertEqual(self.data_manager.eval_sentiment.call_args.kwargs['model_id'], 'TweetBERT')
+
+    def test_failed_batch_is_answered_per_request(self):
+        self.data_manager.default_model_id = 'FinBERT'
+        self.data_manager.eval_sentiment_batch.side_effect = ValueError("tweet_object must contain 'text'")
+        self.data_manager.eval_sentiment.side_effect = [
+            {'prediction': 2}, ValueError("tweet_object must contain 'text'"),
+        ]
+        results = eval_user_batch(self.data_manager, [
+            {'request_id': 'r1', 'text': 'a', 'ticker': 'AAPL'},
+            {'request_id': 'r2', 'ticker': 'AAPL'},
+        ])
+        self.assertEqual(results[0], {'prediction': 2})
+        self.assertEqual(results[1]['status'], 400)
+
+    def test_reply_pushes_result_with_ttl(self):
+        client = fakeredis.FakeStrictRedis()
+        reply_to_user(client, 'r1', {'error': 'bad', 'status': 400})
+        self.assertEqual(json.loads(client.lpop('response_queue:r1')), {'error': 'bad', 'status': 400})
+        client.rpush('response_queue:r2', 'x')
+        reply_to_user(client, 'r2', {})
+        self.assertGreater(client.ttl('response_queue:r2'), 0)
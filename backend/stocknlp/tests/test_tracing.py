@@ -0,0 +1,117 @@
+import json
+import os
+import tempfile
+import time
+from unittest.mock import patch, MagicMock
+
+import fakeredis
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from stocknlp.stage_timer import timed
+from stocknlp.tasks import enqueue_scraper_data
+from stocknlp.tracing import exporter, stage_summary, stamp, trace_batch
+
+
+class StampTests(TestCase):
+    def test_adds_trace_id_and_enqueue_time(self):
+        payload = stamp({'text': 'hi'})
+        self.assertEqual(len(payload['trace_id']), 32)
+        self.assertAlmostEqual(payload['enqueued_at'], time.time(), delta=5)
+
+    def test_keeps_existing_trace(self):
+        payload = stamp({'trace_id': 'abc', 'enqueued_at': 1.0})
+        self.assertEqual((payload['trace_id'], payload['enqueued_at']), ('abc', 1.0))
+
+    def test_enqueue_scraper_data_stamps_payload(self):
+        client = MagicMock()
+        with patch('stocknlp.tasks.get_redis', return_value=client):
+            enqueue_scraper_data({'text': 'hi', 'ticker': 'AAPL'})
+        queue, raw = client.rpush.call_args.args
+        self.assertEqual(queue, 'scraper_queue')
+        self.assertIn('trace_id', json.loads(raw))
+
+
+class TraceBatchTests(TestCase):
+    def setUp(self):
+        # Drop anything other tests left pending, then start from an empty server.
+        exporter.flush(fakeredis.FakeStrictRedis(server=fakeredis.FakeServer()))
+        self.client = fakeredis.FakeStrictRedis(server=fakeredis.FakeServer())
+
+    def test_spans_are_shared_by_every_payload_in_the_batch(self):
+        payloads = [stamp({'text': 'a'}), stamp({'text': 'b'})]
+        with patch.object(exporter, 'maybe_flush'), self.assertLogs('stocknlp.tracing', 'INFO') as logs:
+            with trace_batch('scraper_queue') as batch:
+                batch.attach(*payloads)
+                with timed('forward', 2):
+                    pass
+        records = [json.loads(line.split(':', 2)[2]) for line in logs.output]
+        self.assertEqual({r['trace_id'] for r in records}, {p['trace_id'] for p in payloads})
+        self.assertTrue(all('forward' in r['stages_ms'] and r['batch_size'] == 2 for r in records))
+
+    def test_timed_outside_a_batch_records_nothing(self):
+        with timed('forward'):
+            pass
+        exporter.flush(self.client)
+        self.assertEqual(self.client.zcard('trace:samples'), 0)
+
+    def test_error_is_recorded_and_reraised(self):
+        with patch.object(exporter, 'maybe_flush'), self.assertLogs('stocknlp.tracing', 'INFO') as logs:
+            with self.assertRaises(RuntimeError):
+                with trace_batch('user_queue') as batch:
+                    batch.attach(stamp({'text': 'a'}))
+                    raise RuntimeError('boom')
+        self.assertIn('boom', json.loads(logs.output[0].split(':', 2)[2])['error'])
+
+    def test_summary_percentiles(self):
+        with patch.object(exporter, 'maybe_flush'), self.assertLogs('stocknlp.tracing', 'INFO'):
+            for _ in range(3):
+                with trace_batch('scraper_queue') as batch:
+                    batch.attach(stamp({'text': 'a'}))
+                    with timed('save'):
+                        pass
+        summary = stage_summary(5, client=self.client)
+        self.assertEqual(summary['traces'], 3)
+        self.assertEqual(summary['stages']['save']['count'], 3)
+        self.assertIn('queue_wait', summary['stages'])
+        self.assertIn('p95_ms', summary['stages']['total'])
+
+    @override_settings(TRACE_MAX_SAMPLES=2)
+    def test_samples_are_capped_by_count(self):
+        with patch.object(exporter, 'maybe_flush'), self.assertLogs('stocknlp.tracing', 'INFO'):
+            for _ in range(5):
+                with trace_batch('scraper_queue') as batch:
+                    batch.attach(stamp({'text': 'a'}))
+        exporter.flush(self.client)
+        self.assertEqual(self.client.zcard('trace:samples'), 2)
+        self.assertEqual(stage_summary(5, client=self.client)['traces'], 2)
+
+    def test_trace_file_gets_otel_shaped_spans(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'traces.jsonl')
+            payload = stamp({'text': 'a'})
+            with override_settings(TRACE_FILE=path), patch.object(exporter, 'maybe_flush'), \
+                    self.assertLogs('stocknlp.tracing', 'INFO'):
+                with trace_batch('scraper_queue') as batch:
+                    batch.attach(payload)
+                    with timed('tokenize'):
+                        pass
+            with open(path) as file:
+                spans = [json.loads(line) for line in file]
+        root = spans[0]
+        self.assertIsNone(root['parent_span_id'])
+        self.assertEqual([s['name'] for s in spans[1:]], ['queue_wait', 'tokenize'])
+        self.assertTrue(all(s['parent_span_id'] == root['span_id'] for s in spans[1:]))
+        self.assertTrue(all(s['end_time_unix_nano'] >= s['start_time_unix_nano'] for s in spans))
+
+
+class TraceSummaryEndpointTests(TestCase):
+    def test_returns_summary(self):
+        with patch('stocknlp.tasks.get_redis', return_value=fakeredis.FakeStrictRedis()):
+            response = self.client.get(reverse('trace-summary'), {'minutes': 5})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['window_minutes'], 5)
+
+    def test_rejects_window_beyond_retention(self):
+        response = self.client.get(reverse('trace-summary'), {'minutes': 10_000})
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+import redis
+
+logger = logging.getLogger(__name__)
+
+# Recent per-trace stage timings from every worker, scored by completion time
+# and capped by age and count; the /traces/summary endpoint computes its
+# percentiles from this.
+TRACE_SAMPLES_KEY = 'trace:samples'
+FLUSH_INTERVAL = 1.0
+
+
+def stamp(payload: dict) -> dict:
+    """Give a queue payload a trace id and enqueue time (keeps existing ones)."""
+    payload.setdefault('trace_id', uuid.uuid4().hex)
+    payload.setdefault('enqueued_at', time.time())
+    return payload
+
+
+class TraceBatch:
+    """Spans for the payloads a worker handles in one pass.
+
+    Stages of a batched pass (tokenize, forward, save, ...) run once for all
+    of its payloads, so each span is shared by every trace in the batch.
+    Times are taken with ``perf_counter`` and mapped onto wall-clock time
+    from the moment the batch was dequeued.
+    """
+
+    def __init__(self, queue: str):
+        self.queue = queue
+        self.dequeued_at = time.time()
+        self._perf_origin = time.perf_counter()
+        self.payloads: list[dict] = []
+        self.spans: list[tuple[str, float, float]] = []  # (name, perf start, seconds)
+        self.error: str | None = None
+
+    def attach(self, *payloads: dict) -> None:
+        self.payloads.extend(p for p in payloads if isinstance(p, dict))
+
+    def record(self, name: str, start: float, seconds: float) -> None:
+        self.spans.append((name, start, seconds))  # list.append is atomic; ensemble threads share this
+
+    def wall_time(self, perf: float) -> float:
+        return self.dequeued_at + (perf - self._perf_origin)
+
+    def summaries(self) -> list[dict]:
+        """One structured record per traced payload."""
+        finished = time.perf_counter()
+        stages_ms: dict[str, float] = {}
+        for name, _, seconds in self.spans:
+            stages_ms[name] = stages_ms.get(name, 0.0) + seconds * 1000
+        # Everything but the trace id and queue wait is the same for the whole
+        # batch, so it is built once and copied into each record.
+        worker_ms = (finished - self._perf_origin) * 1000
+        shared = {
+            'queue': self.queue,
+            'batch_size': len(self.payloads),
+            'stages_ms': {name: round(ms, 3) for name, ms in stages_ms.items()},
+            'worker_ms': round(worker_ms, 3),
+            'finished_at': self.wall_time(finished),
+        }
+        if self.error:
+            shared['error'] = self.error
+        records = []
+        for payload in self.payloads:
+            enqueued_at = payload.get('enqueued_at')
+            # Producer and worker clocks can disagree slightly; never report a negative wait.
+            queue_wait_ms = max(0.0, (self.dequeued_at - enqueued_at) * 1000) if enqueued_at else None
+            records.append({
+                'trace_id': payload.get('trace_id'),
+                **shared,
+                'queue_wait_ms': round(queue_wait_ms, 3) if queue_wait_ms is not None else None,
+                'total_ms': round(queue_wait_ms + worker_ms, 3) if queue_wait_ms is not None else None,
+            })
+        return records
+
+
+_current: ContextVar[TraceBatch | None] = ContextVar('trace_batch', default=None)
+
+
+def record_span(name: str, start: float, seconds: float) -> None:
+    """Attach a timed stage to the active batch, if any (called by StageTimer)."""
+    batch = _current.get()
+    if batch is not None:
+        batch.record(name, start, seconds)
+
+
+class _Exporter:
+    """Writes finished traces to the log, an optional JSON-lines file and Redis."""
+
+    def __init__(self, flush_interval: float = FLUSH_INTERVAL):
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._pending: list[dict] = []
+        self._last_flush = time.monotonic()
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=self._after_fork)
+
+    def _after_fork(self) -> None:
+        self._lock = threading.Lock()
+        self._pending = []
+        self._last_flush = time.monotonic()
+
+    def export(self, batch: TraceBatch) -> None:
+        from django.conf import settings
+
+        records = batch.summaries()
+        if not records:
+            return
+        if logger.isEnabledFor(logging.INFO):
+            for record in records:
+                logger.info(json.dumps(record))
+        if settings.TRACE_FILE:
+            self._write_spans(settings.TRACE_FILE, batch, records)
+        with self._lock:
+            self._pending.extend(records)
+        self.maybe_flush()
+
+    @staticmethod
+    def _write_spans(path: str, batch: TraceBatch, records: list[dict]) -> None:
+        # One JSON object per span with OpenTelemetry field names, so any
+        # collector or converter can pick the file up.
+        lines = []
+        for record in records:
+            trace_id = record['trace_id']
+            root_id = uuid.uuid4().hex[:16]
+            enqueued_at = batch.dequeued_at - (record['queue_wait_ms'] or 0) / 1000
+            common = {'trace_id': trace_id, 'attributes': {'queue': batch.queue, 'batch_size': record['batch_size']}}
+            lines.append({
+                **common, 'span_id': root_id, 'parent_span_id': None, 'name': f'{batch.queue} message',
+                'start_time_unix_nano': int(enqueued_at * 1e9),
+                'end_time_unix_nano': int(record['finished_at'] * 1e9),
+                'status': 'ERROR' if batch.error else 'OK',
+            })
+            lines.append({
+                **common, 'span_id': uuid.uuid4().hex[:16], 'parent_span_id': root_id, 'name': 'queue_wait',
+                'start_time_unix_nano': int(enqueued_at * 1e9),
+                'end_time_unix_nano': int(batch.dequeued_at * 1e9),
+            })
+            for name, start, seconds in batch.spans:
+                wall_start = batch.wall_time(start)
+                lines.append({
+                    **common, 'span_id': uuid.uuid4().hex[:16], 'parent_span_id': root_id, 'name': name,
+                    'start_time_unix_nano': int(wall_start * 1e9),
+                    'end_time_unix_nano': int((wall_start + seconds) * 1e9),
+                })
+        try:
+            with open(path, 'a', encoding='utf-8') as file:
+                file.write(''.join(json.dumps(line) + '\n' for line in lines))
+        except OSError as e:
+            logger.warning('Could not write trace file %s: %s', path, e)
+
+    def maybe_flush(self) -> None:
+        if time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self, client=None) -> None:
+        from django.conf import settings
+
+        with self._lock:
+            pending, self._pending = self._pending, []
+            self._last_flush = time.monotonic()
+        if not pending:
+            return
+        try:
+            if client is None:
+                from stocknlp.tasks import get_redis
+                client = get_redis()
+            cutoff = time.time() - settings.TRACE_RETENTION_MINUTES * 60
+            pipe = client.pipeline(transaction=False)
+            pipe.zadd(TRACE_SAMPLES_KEY, {
+                json.dumps({
+                    'trace_id': r['trace_id'], 'queue': r['queue'],
+                    'queue_wait_ms': r['queue_wait_ms'], 'stages_ms': r['stages_ms'], 'total_ms': r['total_ms'],
+                }): r['finished_at']
+                for r in pending
+            })
+            pipe.zremrangebyscore(TRACE_SAMPLES_KEY, '-inf', cutoff)
+            pipe.zremrangebyrank(TRACE_SAMPLES_KEY, 0, -settings.TRACE_MAX_SAMPLES - 1)
+            pipe.execute()
+        except redis.RedisError as e:
+            # Dropped rather than retried: summaries are best-effort and must
+            # not build up in memory while Redis is down.
+            logger.debug('Trace flush failed (%s); dropped %d samples.', e, len(pending))
+
+
+exporter = _Exporter()
+
+
+@contextmanager
+def trace_batch(queue: str):
+    """Collect spans for the payloads handled inside the block, then export them.
+
+    Call ``attach()`` on the yielded batch with each decoded payload.
+    """
+    batch = TraceBatch(queue)
+    token = _current.set(batch)
+    try:
+        yield batch
+    except BaseException as e:
+        batch.error = repr(e)
+        raise
+    finally:
+        _current.reset(token)
+        try:
+            exporter.export(batch)
+        except Exception:
+            logger.exception('Exporting traces failed.')
+
+
+def stage_summary(minutes: float, client=None) -> dict:
+    """Percentiles of queue wait, each stage and total time over the last *minutes*."""
+    from stocknlp.stage_timer import percentile
+
+    if client is None:
+        from stocknlp.tasks import get_redis
+        client = get_redis()
+    exporter.flush(client)
+    raw = client.zrangebyscore(TRACE_SAMPLES_KEY, time.time() - minutes * 60, '+inf')
+
+    series: dict[str, list[float]] = {}
+    for item in raw:
+        sample = json.loads(item)
+        if sample.get('queue_wait_ms') is not None:
+            series.setdefault('queue_wait', []).append(sample['queue_wait_ms'])
+        for name, ms in sample['stages_ms'].items():
+            series.setdefault(name, []).append(ms)
+        if sample.get('total_ms') is not None:
+            series.setdefault('total', []).append(sample['total_ms'])
+
+    return {
+        'window_minutes': minutes,
+        'traces': len(raw),
+        'stages': {
+            name: {
+                'count': len(values),
+                'p50_ms': round(percentile(values, 50), 3),
+                'p95_ms': round(percentile(values, 95), 3),
+                'p99_ms': round(percentile(values, 99), 3),
+                'max_ms': round(max(values), 3),
+            }
+            for name, values in series.items()
+        },
+    }
@@ -20,8 +20,12 @@ from django.contrib import admin
 from django.urls import include
 from django.urls import path
 
+from stocknlp.views import metrics_view, trace_summary_view
+
 urlpatterns = [
     path('admin/', admin.site.urls),
+    path('metrics', metrics_view, name='metrics'),
+    path('traces/summary', trace_summary_view, name='trace-summary'),
     path('api/', include('scraper.urls')),
     path('api/tickers/', include('tickers.urls')),
     path('api/signals/', include('signals.urls')),
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import functools
+import ipaddress
+
+import redis
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseForbidden, JsonResponse
+from django.views.decorators.http import require_GET
+
+from stocknlp.metrics import CONTENT_TYPE, registry
+from stocknlp.tracing import stage_summary
+
+
+@functools.lru_cache(maxsize=1)
+def _internal_networks(networks: tuple[str, ...]) -> list:
+    return [ipaddress.ip_network(net, strict=False) for net in networks]
+
+
+def internal_only(view):
+    """Answer only clients in INTERNAL_NETWORKS that did not come through a proxy."""
+    @functools.wraps(view)
+    def wrapper(request, *args, **kwargs):
+        try:
+            client = ipaddress.ip_address(request.META.get('REMOTE_ADDR', ''))
+        except ValueError:
+            client = None
+        if (
+            client is None
+            or 'HTTP_X_FORWARDED_FOR' in request.META
+            or not any(client in net for net in _internal_networks(tuple(settings.INTERNAL_NETWORKS)))
+        ):
+            return HttpResponseForbidden('Forbidden\n', content_type='text/plain')
+        return view(request, *args, **kwargs)
+    return wrapper
+
+
+@require_GET
+@internal_only
+def metrics_view(request):
+    """Prometheus scrape endpoint: queue depths and the counters every process has flushed."""
+    try:
+        body = registry.render()
+    except redis.RedisError as e:
+        return HttpResponse(f'Redis unavailable: {e}\n', status=503, content_type='text/plain')
+    return HttpResponse(body, content_type=CONTENT_TYPE)
+
+
+@require_GET
+@internal_only
+def trace_summary_view(request):
+    """Percentiles of queue wait and per-stage time for traces finished in the last ``?minutes=`` (default 15)."""
+    try:
+        minutes = float(request.GET.get('minutes', 15))
+    except ValueError:
+        return JsonResponse({'error': 'minutes must be a number.'}, status=400)
+    if not 0 < minutes <= settings.TRACE_RETENTION_MINUTES:
+        return JsonResponse(
+            {'error': f'minutes must be in (0, {settings.TRACE_RETENTION_MINUTES}].'}, status=400,
+        )
+    try:
+        return JsonResponse(stage_summary(minutes))
+    except redis.RedisError as e:
+        return JsonResponse({'error': f'Redis unavailable: {e}'}, status=503)
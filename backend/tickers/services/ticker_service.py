@@ -9,6 +9,8 @@ from pandas import MultiIndex
 from django.conf import settings
 from rest_framework.exceptions import ValidationError, NotFound
 
+from stocknlp.metrics import CACHE_REQUESTS
+
 from ..models import Ticker
 
 logger = logging.getLogger(__name__)
@@ -71,6 +73,7 @@ class TickerService:
 
         cache_key = f"stock:{'_'.join(sorted(symbols))}:{start_date}:{end_date}"
         cached = cache.get(cache_key)
+        CACHE_REQUESTS.inc(cache='stock_data', result='miss' if cached is None else 'hit')
         if cached is not None:
             logger.debug("Cache HIT: %s", cache_key)
             return cached